@@ -14,13 +14,31 @@ import argparse
 import asyncio
 import json
 import logging
+import math
 import os
 import random
 import sys
+import threading
 import time
+from array import array
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    _AWS_ERRORS: Tuple[type, ...] = (BotoCoreError, ClientError)
+except ImportError:
+    # boto3 is imported lazily; without it there are no AWS errors to catch
+    _AWS_ERRORS = ()
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +47,101 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """Serialize like orjson.dumps: compact separators, raw UTF-8 output."""
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# JSON codec used on the per-message hot path. Both accept str or bytes and
+# serialize to the same UTF-8 bytes, so JSONL output does not depend on
+# whether orjson is installed.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+def _encode(record: Any) -> bytes:
+    """Return a record as JSON bytes, passing pre-encoded bytes through."""
+    return record if isinstance(record, bytes) else _json_dumps(record)
+
+
+def _to_jsonl(records: Iterable[Any]) -> bytes:
+    """Serialize records into a single JSONL buffer so it takes one write()."""
+    encode = _encode
+    lines = [encode(record) for record in records]
+    return b'\n'.join(lines) + b'\n' if lines else b''
+
+
+def _fast_extract(
+    message_body: Union[str, bytes],
+) -> Tuple[Dict[str, Any], Optional[float], int]:
+    """Decode a message once and pull out the fields the processor needs.
+
+    Returns:
+        Tuple of (decoded event, timestamp or None, CellNVoltage key count).
+
+    Raises:
+        ValueError: If the body is not valid JSON or not a JSON object.
+    """
+    data = _json_loads(message_body)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    return data, data.get('timestamp'), _shape_cells(tuple(data))
+
+
+@lru_cache(maxsize=64)
+def _shape_cells(shape: Tuple[str, ...]) -> int:
+    """Count CellNVoltage keys in a message shape (its ordered key tuple).
+
+    Producers emit the same keys in the same order for every event, so after
+    the first message the count is a cache lookup rather than a key scan.
+    """
+    return sum(1 for k in shape if k.startswith('Cell') and k.endswith('Voltage'))
+
+
+def _voltage_stats(voltages: List[int]) -> Tuple[int, int, int]:
+    """Return (min, max, rounded mean) of one event's voltages in one pass.
+
+    At pack sizes (4-16 cells) a single Python loop outruns separate
+    min()/max()/sum() calls, whose per-call overhead dominates.
+    """
+    low = high = voltages[0]
+    total = 0
+    for voltage in voltages:
+        total += voltage
+        if voltage < low:
+            low = voltage
+        elif voltage > high:
+            high = voltage
+    return low, high, round(total / len(voltages))
+
+
+@lru_cache(maxsize=8)
+def _sqs_client(aws_region: str) -> Any:
+    """Return a shared SQS client for the region.
+
+    Client construction loads and parses the service model, so one client
+    (which is thread-safe) is built per region and reused by every caller.
+    TCP keep-alive stops idle pooled connections from being dropped between
+    consumer batches, which would otherwise cost a fresh TLS handshake.
+    """
+    import boto3  # type: ignore
+    from botocore.config import Config
+
+    return boto3.client(
+        "sqs",
+        region_name=aws_region,
+        config=Config(
+            max_pool_connections=32,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
+
+
 class QueueMonitor:
     """Monitor SQS queue status and metrics."""
 
@@ -45,9 +158,7 @@ class QueueMonitor:
     def get_queue_depth(self) -> Dict[str, int]:
         """Get current queue message counts."""
         try:
-            import boto3  # type: ignore
-
-            sqs = boto3.client("sqs", region_name=self.aws_region)
+            sqs = _sqs_client(self.aws_region)
 
             response = sqs.get_queue_attributes(
                 QueueUrl=self.queue_url,
@@ -66,7 +177,7 @@ class QueueMonitor:
                 'in_flight': in_flight,
                 'total': available + in_flight,
             }
-        except (ImportError, AttributeError, KeyError, ValueError) as e:
+        except (ImportError, AttributeError, KeyError, ValueError) + _AWS_ERRORS as e:
             logger.error("Failed to get queue depth: %s", e)
             return {'available': 0, 'in_flight': 0, 'total': 0}
 
@@ -89,50 +200,109 @@ class EventGenerator:
         self.voltage_range = (3400, 4150)
         self.offset_range = (-40, 40)
 
-    def generate_events(self, num_events: int) -> List[Dict[str, Any]]:
-        """Generate battery cell telemetry events."""
+    def generate_events(
+        self, num_events: int, as_bytes: bool = False
+    ) -> Union[List[Dict[str, Any]], List[bytes]]:
+        """Generate battery cell telemetry events.
+
+        With ``as_bytes=True`` each event is returned already JSON-encoded, so
+        saving and publishing the batch does not serialize it a second time.
+        """
         logger.info("Generating %d telemetry events", num_events)
 
-        # Generate module offsets
+        randint = random.randint
+        voltage_low, voltage_high = self.voltage_range
+
+        # Generate module offsets (fixed for the whole batch)
         module_offsets = [
-            random.randint(*self.offset_range) for _ in range(self.num_modules)
+            randint(*self.offset_range) for _ in range(self.num_modules)
+        ]
+        float_offsets = [float(offset) for offset in module_offsets]
+        cell_keys = [f"Cell{i + 1}Voltage" for i in range(self.num_modules)]
+
+        # Draw every event's module voltages in a single choices() call (event
+        # by event, module by module) rather than one randint() per cell, then
+        # cut the flat draw into rows; zip takes an offset before each draw so
+        # no value is consumed past a row's end
+        draws = iter(
+            random.choices(
+                range(voltage_low, voltage_high + 1), k=num_events * self.num_modules
+            )
+        )
+        voltage_rows = [
+            [voltage + offset for offset, voltage in zip(module_offsets, draws)]
+            for _ in range(num_events)
         ]
 
-        events = []
-        for _ in range(num_events):
-            # Generate voltages for each module
-            module_voltages = []
-            for idx in range(self.num_modules):
-                base_voltage = random.randint(*self.voltage_range)
-                noisy_voltage = base_voltage + module_offsets[idx]
-                module_voltages.append(noisy_voltage)
+        if as_bytes:
+            return self._encode_rows(voltage_rows, cell_keys, float_offsets)
 
+        events: List[Any] = []
+        for module_voltages in voltage_rows:
             # Create event with timestamp for E2E latency tracking
+            now = time.time()
             event: Dict[str, Any] = {
-                'timestamp': time.time(),  # For E2E latency measurement
-                'epoch_timestamp': int(time.time() * 1000),  # Milliseconds
+                'timestamp': now,  # For E2E latency measurement
+                'epoch_timestamp': int(now * 1000),  # Milliseconds
             }
 
             # Add cell voltages
-            for i, voltage in enumerate(module_voltages):
-                event[f"Cell{i + 1}Voltage"] = voltage
+            event.update(zip(cell_keys, module_voltages))
 
             # Add summary statistics
-            event.update(
-                {
-                    "min_voltage": min(module_voltages),
-                    "max_voltage": max(module_voltages),
-                    "avg_voltage": round(sum(module_voltages) / self.num_modules),
-                    "module_offsets": [float(offset) for offset in module_offsets],
-                }
-            )
+            (
+                event["min_voltage"],
+                event["max_voltage"],
+                event["avg_voltage"],
+            ) = _voltage_stats(module_voltages)
+            event["module_offsets"] = list(float_offsets)
 
             events.append(event)
 
         return events
 
+    def _encode_rows(
+        self,
+        voltage_rows: List[List[int]],
+        cell_keys: List[str],
+        float_offsets: List[float],
+    ) -> List[bytes]:
+        """Encode voltage rows straight to compact JSON through one template.
+
+        The key layout is fixed for the batch, so it is rendered once into a
+        %-format string and each event only fills in its numbers; no dict is
+        built and no encoder walks the keys. Floats go through %r, which is
+        the same shortest repr the JSON encoders emit.
+        """
+        template = (
+            '{"timestamp":%r,"epoch_timestamp":%d,'
+            + ''.join(f'"{key}":%d,' for key in cell_keys)
+            + '"min_voltage":%d,"max_voltage":%d,"avg_voltage":%d,'
+            + '"module_offsets":['
+            + ','.join(map(repr, float_offsets))
+            + ']}'
+        )
+        events: List[bytes] = []
+        for module_voltages in voltage_rows:
+            now = time.time()
+            events.append(
+                (
+                    template
+                    % (
+                        now,
+                        int(now * 1000),
+                        *module_voltages,
+                        *_voltage_stats(module_voltages),
+                    )
+                ).encode()
+            )
+
+        return events
+
     def save_events_to_file(
-        self, events: List[Dict[str, Any]], file_path: Optional[str] = None
+        self,
+        events: List[Union[Dict[str, Any], bytes]],
+        file_path: Optional[str] = None,
     ):
         """Save generated events to JSONL file for analysis."""
         if file_path is None:
@@ -142,46 +312,40 @@ class EventGenerator:
             file_path = str(data_dir / "sample_events_mvp.jsonl")
 
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
-                for event in events:
-                    f.write(json.dumps(event) + '\n')
+            with open(file_path, 'ab') as f:
+                f.write(_to_jsonl(events))
             logger.info("Saved %d events to %s", len(events), file_path)
         except (IOError, OSError) as e:
             logger.error("Failed to save events to file: %s", e)
 
     def publish_to_sqs(
-        self, events: List[Dict[str, Any]], queue_url: str
+        self,
+        events: List[Union[Dict[str, Any], bytes]],
+        queue_url: str,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
-        """Publish events to SQS with batch processing."""
-        try:
-            import boto3
+        """Publish events to SQS with batch processing.
 
-            sqs = boto3.client("sqs", region_name=os.getenv("AWS_REGION", "us-east-1"))
-
-            successes = 0
-            failures = 0
+        Batches of 10 (the SQS limit) are sent concurrently over the shared,
+        thread-safe SQS client for the region.
+        """
+        try:
+            sqs = _sqs_client(os.getenv("AWS_REGION", "us-east-1"))
 
             # Batch publish in groups of 10 (SQS limit)
             batch_size = 10
-            for i in range(0, len(events), batch_size):
-                batch = events[i : i + batch_size]
+            batches = [
+                events[i : i + batch_size] for i in range(0, len(events), batch_size)
+            ]
 
-                # Prepare batch entries
-                entries = []
-                for idx, event in enumerate(batch):
-                    entries.append({'Id': str(idx), 'MessageBody': json.dumps(event)})
-
-                try:
-                    response = sqs.send_message_batch(
-                        QueueUrl=queue_url, Entries=entries
-                    )
-
-                    successes += len(response.get('Successful', []))
-                    failures += len(response.get('Failed', []))
-
-                except (ImportError, AttributeError, KeyError, ValueError) as e:
-                    logger.error("Batch publish failed: %s", e)
-                    failures += len(batch)
+            successes = 0
+            failures = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for sent, failed in executor.map(
+                    partial(self._publish_batch, sqs, queue_url), batches
+                ):
+                    successes += sent
+                    failures += failed
 
             return {
                 'events_published': successes,
@@ -189,7 +353,7 @@ class EventGenerator:
                 'total_events': len(events),
             }
 
-        except (ImportError, AttributeError, KeyError, ValueError) as e:
+        except (ImportError, AttributeError, KeyError, ValueError) + _AWS_ERRORS as e:
             logger.error("Failed to publish to SQS: %s", e)
             return {
                 'events_published': 0,
@@ -198,56 +362,100 @@ class EventGenerator:
                 'error': str(e),
             }
 
+    @staticmethod
+    def _publish_batch(
+        sqs: Any, queue_url: str, batch: List[Union[Dict[str, Any], bytes]]
+    ) -> Tuple[int, int]:
+        """Send one batch of up to 10 events; return (successes, failures)."""
+        entries = [
+            {'Id': str(idx), 'MessageBody': _encode(event).decode()}
+            for idx, event in enumerate(batch)
+        ]
+
+        try:
+            response = sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+            return len(response.get('Successful', [])), len(response.get('Failed', []))
+        except (ImportError, AttributeError, KeyError, ValueError) + _AWS_ERRORS as e:
+            logger.error("Batch publish failed: %s", e)
+            return 0, len(batch)
+
 
 class MessageProcessor:
     """Process telemetry messages with latency tracking."""
 
-    def __init__(self):
-        """Initialize MessageProcessor with tracking metrics."""
+    def __init__(self, sample_capacity: int = 10_000):
+        """Initialize MessageProcessor with tracking metrics.
+
+        Args:
+            sample_capacity: Number of most recent processing times kept for
+                the p99 estimate (default: 10,000). Averages, totals and
+                min/max are running aggregates over every message.
+        """
         self.processed_count = 0
-        self.processing_times = []
-        self.e2e_latencies = []  # Track E2E latencies
+        self.total_processing_time = 0.0
 
-    def process_message(self, message_body: str) -> Dict[str, Any]:
+        # Ring buffer of raw C doubles: grows to sample_capacity, then the
+        # oldest sample is overwritten in place
+        self.sample_capacity = sample_capacity
+        self.processing_times = array('d')
+        self._next_sample = 0
+
+        # Running E2E latency aggregates
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.latency_min = math.inf
+        self.latency_max = -math.inf
+
+        # process_message runs on ConcurrentConsumer's worker threads, so
+        # every read-modify-write of the counters above holds this lock
+        self._stats_lock = threading.Lock()
+
+    def process_message(self, message_body: Union[str, bytes]) -> Dict[str, Any]:
         """Process a single telemetry message."""
         start_time = time.time()
 
         try:
             # Parse message
-            data = json.loads(message_body)
+            data, timestamp, cell_count = _fast_extract(message_body)
 
             # Calculate E2E latency if timestamp exists
             e2e_latency = None
-            if 'timestamp' in data:
-                e2e_latency = start_time - data['timestamp']
+            if timestamp is not None:
+                e2e_latency = start_time - timestamp
+
+            processing_time = time.time() - start_time
+
+            with self._stats_lock:
+                message_id = self.processed_count
+                self.processed_count += 1
+                self.total_processing_time += processing_time
+                self._record_processing_time(processing_time)
+
+                # Track E2E latency if available
+                if e2e_latency is not None:
+                    self.latency_count += 1
+                    self.latency_total += e2e_latency
+                    self.latency_min = min(self.latency_min, e2e_latency)
+                    self.latency_max = max(self.latency_max, e2e_latency)
 
             # Simple processing (could be extended)
             processed_data = {
-                'message_id': self.processed_count,
-                'processing_time': time.time() - start_time,
+                'message_id': message_id,
+                'processing_time': processing_time,
                 'e2e_latency': e2e_latency,
-                'cell_count': len(
-                    [k for k in data.keys() if 'Cell' in k and 'Voltage' in k]
-                ),
+                'cell_count': cell_count,
                 'avg_voltage': data.get('avg_voltage', 0),
                 'processing_timestamp': time.time(),
                 'original_data': data,  # Include original event data
             }
 
-            self.processed_count += 1
-            self.processing_times.append(processed_data['processing_time'])
-
-            # Track E2E latency if available
-            if e2e_latency is not None:
-                self.e2e_latencies.append(e2e_latency)
-
             # Log latency for visibility
             if e2e_latency is not None:
                 logger.info(
                     "Message %d: E2E latency=%.3fs, Processing=%.3fs",
-                    self.processed_count,
+                    message_id + 1,
                     e2e_latency,
-                    processed_data['processing_time'],
+                    processing_time,
                 )
 
             return {'status': 'success', 'processed_data': processed_data}
@@ -256,27 +464,48 @@ class MessageProcessor:
             logger.error("Message processing failed: %s", e)
             return {'status': 'error', 'error': str(e)}
 
+    def _record_processing_time(self, processing_time: float) -> None:
+        """Store a processing time in the fixed-size sample ring buffer.
+
+        Callers must hold _stats_lock.
+        """
+        if len(self.processing_times) < self.sample_capacity:
+            self.processing_times.append(processing_time)
+        else:
+            self.processing_times[self._next_sample] = processing_time
+        self._next_sample = (self._next_sample + 1) % self.sample_capacity
+
     def get_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
-        stats = {
+        with self._stats_lock:
+            return self._build_stats()
+
+    def _build_stats(self) -> Dict[str, Any]:
+        """Build the statistics dict; callers must hold _stats_lock."""
+        stats: Dict[str, Any] = {
             'messages_processed': self.processed_count,
             'avg_processing_time': (
-                sum(self.processing_times) / len(self.processing_times)
-                if self.processing_times
+                self.total_processing_time / self.processed_count
+                if self.processed_count
                 else 0
             ),
-            'total_processing_time': sum(self.processing_times),
+            'total_processing_time': self.total_processing_time,
         }
 
+        if self.processing_times:
+            # Nearest-rank p99 over the retained sample window
+            ordered = sorted(self.processing_times)
+            rank = max(math.ceil(0.99 * len(ordered)) - 1, 0)
+            stats['p99_processing_time'] = ordered[rank]
+
         # Add E2E latency stats if available
-        if self.e2e_latencies:
+        if self.latency_count:
             stats.update(
                 {
-                    'messages_with_latency': len(self.e2e_latencies),
-                    'avg_e2e_latency': sum(self.e2e_latencies)
-                    / len(self.e2e_latencies),
-                    'min_e2e_latency': min(self.e2e_latencies),
-                    'max_e2e_latency': max(self.e2e_latencies),
+                    'messages_with_latency': self.latency_count,
+                    'avg_e2e_latency': self.latency_total / self.latency_count,
+                    'min_e2e_latency': self.latency_min,
+                    'max_e2e_latency': self.latency_max,
                 }
             )
 
@@ -297,19 +526,23 @@ class MessageProcessor:
             file_path = str(metrics_dir / f"latency-{today}.jsonl")
 
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
-                for message in processed_messages:
-                    # Create metrics record
-                    metrics_record = {
-                        'timestamp': message.get('processing_timestamp', time.time()),
-                        'message_id': message.get('message_id'),
-                        'e2e_latency_seconds': message.get('e2e_latency'),
-                        'processing_time_seconds': message.get('processing_time'),
-                        'cell_count': message.get('cell_count'),
-                        'avg_voltage': message.get('avg_voltage'),
-                        'original_event': message.get('original_data', {}),
-                    }
-                    f.write(json.dumps(metrics_record) + '\n')
+            # Create metrics records
+            metrics_records = (
+                {
+                    'timestamp': message.get('processing_timestamp', time.time()),
+                    'message_id': message.get('message_id'),
+                    'e2e_latency_seconds': message.get('e2e_latency'),
+                    'processing_time_seconds': message.get('processing_time'),
+                    'cell_count': message.get('cell_count'),
+                    'avg_voltage': message.get('avg_voltage'),
+                    'original_event': message.get('original_data', {}),
+                }
+                for message in processed_messages
+            )
+            payload = _to_jsonl(metrics_records)
+
+            with open(file_path, 'ab') as f:
+                f.write(payload)
 
             logger.info(
                 "Saved %d processing metrics to %s", len(processed_messages), file_path
@@ -322,7 +555,12 @@ class ConcurrentConsumer:
     """Concurrent SQS consumer using ThreadPoolExecutor."""
 
     def __init__(
-        self, queue_url: str, aws_region: str = "us-east-1", max_workers: int = 4
+        self,
+        queue_url: str,
+        aws_region: str = "us-east-1",
+        max_workers: int = 4,
+        receivers: int = 1,
+        wait_time_seconds: int = 0,
     ):
         """Initialize ConcurrentConsumer with SQS configuration.
 
@@ -330,33 +568,63 @@ class ConcurrentConsumer:
             queue_url: SQS queue URL to consume from.
             aws_region: AWS region for SQS client (default: us-east-1).
             max_workers: Maximum number of worker threads (default: 4).
+            receivers: Concurrent receive_message polls per batch; above 1 they
+                run on a receive pool kept for the consumer's life (default: 1).
+            wait_time_seconds: SQS long-poll wait per receive; 0 returns
+                immediately so an empty queue is detected quickly (default: 0).
         """
         self.queue_url = queue_url
         self.aws_region = aws_region
         self.max_workers = max_workers
+        self.receivers = receivers
+        self.wait_time_seconds = wait_time_seconds
         self.processor = MessageProcessor()
 
-        # Initialize SQS client
-        import boto3
+        # Shared SQS client for the region
+        self.sqs = _sqs_client(aws_region)
 
-        self.sqs = boto3.client("sqs", region_name=aws_region)
+        # Built once so batches do not pay thread start-up on every poll
+        self._receive_pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=receivers) if receivers > 1 else None
+        )
 
-    def _receive_messages(self) -> List[Dict[str, Any]]:
-        """Receive messages from SQS queue."""
+    def close(self) -> None:
+        """Shut down the receive pool, if any; the consumer is unusable after."""
+        if self._receive_pool is not None:
+            self._receive_pool.shutdown(wait=True)
+            self._receive_pool = None
+
+    def _poll_queue(self) -> List[Dict[str, Any]]:
+        """Run one receive_message call and return the messages it got."""
         response = self.sqs.receive_message(
             QueueUrl=self.queue_url,
             MaxNumberOfMessages=10,
-            WaitTimeSeconds=0,  # No wait for immediate processing
+            WaitTimeSeconds=self.wait_time_seconds,
             MessageAttributeNames=['All'],
         )
         return response.get('Messages', [])
 
+    def _receive_messages(self) -> List[Dict[str, Any]]:
+        """Receive messages from SQS queue using concurrent polls."""
+        if self._receive_pool is None:
+            return self._poll_queue()
+
+        polls = [
+            self._receive_pool.submit(self._poll_queue) for _ in range(self.receivers)
+        ]
+        # Nothing outlives the batch: if a poll fails, whatever its siblings
+        # received is dropped and redelivered once the visibility timeout ends
+        messages: List[Dict[str, Any]] = []
+        for poll in polls:
+            messages.extend(poll.result())
+        return messages
+
     def _process_messages_concurrently(
         self, messages: List[Dict[str, Any]]
     ) -> tuple[List[Dict[str, Any]], int]:
         """Process messages concurrently and return processed data and delete count."""
         processed_messages = []
-        successful_deletes = 0
+        receipt_handles = []
 
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit processing tasks
@@ -365,7 +633,7 @@ class ConcurrentConsumer:
                 for msg in messages
             }
 
-            # Collect results and delete successfully processed messages
+            # Collect results and queue successfully processed messages for deletion
             for future in processing_futures:
                 message = processing_futures[future]
                 try:
@@ -375,15 +643,16 @@ class ConcurrentConsumer:
                         # Collect processed message data for metrics
                         processed_messages.append(result.get('processed_data', {}))
 
-                        # Delete message from queue
-                        if self._delete_message(message['ReceiptHandle']):
-                            successful_deletes += 1
+                        receipt_handles.append(message['ReceiptHandle'])
 
                 except (
                     TimeoutError, RuntimeError, ValueError, TypeError, KeyError
                 ) as e:
                     logger.error("Message processing failed: %s", e)
 
+        # Delete processed messages from the queue in batches
+        successful_deletes = self._delete_messages_batch(receipt_handles)
+
         return processed_messages, successful_deletes
 
     def _delete_message(self, receipt_handle: str) -> bool:
@@ -394,10 +663,36 @@ class ConcurrentConsumer:
                 ReceiptHandle=receipt_handle,
             )
             return True
-        except (ImportError, AttributeError, KeyError, ValueError) as e:
+        except (ImportError, AttributeError, KeyError, ValueError) + _AWS_ERRORS as e:
             logger.error("Failed to delete message: %s", e)
             return False
 
+    def _delete_messages_batch(self, receipt_handles: List[str]) -> int:
+        """Delete messages in groups of 10 (SQS limit); return the number deleted."""
+        deleted = 0
+        for i in range(0, len(receipt_handles), 10):
+            group = receipt_handles[i : i + 10]
+            try:
+                response = self.sqs.delete_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[
+                        {'Id': str(idx), 'ReceiptHandle': handle}
+                        for idx, handle in enumerate(group)
+                    ],
+                )
+                deleted += len(response.get('Successful', []))
+                for failure in response.get('Failed', []):
+                    logger.error(
+                        "Failed to delete message %s: %s",
+                        failure.get('Id'),
+                        failure.get('Message'),
+                    )
+            except (
+                ImportError, AttributeError, KeyError, ValueError
+            ) + _AWS_ERRORS as e:
+                logger.error("Failed to delete message batch: %s", e)
+        return deleted
+
     def consume_batch(self) -> Dict[str, Any]:
         """Consume and process a batch of messages concurrently."""
         try:
@@ -428,7 +723,7 @@ class ConcurrentConsumer:
                 'messages_deleted': successful_deletes,
             }
 
-        except (ImportError, AttributeError, KeyError, ValueError) as e:
+        except (ImportError, AttributeError, KeyError, ValueError) + _AWS_ERRORS as e:
             logger.error("Batch consumption failed: %s", e)
             return {
                 'messages_received': 0,
@@ -437,6 +732,14 @@ class ConcurrentConsumer:
                 'error': str(e),
             }
 
+    async def consume_batch_async(self) -> Dict[str, Any]:
+        """Consume a batch without blocking the running event loop.
+
+        The blocking boto3 receive/delete calls and the thread-pool processing
+        run in a worker thread, so other coroutines keep running meanwhile.
+        """
+        return await asyncio.to_thread(self.consume_batch)
+
     def get_processor_stats(self) -> Dict[str, Any]:
         """Get processor statistics."""
         return self.processor.get_stats()
@@ -631,7 +934,7 @@ class E2ETelemetryOrchestrator:
 
         while time.time() - start_time < max_duration:
             # Try to consume messages
-            batch_results = self.consumer.consume_batch()
+            batch_results = await self.consumer.consume_batch_async()
             total_batches += 1
 
             if batch_results['messages_processed'] > 0:
@@ -733,7 +1036,7 @@ class E2ETelemetryOrchestrator:
 
         while time.time() - start_time < max_duration:
             # Try to consume messages
-            batch_results = self.consumer.consume_batch()
+            batch_results = await self.consumer.consume_batch_async()
             total_batches += 1
 
             if batch_results['messages_processed'] > 0:
@@ -770,8 +1073,8 @@ class E2ETelemetryOrchestrator:
         try:
             start_time = time.time()
 
-            # Generate events
-            events = self.event_generator.generate_events(num_events)
+            # Generate events pre-encoded; they are only saved and published
+            events = self.event_generator.generate_events(num_events, as_bytes=True)
 
             # Save events to JSONL file for analysis
             self.event_generator.save_events_to_file(events)
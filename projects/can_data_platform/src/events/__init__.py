@@ -1,6 +1,12 @@
 """Event generation module for battery cell telemetry."""
 
 from .generator import EventGenerator, EventGeneratorFactory
-from .models import TelemetryEvent, BatteryModule
+from .models import TelemetryEvent, BatteryModule, PackedModules
 
-__all__ = ["EventGenerator", "EventGeneratorFactory", "TelemetryEvent", "BatteryModule"]
+__all__ = [
+    "EventGenerator",
+    "EventGeneratorFactory",
+    "TelemetryEvent",
+    "BatteryModule",
+    "PackedModules",
+]
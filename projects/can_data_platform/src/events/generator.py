@@ -1,10 +1,33 @@
 """Event generator for battery cell telemetry."""
 
 import random
+import time
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from array import array
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+from uuid import uuid4
 
-from .models import BatteryModule, TelemetryEvent
+from .models import BatteryModule, PackedModules, TelemetryEvent
+
+# Events drawn per _generate_batch call, bounding the temporary list size
+_BATCH_TILE = 256
+
+# Offset ranges inside these bounds are stored as int16 rather than int32
+_INT16_MIN, _INT16_MAX = -(2**15), 2**15 - 1
+
+
+@lru_cache(maxsize=32)
+def _offset_template(
+    num_modules: int, low: int, high: int, seed: int
+) -> Tuple[int, ...]:
+    """Return the module offsets drawn from ``random.Random(seed)``.
+
+    Generators built with the same shared seed and pack shape reuse one
+    draw instead of repeating it per instance.
+    """
+    rand = random.Random(seed)
+    return tuple(rand.randrange(low, high + 1) for _ in range(num_modules))
 
 
 class EventGeneratorInterface(ABC):
@@ -27,6 +50,8 @@ class BatteryEventGenerator(EventGeneratorInterface):
         num_modules: int = 4,
         voltage_range: Tuple[int, int] = (3400, 4150),
         offset_range: Tuple[int, int] = (-40, 40),
+        seed: Optional[int] = None,
+        shared_seed: Optional[int] = None,
     ):
         """Initialize the battery event generator.
 
@@ -34,15 +59,33 @@ class BatteryEventGenerator(EventGeneratorInterface):
             num_modules: Number of battery modules/cells
             voltage_range: Min/max base voltage range in mV
             offset_range: Module offset variance range in mV
+            seed: Seed for this generator's RNG; when omitted it is drawn from
+                the global random module, so random.seed() still reproduces runs
+            shared_seed: When set, module offsets come from a cached template
+                for this seed, so generators sharing it share their offsets
         """
         self.num_modules = num_modules
         self.voltage_range = voltage_range
         self.offset_range = offset_range
 
-        # Pre-generate module offsets for consistency
-        self.module_offsets = [
-            random.randint(*offset_range) for _ in range(num_modules)
-        ]
+        # Range bounds unpacked once for the per-module draws
+        self._v_lo, self._v_hi = voltage_range
+        self._o_lo, self._o_hi = offset_range
+
+        # Private RNG so draws are direct randrange calls on one instance
+        self._rand = random.Random(random.getrandbits(64) if seed is None else seed)
+
+        # Pre-generate module offsets for consistency, packed as C ints
+        # (int16 when the offset range fits, which covers realistic packs)
+        typecode = "h" if _INT16_MIN <= self._o_lo and self._o_hi <= _INT16_MAX else "i"
+        if shared_seed is None:
+            randrange = self._rand.randrange
+            offsets = [
+                randrange(self._o_lo, self._o_hi + 1) for _ in range(num_modules)
+            ]
+        else:
+            offsets = _offset_template(num_modules, self._o_lo, self._o_hi, shared_seed)
+        self.module_offsets = array(typecode, offsets)
 
     def generate_events(self, num_events: int) -> List[TelemetryEvent]:
         """Generate battery telemetry events with realistic voltage variations.
@@ -53,29 +96,72 @@ class BatteryEventGenerator(EventGeneratorInterface):
         Returns:
             List of TelemetryEvent objects
         """
-        events = []
+        return list(self.generate_events_iter(num_events))
+
+    def generate_events_iter(self, num_events: int) -> Iterator[TelemetryEvent]:
+        """Yield battery telemetry events one at a time.
 
-        for sequence_num in range(num_events):
-            modules = self._generate_modules()
-            event = TelemetryEvent.create_new(sequence_num, modules)
-            events.append(event)
+        Same events as generate_events, but a consumer that writes each one as
+        it arrives never holds more than a single tile of voltages in memory.
 
-        return events
+        Args:
+            num_events: Number of events to generate
+
+        Yields:
+            TelemetryEvent objects in sequence order
+        """
+        time_ns = time.time_ns
+        new_event_id = uuid4
+
+        # Snapshot so later edits to the generator cannot rewrite these events
+        module_offsets = tuple(self.module_offsets)
+
+        for sequence_num, bases in enumerate(self._iter_base_voltages(num_events)):
+            # One clock read per event: the epoch timestamp is derived from it
+            generation_time = time_ns()
+            yield TelemetryEvent(
+                event_id=str(new_event_id()),
+                sequence_number=sequence_num,
+                epoch_timestamp=generation_time / 1e9,
+                generation_time=generation_time,
+                # Module objects are only built if a caller indexes them
+                modules=PackedModules(bases, module_offsets),
+            )
 
     def _generate_modules(self) -> List[BatteryModule]:
         """Generate battery modules with voltage variations."""
-        modules = []
+        return self._generate_batch(1)[0]
 
-        for module_id in range(self.num_modules):
-            base_voltage = random.randint(*self.voltage_range)
-            offset = self.module_offsets[module_id]
-
-            module = BatteryModule(
-                module_id=module_id, base_voltage=base_voltage, offset=offset
+    def _iter_base_voltages(self, num_events: int) -> Iterator[List[int]]:
+        """Yield each event's base voltages, drawn in tiles of _BATCH_TILE."""
+        for start in range(0, num_events, _BATCH_TILE):
+            yield from self._draw_base_voltages(
+                min(_BATCH_TILE, num_events - start)
             )
-            modules.append(module)
 
-        return modules
+    def _draw_base_voltages(self, num_events: int) -> List[List[int]]:
+        """Draw per-module base voltages for a batch of events.
+
+        Draws happen in the same order as per-event generation (event by
+        event, module by module), so seeded runs are unchanged.
+        """
+        randrange = self._rand.randrange
+        low, stop = self._v_lo, self._v_hi + 1
+        modules = range(self.num_modules)
+
+        return [[randrange(low, stop) for _ in modules] for _ in range(num_events)]
+
+    def _generate_batch(self, num_events: int) -> List[List[BatteryModule]]:
+        """Generate the module lists for a whole batch of events at once."""
+        module_offsets = list(enumerate(self.module_offsets))
+
+        return [
+            [
+                BatteryModule(module_id=module_id, base_voltage=base, offset=offset)
+                for (module_id, offset), base in zip(module_offsets, bases)
+            ]
+            for bases in self._draw_base_voltages(num_events)
+        ]
 
 
 # Factory pattern for creating generators
@@ -84,7 +170,11 @@ class EventGeneratorFactory:
 
     @staticmethod
     def create_battery_generator(**kwargs) -> BatteryEventGenerator:
-        """Create a battery event generator with optional parameters."""
+        """Create a battery event generator with optional parameters.
+
+        Pass ``shared_seed`` to give every generator of the same pack shape
+        identical, cached module offsets.
+        """
         return BatteryEventGenerator(**kwargs)
 
 
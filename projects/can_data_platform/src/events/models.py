@@ -1,25 +1,128 @@
 """Data models for telemetry events."""
 
+import struct
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from uuid import uuid4
 
+_get_voltage = attrgetter("voltage")
+_get_offset = attrgetter("offset")
+
+
+@lru_cache(maxsize=16)
+def _cell_keys(num_modules: int) -> Tuple[str, ...]:
+    """Return the CellNVoltage field names for a pack of num_modules."""
+    return tuple(f"Cell{i}Voltage" for i in range(1, num_modules + 1))
+
+
+@lru_cache(maxsize=16)
+def _event_struct(num_modules: int) -> struct.Struct:
+    """Return the compiled binary layout for an event with num_modules cells.
+
+    Little-endian: int64 generation_time, uint32 sequence_number, then one
+    int32 voltage per module.
+    """
+    return struct.Struct(f"<qI{num_modules}i")
+
+
+def _voltage_stats(voltages: List[int]) -> Tuple[int, int, int]:
+    """Return (min, max, sum) of the voltages in a single pass.
+
+    For pack-sized lists one Python loop beats three builtin calls, whose
+    per-call overhead dominates at a handful of elements.
+    """
+    low = high = voltages[0]
+    total = 0
+    for voltage in voltages:
+        total += voltage
+        if voltage < low:
+            low = voltage
+        elif voltage > high:
+            high = voltage
+    return low, high, total
+
 
 @dataclass
 class BatteryModule:
     """Represents a single battery module with voltage characteristics."""
 
+    # Declared by hand (not slots=True) to keep Python 3.9 support
+    __slots__ = ("module_id", "base_voltage", "offset")
+
     module_id: int
     base_voltage: int
     offset: int
 
     @property
     def voltage(self) -> int:
-        """Calculate the actual voltage including offset."""
+        """Actual voltage including offset, clamped at zero."""
         return max(0, self.base_voltage + self.offset)
 
 
+class PackedModules(Sequence):
+    """Module sequence stored as raw base voltages and offsets.
+
+    BatteryModule objects are only built on first element access, so events
+    that go straight to to_dict() or to_bytes() never allocate them. Once
+    built, the modules are the source of truth, so edits to them show up in
+    serialized output.
+    """
+
+    __slots__ = ("base_voltages", "offsets", "_modules")
+
+    def __init__(self, base_voltages: Sequence, offsets: Sequence):
+        """Wrap per-module base voltages and their matching offsets."""
+        self.base_voltages = base_voltages
+        self.offsets = offsets
+        self._modules: Optional[List[BatteryModule]] = None
+
+    def voltages(self) -> List[int]:
+        """Return the clamped module voltages without building modules."""
+        if self._modules is not None:
+            return list(map(_get_voltage, self._modules))
+        return [
+            max(0, base + offset)
+            for base, offset in zip(self.base_voltages, self.offsets)
+        ]
+
+    def module_offsets(self) -> List[int]:
+        """Return the module offsets without building modules."""
+        if self._modules is not None:
+            return list(map(_get_offset, self._modules))
+        return list(self.offsets)
+
+    def _materialize(self) -> List[BatteryModule]:
+        if self._modules is None:
+            self._modules = [
+                BatteryModule(module_id=module_id, base_voltage=base, offset=offset)
+                for module_id, (base, offset) in enumerate(
+                    zip(self.base_voltages, self.offsets)
+                )
+            ]
+        return self._modules
+
+    def __len__(self) -> int:
+        return len(self.base_voltages)
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[BatteryModule]:
+        return iter(self._materialize())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self._materialize() == list(other)
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
 @dataclass
 class TelemetryEvent:
     """Represents a single telemetry event with battery data."""
@@ -28,7 +131,7 @@ class TelemetryEvent:
     sequence_number: int
     epoch_timestamp: float
     generation_time: int
-    modules: List[BatteryModule]
+    modules: Sequence[BatteryModule]
 
     @classmethod
     def create_new(
@@ -43,30 +146,48 @@ class TelemetryEvent:
             modules=modules,
         )
 
+    def _voltages(self) -> List[int]:
+        """Return module voltages, skipping module objects when packed."""
+        if isinstance(self.modules, PackedModules):
+            return self.modules.voltages()
+        return list(map(_get_voltage, self.modules))
+
+    def _offsets(self) -> List[int]:
+        """Return module offsets, skipping module objects when packed."""
+        if isinstance(self.modules, PackedModules):
+            return self.modules.module_offsets()
+        return list(map(_get_offset, self.modules))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the event to a dictionary for serialization."""
-        event_dict = {
+        # Resolve each module's voltage once; the cells and statistics share it
+        voltages = self._voltages()
+        min_voltage, max_voltage, total_voltage = _voltage_stats(voltages)
+
+        # Built as a single literal rather than a dict grown by update() calls
+        return {
             "event_id": self.event_id,
             "sequence_number": self.sequence_number,
             "epoch_timestamp": self.epoch_timestamp,
             "generation_time": self.generation_time,
+            # Dynamic cell voltage fields
+            **dict(zip(_cell_keys(len(voltages)), voltages)),
+            # Calculated statistics
+            "min_voltage": min_voltage,
+            "max_voltage": max_voltage,
+            # round() is half-to-even: a 3537.5 mean reports as 3538
+            "avg_voltage": round(total_voltage / len(voltages)),
+            "voltage_spread": max_voltage - min_voltage,
+            "module_offsets": self._offsets(),
+            "num_modules": len(self.modules),
         }
 
-        # Add dynamic cell voltage fields
-        for i, module in enumerate(self.modules, 1):
-            event_dict[f"Cell{i}Voltage"] = module.voltage
-
-        # Add calculated statistics
-        voltages = [module.voltage for module in self.modules]
-        event_dict.update(
-            {
-                "min_voltage": min(voltages),
-                "max_voltage": max(voltages),
-                "avg_voltage": round(sum(voltages) / len(voltages)),
-                "voltage_spread": max(voltages) - min(voltages),
-                "module_offsets": [module.offset for module in self.modules],
-                "num_modules": len(self.modules),
-            }
-        )
+    def to_bytes(self) -> bytes:
+        """Pack the numeric fields into a compact binary record.
 
-        return event_dict
+        Only generation_time, sequence_number and the cell voltages are
+        included; the layout is given by ``_event_struct(len(modules))``.
+        """
+        return _event_struct(len(self.modules)).pack(
+            self.generation_time, self.sequence_number, *self._voltages()
+        )
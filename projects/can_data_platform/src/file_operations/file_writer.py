@@ -3,12 +3,36 @@
 import json
 import logging
 import os
+import shutil
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Any, Mapping, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Default bytes spooled in memory before a streamed write is flushed
+_FLUSH_BYTES = 1 << 20
+
+# Linux can stage the temp file as an unnamed inode and link it in through
+# /proc once complete; 0 where either is unavailable
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0) if os.path.isdir("/proc/self/fd") else 0
+
+# Compact JSON encoder producing UTF-8 bytes for one event
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    _encode = json.JSONEncoder(separators=(',', ':')).encode
+
+    def _dumps(obj: Any) -> bytes:
+        return _encode(obj).encode('utf-8')
+
 
 class FileWriter(ABC):
     """Abstract base class for file writers."""
@@ -30,18 +54,32 @@ class JSONLFileWriter(FileWriter):
     Follows Single Responsibility Principle by focusing only on file writing.
     """
 
-    def write(self, events: List[Dict[str, Any]], output_path: str) -> None:
+    def __init__(self, durable: bool = False, spool_size: int = _FLUSH_BYTES):
+        """Initialize the writer.
+
+        Args:
+            durable: fsync the temp file before the rename and the directory
+                after it, so a completed write survives a power loss
+            spool_size: Bytes of encoded lines held in memory before they are
+                flushed to the temp file; writes below it reach the file in
+                one write() call
+        """
+        self.durable = durable
+        self.spool_size = spool_size
+
+    def write(self, events: Iterable[Dict[str, Any]], output_path: str) -> None:
         """Write events to JSONL file with atomic operation.
 
         Args:
-            events: List of event dictionaries
+            events: Event dictionaries; any iterable, including a generator,
+                which is consumed as the file is written
             output_path: Path to output JSONL file
 
         Raises:
             OSError: If file operations fail
             IOError: If file writing fails
         """
-        logger.info("Writing %d events to file: %s", len(events), output_path)
+        logger.info("Writing events to file: %s", output_path)
 
         # Ensure directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -50,28 +88,192 @@ class JSONLFileWriter(FileWriter):
         temp_path = f"{output_path}.tmp"
 
         try:
-            self._write_to_temp_file(events, temp_path)
-            self._atomic_move(temp_path, output_path)
+            written = self._write_unnamed_file(events, temp_path, output_path)
+            if written is None:
+                count = self._write_to_temp_file(events, temp_path)
+                linked_path = temp_path
+            else:
+                count, linked_path = written
+
+            if linked_path == temp_path:
+                self._atomic_move(temp_path, output_path)
+            elif self.durable:
+                self._fsync_directory(os.path.dirname(output_path) or ".")
 
-            logger.info("Successfully wrote %d events to %s", len(events), output_path)
+            logger.info("Successfully wrote %d events to %s", count, output_path)
 
         except (OSError, IOError) as e:
             logger.error("Failed to write events to file %s: %s", output_path, e)
             self._cleanup_temp_file(temp_path)
             raise
 
-    def _write_to_temp_file(self, events: List[Dict[str, Any]], temp_path: str) -> None:
-        """Write events to temporary file."""
-        with open(temp_path, "w", encoding="utf-8") as f:
-            for event in events:
-                json.dump(event, f, separators=(',', ':'))  # Compact JSON
-                f.write('\n')
+    def write_many(
+        self, shards: Mapping[str, List[Dict[str, Any]]], max_workers: int = 4
+    ) -> None:
+        """Write several JSONL shards with their I/O overlapped.
+
+        Each shard goes through the same atomic write as ``write``; running
+        them on a thread pool lets one shard's open/write/rename wait on the
+        device while others proceed.
+
+        Args:
+            shards: Mapping of output path to the events for that file
+            max_workers: Maximum number of shards written concurrently
+
+        Raises:
+            OSError: If any shard fails to write (after all shards finish)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.write, events, output_path)
+                for output_path, events in shards.items()
+            ]
+        for future in futures:
+            future.result()
+
+    def _write_to_temp_file(
+        self, events: Iterable[Dict[str, Any]], temp_path: str
+    ) -> int:
+        """Write events to temporary file and return how many were written."""
+        with open(temp_path, "wb") as f:
+            return self._write_lines(f, events)
+
+    def _write_unnamed_file(
+        self, events: Iterable[Dict[str, Any]], temp_path: str, output_path: str
+    ) -> Optional[Tuple[int, str]]:
+        """Write events to an unnamed file, then link it into the directory.
+
+        With O_TMPFILE the file has no directory entry until it is complete,
+        so a crash mid-write leaves nothing behind to clean up. A new output
+        is linked straight in at output_path, skipping the rename; an
+        existing one is replaced through temp_path as usual. If linking is
+        refused, the finished contents are copied out to temp_path instead.
+
+        Returns:
+            Number of events written and the path that was linked, or None
+            if O_TMPFILE is unsupported here and the caller should fall back
+            to a named temp file
+        """
+        if not _O_TMPFILE:
+            return None
+
+        dir_fd = os.open(
+            os.path.dirname(temp_path) or ".", os.O_RDONLY | os.O_DIRECTORY
+        )
+        try:
+            try:
+                fd = os.open(
+                    ".", _O_TMPFILE | os.O_RDWR | os.O_CLOEXEC, 0o666,
+                    dir_fd=dir_fd,
+                )
+            except OSError:
+                # The filesystem does not support O_TMPFILE
+                return None
+
+            try:
+                f = open(fd, "w+b")
+            except BaseException:
+                os.close(fd)
+                raise
+
+            with f:
+                count = self._write_lines(f, events)
+                f.flush()
+                try:
+                    linked_path = self._link_inode(
+                        fd, dir_fd, temp_path, output_path
+                    )
+                except OSError:
+                    # linkat() through /proc can be denied (no /proc access,
+                    # a seccomp filter); the events may have come from a
+                    # generator, so copy the written bytes rather than redo it
+                    self._copy_to_temp_file(f, temp_path)
+                    linked_path = temp_path
+        finally:
+            os.close(dir_fd)
+
+        return count, linked_path
+
+    @staticmethod
+    def _link_inode(fd: int, dir_fd: int, temp_path: str, output_path: str) -> str:
+        """Give the unnamed file behind fd a name; return the path linked."""
+        # dst_dir_fd makes os.link call linkat(), which follows the /proc
+        # symlink to the open inode
+        inode_path = f"/proc/self/fd/{fd}"
+        try:
+            # linkat() never overwrites, so this only lands on a new output
+            # and is already atomic there
+            os.link(inode_path, os.path.basename(output_path), dst_dir_fd=dir_fd)
+            return output_path
+        except FileExistsError:
+            pass
+
+        link_name = os.path.basename(temp_path)
+        try:
+            os.link(inode_path, link_name, dst_dir_fd=dir_fd)
+        except FileExistsError:
+            # Stale temp file left by an interrupted named write
+            os.remove(link_name, dir_fd=dir_fd)
+            os.link(inode_path, link_name, dst_dir_fd=dir_fd)
+        return temp_path
+
+    def _copy_to_temp_file(self, f: BinaryIO, temp_path: str) -> None:
+        """Copy an open, fully written file to temp_path."""
+        f.seek(0)
+        with open(temp_path, "wb") as out:
+            shutil.copyfileobj(f, out)
+            if self.durable:
+                out.flush()
+                os.fsync(out.fileno())
+
+    def _write_lines(self, f: BinaryIO, events: Iterable[Dict[str, Any]]) -> int:
+        """Write events as JSONL to an open binary file; return the count.
+
+        Lines are spooled in one growable buffer, which is written out only
+        when it passes spool_size, so a typical file is still a single write
+        while a long stream never holds more than about one buffer in memory.
+        """
+        count = 0
+        payload = bytearray()
+        # Bind the encoder, appender and threshold as locals for the loop
+        dumps = _dumps
+        append = payload.append
+        flush_bytes = self.spool_size
+        for event in events:
+            payload += dumps(event)
+            append(0x0A)
+            count += 1
+            if len(payload) >= flush_bytes:
+                f.write(payload)
+                payload.clear()
+
+        f.write(payload)
+        if self.durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+        return count
 
     def _atomic_move(self, temp_path: str, output_path: str) -> None:
-        """Atomically move temp file to final location."""
-        if os.path.exists(output_path):
-            os.remove(output_path)
-        os.rename(temp_path, output_path)
+        """Atomically move temp file to final location.
+
+        os.replace overwrites an existing target atomically on POSIX and
+        Windows alike, so the old file is never removed first.
+        """
+        os.replace(temp_path, output_path)
+        if self.durable:
+            self._fsync_directory(os.path.dirname(output_path) or ".")
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        """Persist a rename by syncing its directory entry (POSIX only)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def _cleanup_temp_file(self, temp_path: str) -> None:
         """Clean up temporary file if it exists."""
@@ -86,6 +288,8 @@ class FileWriterFactory:
     """Factory for creating file writers."""
 
     @staticmethod
-    def create_jsonl_writer() -> JSONLFileWriter:
+    def create_jsonl_writer(
+        durable: bool = False, spool_size: int = _FLUSH_BYTES
+    ) -> JSONLFileWriter:
         """Create a JSONL file writer."""
-        return JSONLFileWriter()
+        return JSONLFileWriter(durable=durable, spool_size=spool_size)
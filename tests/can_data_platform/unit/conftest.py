@@ -6,6 +6,7 @@ This module provides common fixtures and utilities for all test modules.
 import json
 import os
 import tempfile
+from unittest import mock
 
 import pytest
 
@@ -69,6 +70,34 @@ def temp_jsonl_file(
         os.unlink(tmp_file_path)
 
 
+@pytest.fixture
+def isolated_config_env(request, monkeypatch):
+    """Isolate a config test from the process environment and any .env file.
+
+    Each test using this fixture declares its inputs with the config_env
+    marker::
+
+        @pytest.mark.config_env(env_vars=("AWS_REGION",), load_dotenv="pkg.load_dotenv")
+
+    ``env_vars`` are unset and the ``load_dotenv`` named by its dotted path
+    becomes a no-op; monkeypatch undoes both after the test.
+
+    Args:
+        request: pytest request, used to read the config_env marker.
+        monkeypatch: pytest monkeypatch fixture.
+    """
+    marker = request.node.get_closest_marker("config_env")
+    if marker is None:
+        pytest.fail(
+            f"{request.node.nodeid} uses isolated_config_env without a "
+            "config_env marker",
+            pytrace=False,
+        )
+    for name in marker.kwargs["env_vars"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(marker.kwargs["load_dotenv"], lambda *args, **kwargs: None)
+
+
 @pytest.fixture
 def mock_endpoint():
     """Provide a mock endpoint URL for testing.
@@ -77,3 +106,65 @@ def mock_endpoint():
         str: Mock HTTP endpoint URL.
     """
     return "http://localhost:8000/events"
+
+
+@pytest.fixture
+def sqs_client(mocker):
+    """Patch the e2e_telemetry SQS client factory with a pre-wired mock.
+
+    Args:
+        mocker: pytest-mock fixture; the patch is undone after the test.
+
+    Returns:
+        Mock: SQS client that reports an empty queue unless a test overrides it.
+    """
+    client = mocker.Mock()
+    client.get_queue_attributes.return_value = {
+        "Attributes": {
+            "ApproximateNumberOfMessages": "0",
+            "ApproximateNumberOfMessagesNotVisible": "0",
+        }
+    }
+    client.receive_message.return_value = {}
+    mocker.patch(
+        "projects.can_data_platform.scripts.e2e_telemetry._sqs_client",
+        return_value=client,
+    )
+    return client
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """Build one E2ETelemetryOrchestrator per test module.
+
+    The SQS client factory stays patched for the module's lifetime, so the
+    orchestrator and its components never reach AWS.
+
+    Yields:
+        E2ETelemetryOrchestrator: Orchestrator for the test queue in us-east-1.
+    """
+    # pylint: disable=import-outside-toplevel
+    from projects.can_data_platform.scripts import e2e_telemetry
+
+    with mock.patch.object(e2e_telemetry, "_sqs_client"):
+        yield e2e_telemetry.E2ETelemetryOrchestrator(
+            queue_url="https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
+            aws_region="us-east-1",
+        )
+
+
+@pytest.fixture(scope="session")
+def battery_events():
+    """Generate one default 1000-event batch for the whole test session.
+
+    Read-only generator tests slice this instead of regenerating events.
+    Only the tuple itself is immutable: the events (and their lazily built
+    modules) are shared objects, so tests must treat them as read-only.
+
+    Returns:
+        tuple: TelemetryEvent objects with sequence numbers 0-999.
+    """
+    # pylint: disable=import-outside-toplevel
+    from projects.can_data_platform.src.events.generator import BatteryEventGenerator
+
+    return tuple(BatteryEventGenerator().generate_events(1000))
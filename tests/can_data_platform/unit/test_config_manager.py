@@ -1,162 +1,185 @@
 """Unit tests for telemetry configuration management."""
 
-import os
-import unittest
-from types import SimpleNamespace
+import functools
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Mapping
 from unittest.mock import patch
 
 import pytest
 
-from projects.can_data_platform.src.config.manager import (
-    ConfigManager,
-    TelemetryConfig,
+
+@functools.cache
+def _config_classes():
+    """Import the config module on first use.
+
+    Deferring the import keeps dotenv out of test collection when these
+    tests are deselected.
+    """
+    # pylint: disable=import-outside-toplevel
+    from projects.can_data_platform.src.config.manager import (
+        ConfigManager,
+        TelemetryConfig,
+    )
+
+    return ConfigManager, TelemetryConfig
+
+
+_BASE_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "sqs_queue_url": "https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
+        "aws_region": "us-west-2",
+        "sqs_batch_size": 5,
+        "stream_interval": 0.1,
+        "num_modules": 6,
+        "voltage_range": (3500, 4000),
+        "offset_range": (-20, 20),
+        "default_output_path": "/tmp/test_output.jsonl",
+    }
+)
+
+# Expected ConfigManager defaults, bound once for the assertions below.
+_DEF_AWS_REGION = "us-east-1"
+_DEF_SQS_BATCH_SIZE = 10
+_DEF_STREAM_INTERVAL = 0.05
+_DEF_NUM_MODULES = 4
+_DEF_VOLTAGE_RANGE = (3400, 4150)
+_DEF_OFFSET_RANGE = (-40, 40)
+_DEF_OUTPUT_FILE = "sample_events_optimized.jsonl"
+
+# Pre-built approx matchers for every float the assertions compare against.
+_APPROX = {
+    value: pytest.approx(value)
+    for value in (0.05, 0.1, 0.125, 0.15, 0.2, 0.25, 0.3, 0.4, 0.75)
+}
+
+_CONFIG_ENV_VARS = (
+    "SQS_QUEUE_URL",
+    "AWS_REGION",
+    "SQS_BATCH_SIZE",
+    "PRODUCER_STREAM_INTERVAL",
+    "STREAM_INTERVAL",
 )
 
+# Every test runs with those variables unset and load_dotenv stubbed out
+pytestmark = [
+    pytest.mark.config_env(
+        env_vars=_CONFIG_ENV_VARS,
+        load_dotenv="projects.can_data_platform.src.config.manager.load_dotenv",
+    ),
+    pytest.mark.usefixtures("isolated_config_env"),
+]
 
-class TestTelemetryConfig(unittest.TestCase):
+
+class TestTelemetryConfig:
     """Test TelemetryConfig data class and validation."""
 
-    def setUp(self):
-        """Set up test configuration."""
-        self.valid_config_data = {
-            "sqs_queue_url": "https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
-            "aws_region": "us-west-2",
-            "sqs_batch_size": 5,
-            "stream_interval": 0.1,
-            "num_modules": 6,
-            "voltage_range": (3500, 4000),
-            "offset_range": (-20, 20),
-            "default_output_path": "/tmp/test_output.jsonl",
-        }
+    @classmethod
+    def setup_class(cls):
+        """Resolve the config classes once for the test class."""
+        cls.ConfigManager, cls.TelemetryConfig = _config_classes()
 
     def test_valid_configuration_creation(self):
         """Test creating valid configuration."""
-        config = TelemetryConfig(**self.valid_config_data)
+        config = self.TelemetryConfig(**_BASE_CONFIG)
         
-        assert config.sqs_queue_url == self.valid_config_data["sqs_queue_url"]
-        assert config.aws_region == self.valid_config_data["aws_region"]
-        assert config.sqs_batch_size == self.valid_config_data["sqs_batch_size"]
-        assert config.stream_interval == pytest.approx(self.valid_config_data["stream_interval"])
-        assert config.num_modules == self.valid_config_data["num_modules"]
-        assert config.voltage_range == self.valid_config_data["voltage_range"]
-        assert config.offset_range == self.valid_config_data["offset_range"]
-        assert config.default_output_path == self.valid_config_data["default_output_path"]
+        assert config.sqs_queue_url == _BASE_CONFIG["sqs_queue_url"]
+        assert config.aws_region == _BASE_CONFIG["aws_region"]
+        assert config.sqs_batch_size == _BASE_CONFIG["sqs_batch_size"]
+        assert config.stream_interval == _APPROX[_BASE_CONFIG["stream_interval"]]
+        assert config.num_modules == _BASE_CONFIG["num_modules"]
+        assert config.voltage_range == _BASE_CONFIG["voltage_range"]
+        assert config.offset_range == _BASE_CONFIG["offset_range"]
+        assert config.default_output_path == _BASE_CONFIG["default_output_path"]
 
     def test_config_with_none_queue_url(self):
         """Test configuration with None SQS queue URL."""
-        config_data = self.valid_config_data.copy()
-        config_data["sqs_queue_url"] = None
-        config = TelemetryConfig(**config_data)
+        config = self.TelemetryConfig(**{**_BASE_CONFIG, "sqs_queue_url": None})
         
         assert config.sqs_queue_url is None
         config.validate()  # Should not raise
 
     def test_validation_success(self):
         """Test successful validation."""
-        config = TelemetryConfig(**self.valid_config_data)
+        config = self.TelemetryConfig(**_BASE_CONFIG)
         # Should not raise any exception
         config.validate()
 
-    def test_validation_batch_size_too_large(self):
-        """Test validation with batch size too large."""
-        config_data = self.valid_config_data.copy()
-        config_data["sqs_batch_size"] = 11
-        config = TelemetryConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SQS batch size cannot exceed 10"):
-            config.validate()
 
-    def test_validation_batch_size_too_small(self):
-        """Test validation with batch size too small."""
-        config_data = self.valid_config_data.copy()
-        config_data["sqs_batch_size"] = 0
-        config = TelemetryConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SQS batch size must be at least 1"):
-            config.validate()
-
-    def test_validation_batch_size_boundaries(self):
-        """Test validation with batch size boundaries."""
-        # Test minimum valid value
-        config_data = self.valid_config_data.copy()
-        config_data["sqs_batch_size"] = 1
-        config = TelemetryConfig(**config_data)
-        config.validate()  # Should not raise
-        
-        # Test maximum valid value
-        config_data["sqs_batch_size"] = 10
-        config = TelemetryConfig(**config_data)
-        config.validate()  # Should not raise
+@pytest.mark.parametrize(
+    "field, value, error",
+    [
+        ("sqs_batch_size", 11, "SQS batch size cannot exceed 10"),
+        ("sqs_batch_size", 0, "SQS batch size must be at least 1"),
+        ("stream_interval", -0.1, "Stream interval cannot be negative"),
+        ("num_modules", 0, "Number of modules must be at least 1"),
+        ("num_modules", -1, "Number of modules must be at least 1"),
+    ],
+)
+def test_validation_rejects_invalid_value(field, value, error):
+    """Test validation failures for out-of-range field values."""
+    _, telemetry_config = _config_classes()
+    config = telemetry_config(**{**_BASE_CONFIG, field: value})
 
-    def test_validation_negative_stream_interval(self):
-        """Test validation with negative stream interval."""
-        config_data = self.valid_config_data.copy()
-        config_data["stream_interval"] = -0.1
-        config = TelemetryConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Stream interval cannot be negative"):
-            config.validate()
-
-    def test_validation_zero_stream_interval(self):
-        """Test validation with zero stream interval (should be valid)."""
-        config_data = self.valid_config_data.copy()
-        config_data["stream_interval"] = 0.0
-        config = TelemetryConfig(**config_data)
-        config.validate()  # Should not raise
+    with pytest.raises(ValueError, match=error):
+        config.validate()
 
-    def test_validation_invalid_num_modules(self):
-        """Test validation with invalid number of modules."""
-        config_data = self.valid_config_data.copy()
-        config_data["num_modules"] = 0
-        config = TelemetryConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Number of modules must be at least 1"):
-            config.validate()
-
-    def test_validation_negative_num_modules(self):
-        """Test validation with negative number of modules."""
-        config_data = self.valid_config_data.copy()
-        config_data["num_modules"] = -1
-        config = TelemetryConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Number of modules must be at least 1"):
-            config.validate()
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("sqs_batch_size", 1),
+        ("sqs_batch_size", 10),
+        ("stream_interval", 0.0),
+    ],
+)
+def test_validation_accepts_boundary_value(field, value):
+    """Test validation succeeds at the edges of each valid range."""
+    _, telemetry_config = _config_classes()
+    config = telemetry_config(**{**_BASE_CONFIG, field: value})
+    config.validate()  # Should not raise
+
+
+def _set_env(monkeypatch, env_vars):
+    """Set environment variables for the duration of a test."""
+    for name, value in env_vars.items():
+        monkeypatch.setenv(name, value)
 
 
-class TestConfigManager(unittest.TestCase):
+class TestConfigManager:
     """Test ConfigManager configuration loading."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.manager = ConfigManager(load_env=False)
+    @classmethod
+    def setup_class(cls):
+        """Resolve the config classes and share one manager across tests."""
+        cls.ConfigManager, cls.TelemetryConfig = _config_classes()
+        cls.manager = cls.ConfigManager(load_env=False)
 
     def test_initialization_with_env_loading(self):
         """Test manager initialization with environment loading."""
         with patch('projects.can_data_platform.src.config.manager.load_dotenv') as mock_load_dotenv:
-            _ = ConfigManager(load_env=True)
+            _ = self.ConfigManager(load_env=True)
             mock_load_dotenv.assert_called_once()
 
     def test_initialization_without_env_loading(self):
         """Test manager initialization without environment loading."""
         with patch('projects.can_data_platform.src.config.manager.load_dotenv') as mock_load_dotenv:
-            _ = ConfigManager(load_env=False)
+            _ = self.ConfigManager(load_env=False)
             mock_load_dotenv.assert_not_called()
 
     def test_load_config_with_defaults(self):
         """Test loading configuration with default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.sqs_queue_url is None
-            assert config.aws_region == ConfigManager.DEFAULT_AWS_REGION
-            assert config.sqs_batch_size == ConfigManager.DEFAULT_SQS_BATCH_SIZE
-            assert config.stream_interval == pytest.approx(ConfigManager.DEFAULT_STREAM_INTERVAL)
-            assert config.num_modules == ConfigManager.DEFAULT_NUM_MODULES
-            assert config.voltage_range == ConfigManager.DEFAULT_VOLTAGE_RANGE
-            assert config.offset_range == ConfigManager.DEFAULT_OFFSET_RANGE
-            assert "sample_events_optimized.jsonl" in config.default_output_path
-
-    def test_load_config_with_environment_variables(self):
+        config = self.manager.load_config()
+
+        assert config.sqs_queue_url is None
+        assert config.aws_region == _DEF_AWS_REGION
+        assert config.sqs_batch_size == _DEF_SQS_BATCH_SIZE
+        assert config.stream_interval == _APPROX[_DEF_STREAM_INTERVAL]
+        assert config.num_modules == _DEF_NUM_MODULES
+        assert config.voltage_range == _DEF_VOLTAGE_RANGE
+        assert config.offset_range == _DEF_OFFSET_RANGE
+        assert _DEF_OUTPUT_FILE in config.default_output_path
+
+    def test_load_config_with_environment_variables(self, monkeypatch):
         """Test loading configuration from environment variables."""
         env_vars = {
             "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
@@ -165,55 +188,54 @@ class TestConfigManager(unittest.TestCase):
             "PRODUCER_STREAM_INTERVAL": "0.2",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.sqs_queue_url == "https://env-queue.amazonaws.com"
-            assert config.aws_region == "eu-central-1"
-            assert config.sqs_batch_size == 7
-            assert config.stream_interval == pytest.approx(0.2)
-
-    def test_load_config_with_stream_interval_fallback(self):
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config()
+
+        assert config.sqs_queue_url == "https://env-queue.amazonaws.com"
+        assert config.aws_region == "eu-central-1"
+        assert config.sqs_batch_size == 7
+        assert config.stream_interval == _APPROX[0.2]
+
+    def test_load_config_with_stream_interval_fallback(self, monkeypatch):
         """Test loading configuration with STREAM_INTERVAL fallback."""
         env_vars = {
             "STREAM_INTERVAL": "0.15",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.stream_interval == pytest.approx(0.15)
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config()
+
+        assert config.stream_interval == _APPROX[0.15]
 
-    def test_load_config_producer_stream_interval_priority(self):
+    def test_load_config_producer_stream_interval_priority(self, monkeypatch):
         """Test that PRODUCER_STREAM_INTERVAL takes priority over STREAM_INTERVAL."""
         env_vars = {
             "PRODUCER_STREAM_INTERVAL": "0.3",
             "STREAM_INTERVAL": "0.15",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.stream_interval == pytest.approx(0.3)
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config()
+
+        assert config.stream_interval == _APPROX[0.3]
 
     def test_load_config_with_overrides(self):
         """Test loading configuration with parameter overrides."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = self.manager.load_config(
-                sqs_queue_url="https://override-queue.amazonaws.com",
-                sqs_batch_size=3,
-                stream_interval=0.75,
-                num_modules=8,
-            )
-            
-            assert config.sqs_queue_url == "https://override-queue.amazonaws.com"
-            assert config.sqs_batch_size == 3
-            assert config.stream_interval == pytest.approx(0.75)
-            assert config.num_modules == 8
-            # Other values should be defaults
-            assert config.aws_region == ConfigManager.DEFAULT_AWS_REGION
-
-    def test_load_config_overrides_take_precedence(self):
+        config = self.manager.load_config(
+            sqs_queue_url="https://override-queue.amazonaws.com",
+            sqs_batch_size=3,
+            stream_interval=0.75,
+            num_modules=8,
+        )
+
+        assert config.sqs_queue_url == "https://override-queue.amazonaws.com"
+        assert config.sqs_batch_size == 3
+        assert config.stream_interval == _APPROX[0.75]
+        assert config.num_modules == 8
+        # Other values should be defaults
+        assert config.aws_region == _DEF_AWS_REGION
+
+    def test_load_config_overrides_take_precedence(self, monkeypatch):
         """Test that overrides take precedence over environment variables."""
         env_vars = {
             "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
@@ -221,129 +243,53 @@ class TestConfigManager(unittest.TestCase):
             "AWS_REGION": "eu-west-1",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config(
-                sqs_batch_size=3,  # Override env var
-                aws_region="ap-southeast-1",  # Override env var
-                num_modules=12,  # Override default
-            )
-            
-            assert config.sqs_queue_url == "https://env-queue.amazonaws.com"  # From env
-            assert config.sqs_batch_size == 3  # Override wins
-            assert config.aws_region == "ap-southeast-1"  # Override wins
-            assert config.num_modules == 12  # Override wins
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config(
+            sqs_batch_size=3,  # Override env var
+            aws_region="ap-southeast-1",  # Override env var
+            num_modules=12,  # Override default
+        )
+
+        assert config.sqs_queue_url == "https://env-queue.amazonaws.com"  # From env
+        assert config.sqs_batch_size == 3  # Override wins
+        assert config.aws_region == "ap-southeast-1"  # Override wins
+        assert config.num_modules == 12  # Override wins
 
     def test_load_config_validation_failure(self):
         """Test loading configuration with validation failure."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValueError, match="SQS batch size cannot exceed 10"):
-                self.manager.load_config(sqs_batch_size=15)
+        with pytest.raises(ValueError, match="SQS batch size cannot exceed 10"):
+            self.manager.load_config(sqs_batch_size=15)
 
-    def test_load_config_integer_conversion(self):
+    def test_load_config_integer_conversion(self, monkeypatch):
         """Test proper integer conversion from environment variables."""
         env_vars = {
             "SQS_BATCH_SIZE": "5",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert isinstance(config.sqs_batch_size, int)
-            assert config.sqs_batch_size == 5
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config()
+
+        assert isinstance(config.sqs_batch_size, int)
+        assert config.sqs_batch_size == 5
 
-    def test_load_config_float_conversion(self):
+    def test_load_config_float_conversion(self, monkeypatch):
         """Test proper float conversion from environment variables."""
         env_vars = {
             "PRODUCER_STREAM_INTERVAL": "0.125",
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert isinstance(config.stream_interval, float)
-            assert config.stream_interval == pytest.approx(0.125)
-
-    def test_create_from_args_with_no_args(self):
-        """Test creating configuration from args with no relevant attributes."""
-        args = SimpleNamespace()
-        
-        with patch.dict(os.environ, {}, clear=True):
-            config = ConfigManager.create_from_args(args)
-            
-            # Should use defaults
-            assert config.sqs_batch_size == ConfigManager.DEFAULT_SQS_BATCH_SIZE
-            # Use the actual default from load_config rather than constant
-            default_config = ConfigManager().load_config()
-            assert config.stream_interval == pytest.approx(default_config.stream_interval)
-            assert "sample_events_optimized.jsonl" in config.default_output_path
-
-    def test_create_from_args_with_all_args(self):
-        """Test creating configuration from args with all relevant attributes."""
-        args = SimpleNamespace(
-            stream_interval=0.25,
-            batch_size=6,
-            output="/custom/output.jsonl",
-        )
-        
-        with patch.dict(os.environ, {}, clear=True):
-            config = ConfigManager.create_from_args(args)
-            
-            assert config.stream_interval == pytest.approx(0.25)
-            assert config.sqs_batch_size == 6
-            assert config.default_output_path == "/custom/output.jsonl"
-
-    def test_create_from_args_with_batch_size_limit(self):
-        """Test creating configuration with batch size limit enforced."""
-        args = SimpleNamespace(
-            batch_size=15,  # Exceeds limit
-        )
-        
-        with patch.dict(os.environ, {}, clear=True):
-            config = ConfigManager.create_from_args(args)
-            
-            # Should be capped at 10
-            assert config.sqs_batch_size == 10
-
-    def test_create_from_args_with_partial_args(self):
-        """Test creating configuration from args with some attributes."""
-        args = SimpleNamespace(
-            stream_interval=0.4,
-            # Missing batch_size, output
-        )
-        
-        with patch.dict(os.environ, {}, clear=True):
-            config = ConfigManager.create_from_args(args)
-            
-            assert config.stream_interval == pytest.approx(0.4)
-            # Should use defaults for missing args
-            assert config.sqs_batch_size == ConfigManager.DEFAULT_SQS_BATCH_SIZE
-            assert "sample_events_optimized.jsonl" in config.default_output_path
-
-    def test_create_from_args_with_none_values(self):
-        """Test creating configuration from args with None values."""
-        args = SimpleNamespace(
-            stream_interval=None,
-            batch_size=4,
-            output=None,
-        )
-        
-        with patch.dict(os.environ, {}, clear=True):
-            config = ConfigManager.create_from_args(args)
-            
-            # None values should be ignored, defaults used
-            default_config = ConfigManager().load_config()
-            assert config.stream_interval == pytest.approx(default_config.stream_interval)
-            assert "sample_events_optimized.jsonl" in config.default_output_path
-            # Non-None values should be used
-            assert config.sqs_batch_size == 4
+        _set_env(monkeypatch, env_vars)
+        config = self.manager.load_config()
+
+        assert isinstance(config.stream_interval, float)
+        assert config.stream_interval == _APPROX[0.125]
 
     def test_default_output_path_construction(self):
         """Test that default output path is constructed correctly."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.default_output_path.endswith("sample_events_optimized.jsonl")
-            assert "data" in config.default_output_path
+        config = self.manager.load_config()
+
+        assert config.default_output_path.endswith(_DEF_OUTPUT_FILE)
+        assert "data" in config.default_output_path
 
     def test_config_with_custom_ranges(self):
         """Test configuration with custom voltage and offset ranges."""
@@ -360,9 +306,44 @@ class TestConfigManager(unittest.TestCase):
 
     def test_default_constants_values(self):
         """Test that default constants have expected values."""
-        assert ConfigManager.DEFAULT_AWS_REGION == "us-east-1"
-        assert ConfigManager.DEFAULT_SQS_BATCH_SIZE == 10
-        assert ConfigManager.DEFAULT_STREAM_INTERVAL == pytest.approx(0.05)
-        assert ConfigManager.DEFAULT_NUM_MODULES == 4
-        assert ConfigManager.DEFAULT_VOLTAGE_RANGE == (3400, 4150)
-        assert ConfigManager.DEFAULT_OFFSET_RANGE == (-40, 40)
+        assert self.ConfigManager.DEFAULT_AWS_REGION == _DEF_AWS_REGION
+        assert self.ConfigManager.DEFAULT_SQS_BATCH_SIZE == _DEF_SQS_BATCH_SIZE
+        assert self.ConfigManager.DEFAULT_STREAM_INTERVAL == _APPROX[_DEF_STREAM_INTERVAL]
+        assert self.ConfigManager.DEFAULT_NUM_MODULES == _DEF_NUM_MODULES
+        assert self.ConfigManager.DEFAULT_VOLTAGE_RANGE == _DEF_VOLTAGE_RANGE
+        assert self.ConfigManager.DEFAULT_OFFSET_RANGE == _DEF_OFFSET_RANGE
+
+
+@pytest.mark.parametrize(
+    "args_kw, batch_size, stream_interval, output",
+    [
+        ({}, _DEF_SQS_BATCH_SIZE, _DEF_STREAM_INTERVAL, _DEF_OUTPUT_FILE),
+        (
+            {"stream_interval": 0.25, "batch_size": 6, "output": "/custom/output.jsonl"},
+            6,
+            0.25,
+            "/custom/output.jsonl",
+        ),
+        ({"batch_size": 15}, 10, _DEF_STREAM_INTERVAL, _DEF_OUTPUT_FILE),
+        ({"stream_interval": 0.4}, _DEF_SQS_BATCH_SIZE, 0.4, _DEF_OUTPUT_FILE),
+        (
+            {"stream_interval": None, "batch_size": 4, "output": None},
+            4,
+            _DEF_STREAM_INTERVAL,
+            _DEF_OUTPUT_FILE,
+        ),
+    ],
+    ids=["no_args", "all_args", "batch_size_limit", "partial_args", "none_values"],
+)
+def test_create_from_args(args_kw, batch_size, stream_interval, output):
+    """Test creating configuration from argparse-style attributes.
+
+    Missing or None attributes fall back to defaults and batch size is
+    capped at the SQS limit of 10.
+    """
+    config_manager, _ = _config_classes()
+    config = config_manager.create_from_args(SimpleNamespace(**args_kw))
+
+    assert config.sqs_batch_size == batch_size
+    assert config.stream_interval == _APPROX[stream_interval]
+    assert config.default_output_path.endswith(output)
@@ -1,210 +1,252 @@
 """Comprehensive unit tests for ConsumerApp module."""
 
+import dataclasses
 import logging
 import signal
-import sys
-import time
-import unittest
-from unittest.mock import Mock, patch, MagicMock, call
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
+
+import pytest
+
+from projects.can_data_platform.src.apps.consumer_app import (
+    ConsumerApp,
+    create_argument_parser,
+    main,
+)
+from projects.can_data_platform.src.consumers.interfaces import BatchConsumerResult
+
+
+_APP_MODULE = "projects.can_data_platform.src.apps.consumer_app"
+
+_CONFIG_VALUES = {
+    "queue_url": "https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
+    "aws_region": "us-east-1",
+    "batch_size": 10,
+    "poll_interval": 1,
+    "max_retries": 3,
+    "max_wait_time": 20,
+    "log_level": "INFO",
+    "log_file": None,
+    "latency_output_dir": None,
+    "latency_flush_every": 100,
+    "sla_threshold_seconds": 5.0,
+}
+
+# Factory classes replaced together through a single patch.multiple
+_FACTORY_ATTRS = {
+    "consumer_factory": "SQSConsumerFactory",
+    "processor_factory": "MessageProcessorFactory",
+    "latency_factory": "LatencyTrackerFactory",
+}
+
+# Module-level functions patched individually
+_FUNCTION_TARGETS = {
+    "signal": f"{_APP_MODULE}.signal.signal",
+    "sleep": f"{_APP_MODULE}.time.sleep",
+}
+
+# Factory creation methods and the mock attribute each one is patched on
+_FACTORY_METHODS = (
+    ("latency_factory", "create_tracker"),
+    ("processor_factory", "create_processor"),
+    ("consumer_factory", "create_consumer"),
+)
+
+
+def _make_config(**overrides):
+    """Build a lightweight stand-in for ConsumerConfig.
+
+    ConsumerApp only reads attributes from its config, so a SimpleNamespace
+    avoids the spec introspection a Mock(spec=ConsumerConfig) would incur.
+    """
+    return SimpleNamespace(**{**_CONFIG_VALUES, **overrides})
+
+
+def _batch_result(**counts):
+    """Build a real BatchConsumerResult with zeroed counts unless overridden."""
+    return dataclasses.replace(BatchConsumerResult.create_empty(), **counts)
+
+
+def _reset_factories(mocks):
+    """Reset the patched mocks and point each factory at its default component."""
+    for name in (*_FACTORY_ATTRS, *_FUNCTION_TARGETS):
+        getattr(mocks, name).reset_mock(return_value=True, side_effect=True)
+    for name, method in _FACTORY_METHODS:
+        component = mocks.default_components[name]
+        component.reset_mock(return_value=True, side_effect=True)
+        getattr(getattr(mocks, name), method).return_value = component
+
+
+@pytest.fixture(scope="module")
+def _factory_patches():
+    """Start the ConsumerApp collaborator patches once for the module."""
+    with ExitStack() as stack:
+        factories = stack.enter_context(
+            patch.multiple(_APP_MODULE, **dict.fromkeys(_FACTORY_ATTRS.values(), DEFAULT))
+        )
+        mocks = SimpleNamespace(
+            **{name: factories[attr] for name, attr in _FACTORY_ATTRS.items()},
+            **{
+                name: stack.enter_context(patch(target))
+                for name, target in _FUNCTION_TARGETS.items()
+            },
+        )
+        mocks.default_components = {name: Mock() for name, _ in _FACTORY_METHODS}
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def patched_factories(_factory_patches):
+    """Reset the module-wide mocks before every test and expose them.
+
+    Tests request this fixture by name only when they need to configure or
+    inspect a collaborator; the next reset undoes any specialisation.
+    """
+    _reset_factories(_factory_patches)
+    return _factory_patches
+
+
+@pytest.fixture
+def config():
+    """Provide a fresh, mutable consumer configuration."""
+    return _make_config()
+
+
+@pytest.fixture(scope="module")
+def base_app(_factory_patches):
+    """Build one ConsumerApp for the whole module."""
+    _reset_factories(_factory_patches)
+    return ConsumerApp(_make_config())
+
+
+@pytest.fixture
+def app(base_app, monkeypatch):
+    """Provide the shared ConsumerApp with its run-time state reset.
 
-from projects.can_data_platform.src.apps.consumer_app import ConsumerApp
-from projects.can_data_platform.src.config.consumer_config import ConsumerConfig
+    monkeypatch restores the counters after each test, so tests that only
+    flip flags or bump counters can reuse the instance. Tests that need
+    specialised collaborators still build their own app.
+    """
+    monkeypatch.setattr(base_app, "_running", False)
+    monkeypatch.setattr(base_app, "consecutive_empty_batches", 0)
+    monkeypatch.setattr(base_app, "total_stats", dict.fromkeys(base_app.total_stats, 0))
+    return base_app
 
 
-class TestConsumerApp(unittest.TestCase):
+class TestConsumerApp:
     """Test suite for ConsumerApp class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_config = Mock(spec=ConsumerConfig)
-        self.mock_config.queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-        self.mock_config.aws_region = "us-east-1"
-        self.mock_config.batch_size = 10
-        self.mock_config.poll_interval = 1
-        self.mock_config.max_retries = 3
-        self.mock_config.max_wait_time = 20
-        self.mock_config.log_level = "INFO"
-        self.mock_config.log_file = None
-        self.mock_config.latency_output_dir = None
-        self.mock_config.latency_flush_every = 100
-        self.mock_config.sla_threshold_seconds = 5.0
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_consumer_app_initialization(self, mock_signal, mock_latency_factory, 
-                                       mock_processor_factory, mock_consumer_factory):
+    def test_consumer_app_initialization(self, patched_factories, config):
         """Test ConsumerApp proper initialization."""
-        # Arrange
-        mock_latency_tracker = Mock()
-        mock_processor = Mock()
-        mock_consumer = Mock()
-        
-        mock_latency_factory.create_tracker.return_value = mock_latency_tracker
-        mock_processor_factory.create_processor.return_value = mock_processor
-        mock_consumer_factory.create_consumer.return_value = mock_consumer
+        # Arrange - plain stubs; only their identity is checked
+        latency_tracker = SimpleNamespace()
+        processor = SimpleNamespace()
+        consumer = SimpleNamespace()
+
+        patched_factories.latency_factory.create_tracker.return_value = latency_tracker
+        patched_factories.processor_factory.create_processor.return_value = processor
+        patched_factories.consumer_factory.create_consumer.return_value = consumer
 
         # Act
-        app = ConsumerApp(self.mock_config)
+        app = ConsumerApp(config)
 
         # Assert
-        self.assertEqual(app.config, self.mock_config)
-        self.assertFalse(app._running)
-        self.assertEqual(app.total_stats["messages_consumed"], 0)
-        self.assertEqual(app.total_stats["messages_processed"], 0)
-        self.assertEqual(app.consecutive_empty_batches, 0)
-        self.assertEqual(app.max_empty_before_suggestion, 3)
-        
+        assert app.config == config
+        assert not app._running
+        assert app.total_stats["messages_consumed"] == 0
+        assert app.total_stats["messages_processed"] == 0
+        assert app.consecutive_empty_batches == 0
+        assert app.max_empty_before_suggestion == 3
+        assert app.latency_tracker is latency_tracker
+        assert app.message_processor is processor
+        assert app.consumer is consumer
+
         # Verify factory calls
-        mock_latency_factory.create_tracker.assert_called_once_with(
+        patched_factories.latency_factory.create_tracker.assert_called_once_with(
             enabled=False,  # latency_output_dir is None
             output_dir=None,
             flush_every=100,
             sla_threshold_seconds=5.0
         )
-        
-        mock_processor_factory.create_processor.assert_called_once_with(
+
+        patched_factories.processor_factory.create_processor.assert_called_once_with(
             processor_type="telemetry"
         )
-        
-        mock_consumer_factory.create_consumer.assert_called_once()
-        
+
+        patched_factories.consumer_factory.create_consumer.assert_called_once()
+
         # Verify signal handlers were set up
-        self.assertEqual(mock_signal.call_count, 2)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_consumer_app_with_latency_tracking(self, mock_signal, mock_latency_factory,
-                                              mock_processor_factory, mock_consumer_factory):
+        assert patched_factories.signal.call_count == 2
+
+    def test_consumer_app_with_latency_tracking(self, patched_factories, config):
         """Test ConsumerApp initialization with latency tracking enabled."""
         # Arrange
-        self.mock_config.latency_output_dir = "/tmp/latency"
-        
-        mock_latency_tracker = Mock()
-        mock_processor = Mock()
-        mock_consumer = Mock()
-        
-        mock_latency_factory.create_tracker.return_value = mock_latency_tracker
-        mock_processor_factory.create_processor.return_value = mock_processor
-        mock_consumer_factory.create_consumer.return_value = mock_consumer
+        config.latency_output_dir = "/tmp/latency"
 
         # Act
-        app = ConsumerApp(self.mock_config)
+        ConsumerApp(config)
 
         # Assert
-        mock_latency_factory.create_tracker.assert_called_once_with(
+        patched_factories.latency_factory.create_tracker.assert_called_once_with(
             enabled=True,  # latency_output_dir is set
             output_dir="/tmp/latency",
             flush_every=100,
             sla_threshold_seconds=5.0
         )
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_setup_logging_console_only(self, mock_signal, mock_latency_factory,
-                                       mock_processor_factory, mock_consumer_factory):
+    def test_setup_logging_console_only(self, app):
         """Test logging setup with console handler only."""
+        assert isinstance(app.logger, logging.Logger)
+        assert app.logger.name == "consumer_app"
+        assert app.logger.level == logging.INFO
+
+    def test_setup_logging_with_file(self, config, tmp_path):
+        """Test logging setup with file handler."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        log_file = tmp_path / "test.log"
+        config.log_file = str(log_file)
 
-        # Act
-        app = ConsumerApp(self.mock_config)
+        # Act - keep the mocked handler off the shared "consumer_app" logger
+        with patch('logging.FileHandler') as mock_file_handler, \
+             patch.object(logging.Logger, 'addHandler'):
+            ConsumerApp(config)
 
         # Assert
-        self.assertIsInstance(app.logger, logging.Logger)
-        self.assertEqual(app.logger.name, "consumer_app")
-        self.assertEqual(app.logger.level, logging.INFO)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_setup_logging_with_file(self, mock_signal, mock_latency_factory,
-                                    mock_processor_factory, mock_consumer_factory):
-        """Test logging setup with file handler."""
-        # Arrange
-        self.mock_config.log_file = "/tmp/test.log"
-        
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        mock_file_handler.assert_called_once_with(str(log_file))
+        assert not log_file.exists()
 
-        # Act
-        with patch('logging.FileHandler') as mock_file_handler:
-            app = ConsumerApp(self.mock_config)
-            
-            # Assert
-            mock_file_handler.assert_called_once_with("/tmp/test.log")
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_signal_handler(self, mock_signal, mock_latency_factory,
-                           mock_processor_factory, mock_consumer_factory):
+    def test_signal_handler(self, app):
         """Test signal handler for graceful shutdown."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
         app._running = True
 
         # Act
         app._signal_handler(signal.SIGTERM, None)
 
         # Assert
-        self.assertFalse(app._running)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_initialize_consumer(self, mock_signal, mock_latency_factory,
-                                mock_processor_factory, mock_consumer_factory):
-        """Test consumer initialization with configuration logging."""
-        # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
+        assert not app._running
 
+    def test_initialize_consumer(self, app):
+        """Test consumer initialization with configuration logging."""
         # Act
         with patch.object(app.logger, 'info') as mock_log_info:
             app._initialize_consumer()
 
             # Assert
             mock_log_info.assert_any_call("Starting SQS batch consumer application...")
-            mock_log_info.assert_any_call("Queue URL: %s", self.mock_config.queue_url)
-            mock_log_info.assert_any_call("Batch size: %s", self.mock_config.batch_size)
-            mock_log_info.assert_any_call("Poll interval: %s seconds", self.mock_config.poll_interval)
-            mock_log_info.assert_any_call("Max retries: %s", self.mock_config.max_retries)
+            mock_log_info.assert_any_call("Queue URL: %s", app.config.queue_url)
+            mock_log_info.assert_any_call("Batch size: %s", app.config.batch_size)
+            mock_log_info.assert_any_call("Poll interval: %s seconds", app.config.poll_interval)
+            mock_log_info.assert_any_call("Max retries: %s", app.config.max_retries)
             mock_log_info.assert_any_call("Latency tracking disabled")
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_initialize_consumer_with_latency(self, mock_signal, mock_latency_factory,
-                                             mock_processor_factory, mock_consumer_factory):
+    def test_initialize_consumer_with_latency(self, config):
         """Test consumer initialization with latency tracking enabled."""
         # Arrange
-        self.mock_config.latency_output_dir = "/tmp/latency"
-        
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        config.latency_output_dir = "/tmp/latency"
 
-        app = ConsumerApp(self.mock_config)
+        app = ConsumerApp(config)
 
         # Act
         with patch.object(app.logger, 'info') as mock_log_info:
@@ -215,68 +257,44 @@ class TestConsumerApp(unittest.TestCase):
                 "Latency tracking enabled, output: %s", "/tmp/latency"
             )
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    @patch('projects.can_data_platform.src.apps.consumer_app.time.sleep')
-    def test_main_processing_loop_no_messages(self, mock_sleep, mock_signal, mock_latency_factory,
-                                             mock_processor_factory, mock_consumer_factory):
-        """Test main processing loop when no messages are available."""
+    @pytest.mark.parametrize(
+        "processed, should_sleep",
+        [(0, True), (5, False)],
+        ids=["empty_batch_backs_off", "busy_batch_polls_again"],
+    )
+    def test_main_processing_loop_poll_sleep(
+        self, patched_factories, config, processed, should_sleep
+    ):
+        """Test the loop sleeps only after a batch that processed nothing."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
-
-        # Mock the _process_batch method to return empty result
-        mock_result = Mock()
-        mock_result.messages_processed = 0
-
-        # Simulate stopping after sleep is called
+        app = ConsumerApp(config)
         app._running = True
-        iterations = 0
+        batch_result = _batch_result(messages_processed=processed)
 
-        def stop_after_sleep(*args, **kwargs):
-            nonlocal iterations
-            iterations += 1
-            if iterations >= 2:  # After first iteration and sleep
+        def _next_batch():
+            # A second poll means the loop did not back off; stop it there
+            if mock_batch.call_count > 1:
                 app._running = False
-            return mock_result
+            return batch_result
 
-        def mock_sleep_side_effect(*args, **kwargs):
-            # Stop running after sleep is called
-            app._running = False
-
-        mock_sleep.side_effect = mock_sleep_side_effect
+        patched_factories.sleep.side_effect = lambda *_: setattr(app, '_running', False)
 
         # Act
-        with patch.object(app, '_process_batch', side_effect=stop_after_sleep):
+        with patch.object(app, '_process_batch', side_effect=_next_batch) as mock_batch:
             app._main_processing_loop()
 
         # Assert
-        mock_sleep.assert_called_once_with(self.mock_config.poll_interval)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_run_method_complete_workflow(self, mock_signal, mock_latency_factory,
-                                          mock_processor_factory, mock_consumer_factory):
-        """Test complete run method workflow."""
-        # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        assert patched_factories.sleep.called == should_sleep
+        if should_sleep:
+            patched_factories.sleep.assert_called_once_with(config.poll_interval)
 
-        app = ConsumerApp(self.mock_config)
-
-        # Mock all the internal methods
+    def test_run_method_complete_workflow(self, app):
+        """Test complete run method workflow."""
+        # Arrange - mock all the internal methods
         with patch.object(app, '_initialize_consumer') as mock_init, \
              patch.object(app, '_main_processing_loop') as mock_loop, \
              patch.object(app, '_shutdown') as mock_shutdown:
-            
+
             # Act
             app.run()
 
@@ -284,28 +302,16 @@ class TestConsumerApp(unittest.TestCase):
             mock_init.assert_called_once()
             mock_loop.assert_called_once()
             mock_shutdown.assert_called_once()
-            self.assertTrue(app._running)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_run_method_keyboard_interrupt(self, mock_signal, mock_latency_factory,
-                                          mock_processor_factory, mock_consumer_factory):
-        """Test run method handling KeyboardInterrupt."""
-        # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
+            assert app._running
 
-        # Mock internal methods
+    def test_run_method_keyboard_interrupt(self, app):
+        """Test run method handling KeyboardInterrupt."""
+        # Arrange - mock internal methods
         with patch.object(app, '_initialize_consumer'), \
              patch.object(app, '_main_processing_loop', side_effect=KeyboardInterrupt), \
              patch.object(app, '_shutdown') as mock_shutdown, \
              patch.object(app.logger, 'info') as mock_log_info:
-            
+
             # Act
             app.run()
 
@@ -313,19 +319,9 @@ class TestConsumerApp(unittest.TestCase):
             mock_shutdown.assert_called_once()
             mock_log_info.assert_any_call("Received keyboard interrupt")
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_run_method_critical_error(self, mock_signal, mock_latency_factory,
-                                      mock_processor_factory, mock_consumer_factory):
+    def test_run_method_critical_error(self, app):
         """Test run method handling critical errors."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
         test_error = Exception("Critical test error")
 
         # Mock internal methods
@@ -333,333 +329,179 @@ class TestConsumerApp(unittest.TestCase):
              patch.object(app, '_main_processing_loop', side_effect=test_error), \
              patch.object(app, '_shutdown') as mock_shutdown, \
              patch.object(app.logger, 'error') as mock_log_error:
-            
+
             # Act & Assert
-            with self.assertRaises(Exception) as context:
+            with pytest.raises(Exception, match="Critical test error"):
                 app.run()
-            
-            self.assertEqual(str(context.exception), "Critical test error")
+
             mock_shutdown.assert_called_once()
             mock_log_error.assert_called_once_with(
                 "Critical error in consumer application: %s", test_error
             )
 
 
-class TestConsumerAppProcessBatch(unittest.TestCase):
+class TestConsumerAppProcessBatch:
     """Test suite for ConsumerApp _process_batch method."""
 
-    def setUp(self):
-        """Set up test fixtures for batch processing tests."""
-        self.mock_config = Mock(spec=ConsumerConfig)
-        self.mock_config.queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-        self.mock_config.aws_region = "us-east-1"
-        self.mock_config.batch_size = 10
-        self.mock_config.poll_interval = 1
-        self.mock_config.max_retries = 3
-        self.mock_config.max_wait_time = 20
-        self.mock_config.log_level = "INFO"
-        self.mock_config.log_file = None
-        self.mock_config.latency_output_dir = None
-        self.mock_config.latency_flush_every = 100
-        self.mock_config.sla_threshold_seconds = 5.0
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_process_batch_success(self, mock_signal, mock_latency_factory,
-                                  mock_processor_factory, mock_consumer_factory):
+    def test_process_batch_success(self, patched_factories, config):
         """Test successful batch processing."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer = Mock()
-        mock_consumer_factory.create_consumer.return_value = mock_consumer
-
-        # Mock batch result with correct attribute names
-        mock_result = Mock()
-        mock_result.consumed = 5  # This is what the code actually uses
-        mock_result.messages_processed = 5
-        mock_result.messages_deleted = 5
-        mock_result.errors = 0
-        mock_result.deletion_errors = 0
-        mock_consumer.consume_batch.return_value = mock_result
-
-        app = ConsumerApp(self.mock_config)
+        batch_result = _batch_result(consumed=5, messages_processed=5, messages_deleted=5)
+        patched_factories.consumer_factory.create_consumer.return_value = SimpleNamespace(
+            consume_batch=lambda: batch_result, health_check=lambda: True
+        )
+
+        app = ConsumerApp(config)
 
         # Act
         result = app._process_batch()
 
         # Assert
-        self.assertEqual(result, mock_result)
-        self.assertEqual(app.total_stats["messages_consumed"], 5)
-        self.assertEqual(app.total_stats["messages_processed"], 5)
-        self.assertEqual(app.total_stats["messages_deleted"], 5)
-        self.assertEqual(app.total_stats["batches_processed"], 1)
-        self.assertEqual(app.consecutive_empty_batches, 0)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_process_batch_empty_queue(self, mock_signal, mock_latency_factory,
-                                      mock_processor_factory, mock_consumer_factory):
+        assert result == batch_result
+        assert app.total_stats["messages_consumed"] == 5
+        assert app.total_stats["messages_processed"] == 5
+        assert app.total_stats["messages_deleted"] == 5
+        assert app.total_stats["batches_processed"] == 1
+        assert app.consecutive_empty_batches == 0
+
+    def test_process_batch_empty_queue(self, patched_factories, config):
         """Test batch processing with empty queue."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer = Mock()
-        mock_consumer_factory.create_consumer.return_value = mock_consumer
-
-        # Mock empty batch result with correct attribute names
-        mock_result = Mock()
-        mock_result.consumed = 0  # This is what the code actually uses
-        mock_result.messages_processed = 0
-        mock_result.messages_deleted = 0
-        mock_result.errors = 0
-        mock_result.deletion_errors = 0
-        mock_consumer.consume_batch.return_value = mock_result
-
-        app = ConsumerApp(self.mock_config)
+        batch_result = _batch_result()
+        patched_factories.consumer_factory.create_consumer.return_value = SimpleNamespace(
+            consume_batch=lambda: batch_result, health_check=lambda: True
+        )
+
+        app = ConsumerApp(config)
 
         # Act
         app._process_batch()  # Don't need to capture result
 
         # Assert
-        self.assertEqual(app.consecutive_empty_batches, 1)
-        self.assertEqual(app.total_stats["batches_processed"], 1)
+        assert app.consecutive_empty_batches == 1
+        assert app.total_stats["batches_processed"] == 1
 
 
-class TestConsumerAppArguments(unittest.TestCase):
+class TestConsumerAppArguments:
     """Test suite for ConsumerApp argument parsing."""
 
     def test_create_argument_parser(self):
         """Test argument parser creation."""
-        from projects.can_data_platform.src.apps.consumer_app import create_argument_parser
-        
         parser = create_argument_parser()
-        
+
         # Test parsing arguments
         args = parser.parse_args(['--batch-size', '5', '--log-level', 'DEBUG'])
-        self.assertEqual(args.batch_size, 5)
-        self.assertEqual(args.log_level, 'DEBUG')
+        assert args.batch_size == 5
+        assert args.log_level == 'DEBUG'
+
+
+@pytest.fixture
+def main_patches():
+    """Patch main()'s collaborators and expose the mocks."""
+    with patch(f"{_APP_MODULE}.ConsumerConfigManager") as mock_config_manager, \
+         patch(f"{_APP_MODULE}.ConsumerApp") as mock_app_class, \
+         patch(f"{_APP_MODULE}.create_argument_parser") as mock_parser, \
+         patch('builtins.print') as mock_print:
+        yield SimpleNamespace(
+            config_manager=mock_config_manager,
+            app_class=mock_app_class,
+            parser=mock_parser,
+            print=mock_print,
+        )
 
 
-class TestConsumerAppMainFunction(unittest.TestCase):
+class TestConsumerAppMainFunction:
     """Test suite for main function."""
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.ConsumerConfigManager')
-    @patch('projects.can_data_platform.src.apps.consumer_app.ConsumerApp')
-    @patch('projects.can_data_platform.src.apps.consumer_app.create_argument_parser')
-    def test_main_success(self, mock_parser, mock_app_class, mock_config_manager):
+    def test_main_success(self, main_patches):
         """Test main function successful execution."""
-        from projects.can_data_platform.src.apps.consumer_app import main
-        
-        # Arrange
-        mock_args = Mock()
-        mock_parser_instance = Mock()
-        mock_parser_instance.parse_args.return_value = mock_args
-        mock_parser.return_value = mock_parser_instance
-        
-        mock_config = Mock()
-        mock_config_manager.create_from_args.return_value = mock_config
-        
-        mock_app = Mock()
-        mock_app_class.return_value = mock_app
-        
         # Act
         main()
-        
-        # Assert
-        mock_config_manager.create_from_args.assert_called_once_with(mock_args)
-        mock_app_class.assert_called_once_with(mock_config)
-        mock_app.run.assert_called_once()
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.ConsumerConfigManager')
-    @patch('projects.can_data_platform.src.apps.consumer_app.create_argument_parser')
-    @patch('builtins.print')
-    def test_main_with_value_error(self, mock_print, mock_parser, mock_config_manager):
-        """Test main function handles ValueError."""
-        from projects.can_data_platform.src.apps.consumer_app import main
-        
-        # Arrange
-        mock_args = Mock()
-        mock_parser_instance = Mock()
-        mock_parser_instance.parse_args.return_value = mock_args
-        mock_parser.return_value = mock_parser_instance
-        
-        mock_config_manager.create_from_args.side_effect = ValueError("Invalid config")
-        
-        # Act
-        main()
-        
-        # Assert
-        mock_print.assert_called_once()
-        call_args = mock_print.call_args[0][0]
-        self.assertIn("Failed to start consumer application", call_args)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.ConsumerConfigManager')
-    @patch('projects.can_data_platform.src.apps.consumer_app.create_argument_parser')
-    @patch('builtins.print')
-    def test_main_with_file_not_found_error(self, mock_print, mock_parser, mock_config_manager):
-        """Test main function handles FileNotFoundError."""
-        from projects.can_data_platform.src.apps.consumer_app import main
-        
-        # Arrange
-        mock_args = Mock()
-        mock_parser_instance = Mock()
-        mock_parser_instance.parse_args.return_value = mock_args
-        mock_parser.return_value = mock_parser_instance
-        
-        mock_config_manager.create_from_args.side_effect = FileNotFoundError("Config not found")
-        
-        # Act
-        main()
-        
+
         # Assert
-        mock_print.assert_called_once()
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.ConsumerConfigManager')
-    @patch('projects.can_data_platform.src.apps.consumer_app.create_argument_parser')
-    @patch('builtins.print')
-    def test_main_with_connection_error(self, mock_print, mock_parser, mock_config_manager):
-        """Test main function handles ConnectionError."""
-        from projects.can_data_platform.src.apps.consumer_app import main
-        
+        mock_args = main_patches.parser.return_value.parse_args.return_value
+        mock_config = main_patches.config_manager.create_from_args.return_value
+        main_patches.config_manager.create_from_args.assert_called_once_with(mock_args)
+        main_patches.app_class.assert_called_once_with(mock_config)
+        main_patches.app_class.return_value.run.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValueError("Invalid config"),
+            FileNotFoundError("Config not found"),
+            ConnectionError("Cannot connect"),
+        ],
+        ids=["value_error", "file_not_found_error", "connection_error"],
+    )
+    def test_main_handles_startup_error(self, main_patches, error):
+        """Test main function reports configuration/startup errors."""
         # Arrange
-        mock_args = Mock()
-        mock_parser_instance = Mock()
-        mock_parser_instance.parse_args.return_value = mock_args
-        mock_parser.return_value = mock_parser_instance
-        
-        mock_config_manager.create_from_args.side_effect = ConnectionError("Cannot connect")
-        
+        main_patches.config_manager.create_from_args.side_effect = error
+
         # Act
         main()
-        
+
         # Assert
-        mock_print.assert_called_once()
+        mock_args = main_patches.parser.return_value.parse_args.return_value
+        main_patches.config_manager.create_from_args.assert_called_once_with(mock_args)
+        main_patches.print.assert_called_once()
+        assert "Failed to start consumer application" in main_patches.print.call_args[0][0]
 
 
-class TestConsumerAppErrorHandling(unittest.TestCase):
+class TestConsumerAppErrorHandling:
     """Test suite for error handling in ConsumerApp."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_config = Mock(spec=ConsumerConfig)
-        self.mock_config.queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-        self.mock_config.aws_region = "us-east-1"
-        self.mock_config.batch_size = 10
-        self.mock_config.poll_interval = 1
-        self.mock_config.max_retries = 3
-        self.mock_config.max_wait_time = 20
-        self.mock_config.log_level = "INFO"
-        self.mock_config.log_file = None
-        self.mock_config.latency_output_dir = None
-        self.mock_config.latency_flush_every = 100
-        self.mock_config.sla_threshold_seconds = 5.0
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    @patch('projects.can_data_platform.src.apps.consumer_app.time.sleep')
-    def test_main_processing_loop_timeout_error(self, mock_sleep, mock_signal,
-                                                mock_latency_factory, mock_processor_factory,
-                                                mock_consumer_factory):
+    def test_main_processing_loop_timeout_error(self, patched_factories, config):
         """Test main processing loop handles TimeoutError."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
+        app = ConsumerApp(config)
         app._running = True
 
-        call_count = [0]
-
-        def process_batch_side_effect():
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise TimeoutError("Request timed out")
-            else:
-                app._running = False
-                mock_result = Mock()
-                mock_result.messages_processed = 0
-                return mock_result
+        # Error backoff sleeps once, which ends the loop
+        patched_factories.sleep.side_effect = lambda *_: setattr(app, '_running', False)
 
         # Act
-        with patch.object(app, '_process_batch', side_effect=process_batch_side_effect):
+        with patch.object(
+            app, '_process_batch', side_effect=TimeoutError("Request timed out")
+        ):
             app._main_processing_loop()
 
         # Assert
-        mock_sleep.assert_called()
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_handle_batch_errors_processing(self, mock_signal, mock_latency_factory,
-                                           mock_processor_factory, mock_consumer_factory):
+        patched_factories.sleep.assert_called_once_with(config.poll_interval)
+
+    def test_handle_batch_errors_processing(self, app):
         """Test logging of processing errors in batch."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
-
-        mock_result = Mock()
-        mock_result.errors = 3
-        mock_result.deletion_errors = 0
+        batch_result = _batch_result(errors=3)
 
         # Act
         with patch.object(app.logger, 'warning') as mock_warning:
-            app._log_batch_errors(mock_result)
+            app._log_batch_errors(batch_result)
 
         # Assert
         mock_warning.assert_called_once_with("Encountered %s processing errors", 3)
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_handle_batch_errors_deletion(self, mock_signal, mock_latency_factory,
-                                          mock_processor_factory, mock_consumer_factory):
+    def test_handle_batch_errors_deletion(self, app):
         """Test logging of deletion errors in batch."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
-
-        mock_result = Mock()
-        mock_result.errors = 0
-        mock_result.deletion_errors = 2
+        batch_result = _batch_result(deletion_errors=2)
 
         # Act
         with patch.object(app.logger, 'warning') as mock_warning:
-            app._log_batch_errors(mock_result)
+            app._log_batch_errors(batch_result)
 
         # Assert
         mock_warning.assert_called_once_with("Encountered %s deletion errors", 2)
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_check_consumer_health_failure(self, mock_signal, mock_latency_factory,
-                                           mock_processor_factory, mock_consumer_factory):
+    def test_check_consumer_health_failure(self, patched_factories, config):
         """Test consumer health check failure."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer = Mock()
-        mock_consumer.health_check.return_value = False
-        mock_consumer_factory.create_consumer.return_value = mock_consumer
+        patched_factories.consumer_factory.create_consumer.return_value = SimpleNamespace(
+            health_check=lambda: False
+        )
 
-        app = ConsumerApp(self.mock_config)
+        app = ConsumerApp(config)
         app._running = True
 
         # Act
@@ -667,68 +509,33 @@ class TestConsumerAppErrorHandling(unittest.TestCase):
             app._check_consumer_health()
 
         # Assert
-        self.assertFalse(app._running)
+        assert not app._running
         mock_error.assert_called_once_with("Consumer health check failed")
 
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_shutdown_with_io_error(self, mock_signal, mock_latency_factory,
-                                    mock_processor_factory, mock_consumer_factory):
-        """Test shutdown handles IOError during flush."""
+    @pytest.mark.parametrize(
+        "error",
+        [IOError("Disk full"), OSError("Permission denied")],
+        ids=["io_error", "os_error"],
+    )
+    def test_shutdown_error_on_flush(self, patched_factories, config, error):
+        """Test shutdown logs an I/O failure while flushing latency metrics."""
         # Arrange
         mock_tracker = Mock()
-        mock_tracker.flush.side_effect = IOError("Disk full")
-        mock_latency_factory.create_tracker.return_value = mock_tracker
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        mock_tracker.flush.side_effect = error
+        patched_factories.latency_factory.create_tracker.return_value = mock_tracker
 
-        app = ConsumerApp(self.mock_config)
+        app = ConsumerApp(config)
 
         # Act
         with patch.object(app.logger, 'error') as mock_error:
             app._shutdown()
 
         # Assert
-        mock_error.assert_any_call("Error flushing latency metrics: %s", mock_tracker.flush.side_effect)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_shutdown_with_os_error(self, mock_signal, mock_latency_factory,
-                                    mock_processor_factory, mock_consumer_factory):
-        """Test shutdown handles OSError during flush."""
-        # Arrange
-        mock_tracker = Mock()
-        mock_tracker.flush.side_effect = OSError("Permission denied")
-        mock_latency_factory.create_tracker.return_value = mock_tracker
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
+        mock_error.assert_any_call("Error flushing latency metrics: %s", error)
 
-        app = ConsumerApp(self.mock_config)
-
-        # Act
-        with patch.object(app.logger, 'error') as mock_error:
-            app._shutdown()
-
-        # Assert
-        mock_error.assert_any_call("Error flushing latency metrics: %s", mock_tracker.flush.side_effect)
-
-    @patch('projects.can_data_platform.src.apps.consumer_app.SQSConsumerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.MessageProcessorFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.LatencyTrackerFactory')
-    @patch('projects.can_data_platform.src.apps.consumer_app.signal.signal')
-    def test_handle_empty_batch_multiple_consecutive(self, mock_signal, mock_latency_factory,
-                                                     mock_processor_factory, mock_consumer_factory):
+    def test_handle_empty_batch_multiple_consecutive(self, app):
         """Test handling multiple consecutive empty batches."""
         # Arrange
-        mock_latency_factory.create_tracker.return_value = Mock()
-        mock_processor_factory.create_processor.return_value = Mock()
-        mock_consumer_factory.create_consumer.return_value = Mock()
-
-        app = ConsumerApp(self.mock_config)
         app.consecutive_empty_batches = 2
 
         # Act
@@ -736,10 +543,9 @@ class TestConsumerAppErrorHandling(unittest.TestCase):
             app._handle_empty_batch()
 
         # Assert
-        self.assertEqual(app.consecutive_empty_batches, 3)
-        # Should log suggestion message
-        self.assertTrue(any('consecutive polls' in str(call) for call in mock_info.call_args_list))
-
-
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
\ No newline at end of file
+        assert app.consecutive_empty_batches == 3
+        # Should log suggestion message; only the format string is inspected
+        assert any(
+            call.args and 'consecutive polls' in call.args[0]
+            for call in mock_info.call_args_list
+        )
@@ -1,8 +1,7 @@
 """Unit tests for consumer configuration management."""
 
-import os
-import unittest
-from types import SimpleNamespace
+import re
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -13,389 +12,379 @@ from projects.can_data_platform.src.config.consumer_config import (
 )
 
 
-class TestConsumerConfig(unittest.TestCase):
-    """Test ConsumerConfig data class and validation."""
-
-    def setUp(self):
-        """Set up test configuration."""
-        self.valid_config_data = {
-            "queue_url": "https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
-            "batch_size": 5,
-            "poll_interval": 1.0,
-            "max_retries": 3,
-            "max_wait_time": 10,
-            "aws_region": "us-west-2",
-            "latency_flush_every": 50,
-            "latency_output_dir": "/tmp/metrics",
-            "sla_threshold_seconds": 3.0,
-            "log_file": "/tmp/consumer.log",
-            "log_level": "DEBUG",
-        }
-
-    def test_valid_configuration_creation(self):
-        """Test creating valid configuration."""
-        config = ConsumerConfig(**self.valid_config_data)
-        
-        assert config.queue_url == self.valid_config_data["queue_url"]
-        assert config.batch_size == self.valid_config_data["batch_size"]
-        assert config.poll_interval == self.valid_config_data["poll_interval"]
-        assert config.max_retries == self.valid_config_data["max_retries"]
-        assert config.max_wait_time == self.valid_config_data["max_wait_time"]
-        assert config.aws_region == self.valid_config_data["aws_region"]
-        assert config.latency_flush_every == self.valid_config_data["latency_flush_every"]
-        assert config.latency_output_dir == self.valid_config_data["latency_output_dir"]
-        assert config.sla_threshold_seconds == self.valid_config_data["sla_threshold_seconds"]
-        assert config.log_file == self.valid_config_data["log_file"]
-        assert config.log_level == self.valid_config_data["log_level"]
-
-    def test_validation_success(self):
-        """Test successful validation."""
-        config = ConsumerConfig(**self.valid_config_data)
-        # Should not raise any exception
+# Keyword arguments for a valid ConsumerConfig; read-only so tests must copy
+_VALID_CONFIG = MappingProxyType(
+    {
+        "queue_url": "https://sqs.us-east-1.amazonaws.com/123456789/test-queue",
+        "batch_size": 5,
+        "poll_interval": 1.0,
+        "max_retries": 3,
+        "max_wait_time": 10,
+        "aws_region": "us-west-2",
+        "latency_flush_every": 50,
+        "latency_output_dir": "/tmp/metrics",
+        "sla_threshold_seconds": 3.0,
+        "log_file": "/tmp/consumer.log",
+        "log_level": "DEBUG",
+    }
+)
+
+_QUEUE = "https://test-queue.amazonaws.com"
+
+# Minimal environment that lets ConsumerConfigManager.load_config validate
+_ENV_BASE = MappingProxyType({"SQS_QUEUE_URL": _QUEUE})
+
+
+# ConsumerConfig.validate error messages, compiled once for pytest.raises
+_ERR_PATTERNS = {
+    name: re.compile(message)
+    for name, message in {
+        "queue_url_required": "SQS queue URL is required",
+        "batch_range": "Batch size must be between 1 and 10",
+        "poll_negative": "Poll interval cannot be negative",
+        "retries_negative": "Max retries cannot be negative",
+        "flush_min": "Latency flush interval must be at least 1",
+        "sla_positive": "SLA threshold must be positive",
+    }.items()
+}
+
+
+@pytest.fixture(scope="module")
+def valid_config_data():
+    """Provide the read-only valid ConsumerConfig keyword arguments."""
+    return _VALID_CONFIG
+
+
+def test_valid_configuration_creation(valid_config_data):
+    """Test creating valid configuration."""
+    config = ConsumerConfig(**valid_config_data)
+
+    for field, value in valid_config_data.items():
+        assert getattr(config, field) == value
+
+
+def test_validation_success(valid_config_data):
+    """Test successful validation."""
+    config = ConsumerConfig(**valid_config_data)
+    # Should not raise any exception
+    config.validate()
+
+
+@pytest.mark.parametrize(
+    "field, value, match",
+    [
+        ("queue_url", "", _ERR_PATTERNS["queue_url_required"]),
+        ("queue_url", None, _ERR_PATTERNS["queue_url_required"]),
+        ("batch_size", 0, _ERR_PATTERNS["batch_range"]),
+        ("batch_size", 11, _ERR_PATTERNS["batch_range"]),
+        ("poll_interval", -1.0, _ERR_PATTERNS["poll_negative"]),
+        ("max_retries", -1, _ERR_PATTERNS["retries_negative"]),
+        ("latency_flush_every", 0, _ERR_PATTERNS["flush_min"]),
+        ("latency_flush_every", -5, _ERR_PATTERNS["flush_min"]),
+        ("sla_threshold_seconds", 0.0, _ERR_PATTERNS["sla_positive"]),
+        ("sla_threshold_seconds", -1.0, _ERR_PATTERNS["sla_positive"]),
+    ],
+)
+def test_validation_rejects_invalid_value(valid_config_data, field, value, match):
+    """Test validation rejects an out-of-range value for a single field."""
+    config = ConsumerConfig(**{**valid_config_data, field: value})
+
+    with pytest.raises(ValueError, match=match):
         config.validate()
 
-    def test_validation_empty_queue_url(self):
-        """Test validation with empty queue URL."""
-        config_data = self.valid_config_data.copy()
-        config_data["queue_url"] = ""
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SQS queue URL is required"):
-            config.validate()
-
-    def test_validation_none_queue_url(self):
-        """Test validation with None queue URL."""
-        config_data = self.valid_config_data.copy()
-        config_data["queue_url"] = None
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SQS queue URL is required"):
-            config.validate()
-
-    def test_validation_batch_size_too_small(self):
-        """Test validation with batch size too small."""
-        config_data = self.valid_config_data.copy()
-        config_data["batch_size"] = 0
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Batch size must be between 1 and 10"):
-            config.validate()
-
-    def test_validation_batch_size_too_large(self):
-        """Test validation with batch size too large."""
-        config_data = self.valid_config_data.copy()
-        config_data["batch_size"] = 11
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Batch size must be between 1 and 10"):
-            config.validate()
-
-    def test_validation_batch_size_boundaries(self):
-        """Test validation with batch size boundaries."""
-        # Test minimum valid value
-        config_data = self.valid_config_data.copy()
-        config_data["batch_size"] = 1
-        config = ConsumerConfig(**config_data)
-        config.validate()  # Should not raise
-        
-        # Test maximum valid value
-        config_data["batch_size"] = 10
-        config = ConsumerConfig(**config_data)
-        config.validate()  # Should not raise
-
-    def test_validation_negative_poll_interval(self):
-        """Test validation with negative poll interval."""
-        config_data = self.valid_config_data.copy()
-        config_data["poll_interval"] = -1.0
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Poll interval cannot be negative"):
-            config.validate()
-
-    def test_validation_zero_poll_interval(self):
-        """Test validation with zero poll interval (should be valid)."""
-        config_data = self.valid_config_data.copy()
-        config_data["poll_interval"] = 0.0
-        config = ConsumerConfig(**config_data)
-        config.validate()  # Should not raise
-
-    def test_validation_negative_max_retries(self):
-        """Test validation with negative max retries."""
-        config_data = self.valid_config_data.copy()
-        config_data["max_retries"] = -1
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Max retries cannot be negative"):
-            config.validate()
-
-    def test_validation_zero_max_retries(self):
-        """Test validation with zero max retries (should be valid)."""
-        config_data = self.valid_config_data.copy()
-        config_data["max_retries"] = 0
-        config = ConsumerConfig(**config_data)
-        config.validate()  # Should not raise
-
-    def test_validation_invalid_latency_flush_every(self):
-        """Test validation with invalid latency flush interval."""
-        config_data = self.valid_config_data.copy()
-        config_data["latency_flush_every"] = 0
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Latency flush interval must be at least 1"):
-            config.validate()
-
-    def test_validation_negative_latency_flush_every(self):
-        """Test validation with negative latency flush interval."""
-        config_data = self.valid_config_data.copy()
-        config_data["latency_flush_every"] = -5
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="Latency flush interval must be at least 1"):
-            config.validate()
-
-    def test_validation_zero_sla_threshold(self):
-        """Test validation with zero SLA threshold."""
-        config_data = self.valid_config_data.copy()
-        config_data["sla_threshold_seconds"] = 0.0
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SLA threshold must be positive"):
-            config.validate()
-
-    def test_validation_negative_sla_threshold(self):
-        """Test validation with negative SLA threshold."""
-        config_data = self.valid_config_data.copy()
-        config_data["sla_threshold_seconds"] = -1.0
-        config = ConsumerConfig(**config_data)
-        
-        with pytest.raises(ValueError, match="SLA threshold must be positive"):
-            config.validate()
-
-
-class TestConsumerConfigManager(unittest.TestCase):
-    """Test ConsumerConfigManager configuration loading."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.manager = ConsumerConfigManager(load_env=False)
-
-    def test_initialization_with_env_loading(self):
-        """Test manager initialization with environment loading."""
-        with patch('projects.can_data_platform.src.config.consumer_config.load_dotenv') as mock_load_dotenv:
-            _ = ConsumerConfigManager(load_env=True)
-            mock_load_dotenv.assert_called_once()
-
-    def test_initialization_without_env_loading(self):
-        """Test manager initialization without environment loading."""
-        with patch('projects.can_data_platform.src.config.consumer_config.load_dotenv') as mock_load_dotenv:
-            _ = ConsumerConfigManager(load_env=False)
-            mock_load_dotenv.assert_not_called()
-
-    def test_load_config_with_defaults(self):
-        """Test loading configuration with default values."""
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.queue_url == "https://test-queue.amazonaws.com"
-            assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
-            assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
-            assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
-            assert config.max_wait_time == ConsumerConfigManager.DEFAULT_MAX_WAIT_TIME
-            assert config.aws_region == ConsumerConfigManager.DEFAULT_AWS_REGION
-            assert config.latency_flush_every == ConsumerConfigManager.DEFAULT_LATENCY_FLUSH_EVERY
-            assert config.latency_output_dir == ConsumerConfigManager.DEFAULT_LATENCY_OUTPUT_DIR
-            assert config.sla_threshold_seconds == ConsumerConfigManager.DEFAULT_SLA_THRESHOLD
-            assert config.log_file is None
-            assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
-
-    def test_load_config_with_environment_variables(self):
-        """Test loading configuration from environment variables."""
-        env_vars = {
-            "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
-            "SQS_BATCH_SIZE": "7",
-            "SQS_CONSUMER_POLL_SEC": "2.5",
-            "SQS_DELETION_MAX_RETRIES": "5",
-            "SQS_WAIT_TIME_SECONDS": "15",
-            "AWS_REGION": "eu-west-1",
-            "LATENCY_FLUSH_EVERY": "75",
-            "LATENCY_OUTPUT_DIR": "/custom/metrics",
-            "SLA_THRESHOLD_SECONDS": "10.0",
-            "CONSUMER_LOG_FILE": "/custom/consumer.log",
-            "LOG_LEVEL": "WARNING",
-        }
-        
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert config.queue_url == "https://env-queue.amazonaws.com"
-            assert config.batch_size == 7
-            assert config.poll_interval == pytest.approx(2.5)
-            assert config.max_retries == 5
-            assert config.max_wait_time == 15
-            assert config.aws_region == "eu-west-1"
-            assert config.latency_flush_every == 75
-            assert config.latency_output_dir == "/custom/metrics"
-            assert config.sla_threshold_seconds == pytest.approx(10.0)
-            assert config.log_file == "/custom/consumer.log"
-            assert config.log_level == "WARNING"
-
-    def test_load_config_with_overrides(self):
-        """Test loading configuration with parameter overrides."""
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = self.manager.load_config(
-                batch_size=3,
-                poll_interval=0.5,
-                max_retries=2,
-                log_level="ERROR",
-            )
-            
-            assert config.queue_url == "https://test-queue.amazonaws.com"
-            assert config.batch_size == 3
-            assert config.poll_interval == pytest.approx(0.5)
-            assert config.max_retries == 2
-            assert config.log_level == "ERROR"
-            # Other values should be defaults
-            assert config.aws_region == ConsumerConfigManager.DEFAULT_AWS_REGION
-
-    def test_load_config_overrides_take_precedence(self):
-        """Test that overrides take precedence over environment variables."""
-        env_vars = {
-            "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
-            "SQS_BATCH_SIZE": "8",
-            "LOG_LEVEL": "DEBUG",
-        }
-        
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config(
-                batch_size=3,  # Override env var
-                log_level="ERROR",  # Override env var
-                aws_region="ap-south-1",  # Override default
-            )
-            
-            assert config.queue_url == "https://env-queue.amazonaws.com"  # From env
-            assert config.batch_size == 3  # Override wins
-            assert config.log_level == "ERROR"  # Override wins
-            assert config.aws_region == "ap-south-1"  # Override wins
-
-    def test_load_config_validation_failure(self):
-        """Test loading configuration with validation failure."""
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": ""}, clear=True):
-            with pytest.raises(ValueError, match="SQS queue URL is required"):
-                self.manager.load_config()
-
-    def test_load_config_integer_conversion(self):
-        """Test proper integer conversion from environment variables."""
-        env_vars = {
-            "SQS_QUEUE_URL": "https://test-queue.amazonaws.com",
-            "SQS_BATCH_SIZE": "5",
-            "SQS_DELETION_MAX_RETRIES": "3",
-            "SQS_WAIT_TIME_SECONDS": "20",
-            "LATENCY_FLUSH_EVERY": "100",
-        }
-        
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert isinstance(config.batch_size, int)
-            assert isinstance(config.max_retries, int)
-            assert isinstance(config.max_wait_time, int)
-            assert isinstance(config.latency_flush_every, int)
-
-    def test_load_config_float_conversion(self):
-        """Test proper float conversion from environment variables."""
-        env_vars = {
-            "SQS_QUEUE_URL": "https://test-queue.amazonaws.com",
-            "SQS_CONSUMER_POLL_SEC": "1.5",
-            "SLA_THRESHOLD_SECONDS": "7.5",
-        }
-        
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = self.manager.load_config()
-            
-            assert isinstance(config.poll_interval, float)
-            assert isinstance(config.sla_threshold_seconds, float)
-            assert config.poll_interval == pytest.approx(1.5)
-            assert config.sla_threshold_seconds == pytest.approx(7.5)
-
-    def test_create_from_args_with_no_args(self):
-        """Test creating configuration from args with no relevant attributes."""
-        args = SimpleNamespace()
-        
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = ConsumerConfigManager.create_from_args(args)
-            
-            # Should use defaults
-            assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
-            assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
-            assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
-            assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
-
-    def test_create_from_args_with_all_args(self):
-        """Test creating configuration from args with all relevant attributes."""
-        args = SimpleNamespace(
-            batch_size=4,
-            poll_interval=2.0,
-            max_retries=6,
-            log_level="debug",
-            latency_flush=150,
-        )
-        
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = ConsumerConfigManager.create_from_args(args)
-            
-            assert config.batch_size == 4
-            assert config.poll_interval == pytest.approx(2.0)
-            assert config.max_retries == 6
-            assert config.log_level == "DEBUG"  # Should be uppercased
-            assert config.latency_flush_every == 150
-
-    def test_create_from_args_with_partial_args(self):
-        """Test creating configuration from args with some attributes."""
-        args = SimpleNamespace(
-            batch_size=6,
-            log_level="warning",
-            # Missing poll_interval, max_retries, latency_flush
-        )
-        
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = ConsumerConfigManager.create_from_args(args)
-            
-            assert config.batch_size == 6
-            assert config.log_level == "WARNING"
-            # Should use defaults for missing args
-            assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
-            assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
-            assert config.latency_flush_every == ConsumerConfigManager.DEFAULT_LATENCY_FLUSH_EVERY
-
-    def test_create_from_args_with_none_values(self):
-        """Test creating configuration from args with None values."""
-        args = SimpleNamespace(
-            batch_size=None,
-            poll_interval=2.0,
-            max_retries=None,
-            log_level=None,
-            latency_flush=50,
-        )
-        
-        with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-            config = ConsumerConfigManager.create_from_args(args)
-            
-            # None values should be ignored, defaults used
-            assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
-            assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
-            assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
-            # Non-None values should be used
-            assert config.poll_interval == pytest.approx(2.0)
-            assert config.latency_flush_every == 50
-
-    def test_create_from_args_case_insensitive_log_level(self):
-        """Test that log level is properly uppercased."""
-        test_cases = ["debug", "INFO", "Warning", "ERROR", "critical"]
-        expected = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        
-        for input_level, expected_level in zip(test_cases, expected):
-            args = SimpleNamespace(log_level=input_level)
-            
-            with patch.dict(os.environ, {"SQS_QUEUE_URL": "https://test-queue.amazonaws.com"}, clear=True):
-                config = ConsumerConfigManager.create_from_args(args)
-                assert config.log_level == expected_level
\ No newline at end of file
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("batch_size", 1),
+        ("batch_size", 10),
+        ("poll_interval", 0.0),
+        ("max_retries", 0),
+    ],
+)
+def test_validation_accepts_boundary_value(valid_config_data, field, value):
+    """Test validation accepts the inclusive limits of each range."""
+    config = ConsumerConfig(**{**valid_config_data, field: value})
+    config.validate()  # Should not raise
+
+
+_CONFIG_ENV_VARS = (
+    "SQS_QUEUE_URL",
+    "SQS_BATCH_SIZE",
+    "SQS_CONSUMER_POLL_SEC",
+    "SQS_DELETION_MAX_RETRIES",
+    "SQS_WAIT_TIME_SECONDS",
+    "AWS_REGION",
+    "LATENCY_FLUSH_EVERY",
+    "LATENCY_OUTPUT_DIR",
+    "SLA_THRESHOLD_SECONDS",
+    "CONSUMER_LOG_FILE",
+    "LOG_LEVEL",
+)
+
+# Every test runs with those variables unset and load_dotenv stubbed out
+pytestmark = [
+    pytest.mark.config_env(
+        env_vars=_CONFIG_ENV_VARS,
+        load_dotenv="projects.can_data_platform.src.config.consumer_config.load_dotenv",
+    ),
+    pytest.mark.usefixtures("isolated_config_env"),
+]
+
+
+def _set_env(monkeypatch, env_vars):
+    """Set environment variables for the duration of a test."""
+    for name, value in env_vars.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Provide one ConsumerConfigManager for the module.
+
+    load_config reads os.environ on every call, so the instance holds no
+    per-test state.
+    """
+    return ConsumerConfigManager(load_env=False)
+
+
+def test_initialization_with_env_loading():
+    """Test manager initialization with environment loading."""
+    with patch('projects.can_data_platform.src.config.consumer_config.load_dotenv') as mock_load_dotenv:
+        _ = ConsumerConfigManager(load_env=True)
+        mock_load_dotenv.assert_called_once()
+
+
+def test_initialization_without_env_loading():
+    """Test manager initialization without environment loading."""
+    with patch('projects.can_data_platform.src.config.consumer_config.load_dotenv') as mock_load_dotenv:
+        _ = ConsumerConfigManager(load_env=False)
+        mock_load_dotenv.assert_not_called()
+
+
+def test_load_config_with_defaults(manager, monkeypatch):
+    """Test loading configuration with default values."""
+    _set_env(monkeypatch, _ENV_BASE)
+    config = manager.load_config()
+
+    assert config.queue_url == _QUEUE
+    assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
+    assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
+    assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
+    assert config.max_wait_time == ConsumerConfigManager.DEFAULT_MAX_WAIT_TIME
+    assert config.aws_region == ConsumerConfigManager.DEFAULT_AWS_REGION
+    assert config.latency_flush_every == ConsumerConfigManager.DEFAULT_LATENCY_FLUSH_EVERY
+    assert config.latency_output_dir == ConsumerConfigManager.DEFAULT_LATENCY_OUTPUT_DIR
+    assert config.sla_threshold_seconds == ConsumerConfigManager.DEFAULT_SLA_THRESHOLD
+    assert config.log_file is None
+    assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
+
+
+def test_load_config_with_environment_variables(manager, monkeypatch):
+    """Test loading configuration from environment variables."""
+    env_vars = {
+        "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
+        "SQS_BATCH_SIZE": "7",
+        "SQS_CONSUMER_POLL_SEC": "2.5",
+        "SQS_DELETION_MAX_RETRIES": "5",
+        "SQS_WAIT_TIME_SECONDS": "15",
+        "AWS_REGION": "eu-west-1",
+        "LATENCY_FLUSH_EVERY": "75",
+        "LATENCY_OUTPUT_DIR": "/custom/metrics",
+        "SLA_THRESHOLD_SECONDS": "10.0",
+        "CONSUMER_LOG_FILE": "/custom/consumer.log",
+        "LOG_LEVEL": "WARNING",
+    }
+
+    _set_env(monkeypatch, env_vars)
+    config = manager.load_config()
+
+    assert config.queue_url == "https://env-queue.amazonaws.com"
+    assert config.batch_size == 7
+    assert config.poll_interval == 2.5
+    assert config.max_retries == 5
+    assert config.max_wait_time == 15
+    assert config.aws_region == "eu-west-1"
+    assert config.latency_flush_every == 75
+    assert config.latency_output_dir == "/custom/metrics"
+    assert config.sla_threshold_seconds == 10.0
+    assert config.log_file == "/custom/consumer.log"
+    assert config.log_level == "WARNING"
+
+
+def test_load_config_with_overrides(manager, monkeypatch):
+    """Test loading configuration with parameter overrides."""
+    _set_env(monkeypatch, _ENV_BASE)
+    config = manager.load_config(
+        batch_size=3,
+        poll_interval=0.5,
+        max_retries=2,
+        log_level="ERROR",
+    )
+
+    assert config.queue_url == _QUEUE
+    assert config.batch_size == 3
+    assert config.poll_interval == 0.5
+    assert config.max_retries == 2
+    assert config.log_level == "ERROR"
+    # Other values should be defaults
+    assert config.aws_region == ConsumerConfigManager.DEFAULT_AWS_REGION
+
+
+def test_load_config_overrides_take_precedence(manager, monkeypatch):
+    """Test that overrides take precedence over environment variables."""
+    env_vars = {
+        "SQS_QUEUE_URL": "https://env-queue.amazonaws.com",
+        "SQS_BATCH_SIZE": "8",
+        "LOG_LEVEL": "DEBUG",
+    }
+
+    _set_env(monkeypatch, env_vars)
+    config = manager.load_config(
+        batch_size=3,  # Override env var
+        log_level="ERROR",  # Override env var
+        aws_region="ap-south-1",  # Override default
+    )
+
+    assert config.queue_url == "https://env-queue.amazonaws.com"  # From env
+    assert config.batch_size == 3  # Override wins
+    assert config.log_level == "ERROR"  # Override wins
+    assert config.aws_region == "ap-south-1"  # Override wins
+
+
+def test_load_config_validation_failure(manager, monkeypatch):
+    """Test loading configuration with validation failure."""
+    _set_env(monkeypatch, {"SQS_QUEUE_URL": ""})
+    with pytest.raises(ValueError, match=_ERR_PATTERNS["queue_url_required"]):
+        manager.load_config()
+
+
+def test_load_config_integer_conversion(manager, monkeypatch):
+    """Test proper integer conversion from environment variables."""
+    env_vars = {
+        **_ENV_BASE,
+        "SQS_BATCH_SIZE": "5",
+        "SQS_DELETION_MAX_RETRIES": "3",
+        "SQS_WAIT_TIME_SECONDS": "20",
+        "LATENCY_FLUSH_EVERY": "100",
+    }
+
+    _set_env(monkeypatch, env_vars)
+    config = manager.load_config()
+
+    assert isinstance(config.batch_size, int)
+    assert isinstance(config.max_retries, int)
+    assert isinstance(config.max_wait_time, int)
+    assert isinstance(config.latency_flush_every, int)
+
+
+def test_load_config_float_conversion(manager, monkeypatch):
+    """Test proper float conversion from environment variables."""
+    env_vars = {
+        **_ENV_BASE,
+        "SQS_CONSUMER_POLL_SEC": "1.5",
+        "SLA_THRESHOLD_SECONDS": "7.5",
+    }
+
+    _set_env(monkeypatch, env_vars)
+    config = manager.load_config()
+
+    assert isinstance(config.poll_interval, float)
+    assert isinstance(config.sla_threshold_seconds, float)
+    assert config.poll_interval == 1.5
+    assert config.sla_threshold_seconds == 7.5
+
+
+def test_create_from_args_with_no_args(monkeypatch):
+    """Test creating configuration from args with no relevant attributes."""
+    args = SimpleNamespace()
+
+    _set_env(monkeypatch, _ENV_BASE)
+    config = ConsumerConfigManager.create_from_args(args)
+
+    # Should use defaults
+    assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
+    assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
+    assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
+    assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
+
+
+def test_create_from_args_with_all_args(monkeypatch):
+    """Test creating configuration from args with all relevant attributes."""
+    args = SimpleNamespace(
+        batch_size=4,
+        poll_interval=2.0,
+        max_retries=6,
+        log_level="debug",
+        latency_flush=150,
+    )
+
+    _set_env(monkeypatch, _ENV_BASE)
+    config = ConsumerConfigManager.create_from_args(args)
+
+    assert config.batch_size == 4
+    assert config.poll_interval == 2.0
+    assert config.max_retries == 6
+    assert config.log_level == "DEBUG"  # Should be uppercased
+    assert config.latency_flush_every == 150
+
+
+def test_create_from_args_with_partial_args(monkeypatch):
+    """Test creating configuration from args with some attributes."""
+    args = SimpleNamespace(
+        batch_size=6,
+        log_level="warning",
+        # Missing poll_interval, max_retries, latency_flush
+    )
+
+    _set_env(monkeypatch, _ENV_BASE)
+    config = ConsumerConfigManager.create_from_args(args)
+
+    assert config.batch_size == 6
+    assert config.log_level == "WARNING"
+    # Should use defaults for missing args
+    assert config.poll_interval == ConsumerConfigManager.DEFAULT_POLL_INTERVAL
+    assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
+    assert config.latency_flush_every == ConsumerConfigManager.DEFAULT_LATENCY_FLUSH_EVERY
+
+
+def test_create_from_args_with_none_values(monkeypatch):
+    """Test creating configuration from args with None values."""
+    args = SimpleNamespace(
+        batch_size=None,
+        poll_interval=2.0,
+        max_retries=None,
+        log_level=None,
+        latency_flush=50,
+    )
+
+    _set_env(monkeypatch, _ENV_BASE)
+    config = ConsumerConfigManager.create_from_args(args)
+
+    # None values should be ignored, defaults used
+    assert config.batch_size == ConsumerConfigManager.DEFAULT_BATCH_SIZE
+    assert config.max_retries == ConsumerConfigManager.DEFAULT_MAX_RETRIES
+    assert config.log_level == ConsumerConfigManager.DEFAULT_LOG_LEVEL
+    # Non-None values should be used
+    assert config.poll_interval == 2.0
+    assert config.latency_flush_every == 50
+
+
+@pytest.mark.parametrize(
+    "input_level, expected",
+    [
+        ("debug", "DEBUG"),
+        ("INFO", "INFO"),
+        ("Warning", "WARNING"),
+        ("ERROR", "ERROR"),
+        ("critical", "CRITICAL"),
+    ],
+)
+def test_create_from_args_case_insensitive_log_level(monkeypatch, input_level, expected):
+    """Test that log level is properly uppercased."""
+    _set_env(monkeypatch, _ENV_BASE)
+    args = SimpleNamespace(log_level=input_level)
+
+    config = ConsumerConfigManager.create_from_args(args)
+
+    assert config.log_level == expected
@@ -11,472 +11,908 @@ Tests all classes and methods in e2e_telemetry.py including:
 """
 
 import argparse
+import array
+import asyncio
+import io
 import json
-import logging
-import unittest
-from unittest.mock import Mock, patch
+import threading
+from types import SimpleNamespace
+from unittest.mock import ANY
+
+import pytest
+from botocore.exceptions import ClientError
 
 # Import the module under test
 import projects.can_data_platform.scripts.e2e_telemetry as e2e_telemetry
 
 
-class TestQueueMonitor(unittest.TestCase):
-    """Test QueueMonitor class for SQS queue monitoring."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-        self.monitor = e2e_telemetry.QueueMonitor(
-            queue_url=self.queue_url, aws_region="us-east-1"
-        )
-
-    @patch('boto3.client')
-    def test_get_queue_depth_success(self, mock_boto_client):
-        """Test successful queue depth retrieval."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.get_queue_attributes.return_value = {
-            'Attributes': {
-                'ApproximateNumberOfMessages': '5',
-                'ApproximateNumberOfMessagesNotVisible': '2',
-            }
-        }
+class _InMemoryFile(io.BytesIO):
+    """BytesIO that survives close() and counts write() calls."""
 
-        # Act
-        result = self.monitor.get_queue_depth()
-
-        # Assert
-        expected = {'available': 5, 'in_flight': 2, 'total': 7}
-        self.assertEqual(result, expected)
-        mock_boto_client.assert_called_once_with("sqs", region_name="us-east-1")
-        mock_sqs.get_queue_attributes.assert_called_once()
-
-    @patch('boto3.client')
-    def test_get_queue_depth_boto_error(self, mock_boto_client):
-        """Test queue depth retrieval with boto error."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.get_queue_attributes.side_effect = Exception("Connection error")
-
-        # Act
-        result = self.monitor.get_queue_depth()
-
-        # Assert
-        expected = {'available': 0, 'in_flight': 0, 'total': 0}
-        self.assertEqual(result, expected)
-
-    def test_queue_monitor_initialization(self):
-        """Test QueueMonitor proper initialization."""
-        # Act & Assert
-        self.assertEqual(self.monitor.queue_url, self.queue_url)
-        self.assertEqual(self.monitor.aws_region, "us-east-1")
-
-    def test_queue_monitor_default_region(self):
-        """Test QueueMonitor with default region."""
-        # Act
-        monitor = e2e_telemetry.QueueMonitor(queue_url=self.queue_url)
-
-        # Assert
-        self.assertEqual(monitor.aws_region, "us-east-1")
-
-
-class TestEventGenerator(unittest.TestCase):
-    """Test EventGenerator class for event generation and publishing."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.generator = e2e_telemetry.EventGenerator(num_modules=4)
-
-    def test_event_generator_initialization(self):
-        """Test EventGenerator proper initialization."""
-        # Act & Assert
-        self.assertEqual(self.generator.num_modules, 4)
-        self.assertEqual(self.generator.voltage_range, (3400, 4150))
-        self.assertEqual(self.generator.offset_range, (-40, 40))
-
-    def test_event_generator_default_modules(self):
-        """Test EventGenerator with default number of modules."""
-        # Act
-        generator = e2e_telemetry.EventGenerator()
-
-        # Assert
-        self.assertEqual(generator.num_modules, 4)
-
-    @patch('random.randint')
-    @patch('time.time')
-    def test_generate_events(self, mock_time, mock_randint):
-        """Test event generation with mocked random values."""
-        # Arrange
-        mock_time.return_value = 1640995200.0  # Fixed timestamp
-        mock_randint.side_effect = [
-            10,
-            20,
-            30,
-            40,  # module offsets
-            3500,
-            3600,
-            3700,
-            3800,
-        ]  # voltages
-
-        # Act
-        events = self.generator.generate_events(num_events=1)
-
-        # Assert
-        self.assertEqual(len(events), 1)
-        event = events[0]
-        self.assertEqual(event['timestamp'], 1640995200.0)
-        self.assertEqual(event['epoch_timestamp'], 1640995200000)
-        self.assertIn('Cell1Voltage', event)
-        self.assertIn('Cell2Voltage', event)
-        self.assertIn('Cell3Voltage', event)
-        self.assertIn('Cell4Voltage', event)
-        self.assertIn('min_voltage', event)
-        self.assertIn('max_voltage', event)
-        self.assertIn('avg_voltage', event)
-
-    @patch('builtins.open', create=True)
-    def test_save_events_to_file(self, mock_open):
-        """Test saving events to file."""
-        # Arrange
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        events = [{'test': 'event1'}, {'test': 'event2'}]
-
-        # Act
-        self.generator.save_events_to_file(events, '/tmp/test.jsonl')
-
-        # Assert
-        mock_open.assert_called_once_with('/tmp/test.jsonl', 'a')
-        self.assertEqual(mock_file.write.call_count, 2)
-
-    @patch('boto3.client')
-    def test_publish_to_sqs_success(self, mock_boto_client):
-        """Test successful SQS message publishing."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.send_message_batch.return_value = {
-            'Successful': [{'Id': '0'}, {'Id': '1'}],
-            'Failed': [],
-        }
+    def __init__(self):
+        super().__init__()
+        self.write_count = 0
 
-        events = [{'test': 'event1'}, {'test': 'event2'}]
-        queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-
-        # Act
-        result = self.generator.publish_to_sqs(events, queue_url)
-
-        # Assert
-        self.assertEqual(result['events_published'], 2)
-        self.assertEqual(result['publish_failures'], 0)
-        self.assertEqual(result['total_events'], 2)
-
-    @patch('boto3.client')
-    def test_publish_to_sqs_with_failures(self, mock_boto_client):
-        """Test SQS publishing with some failures."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.send_message_batch.return_value = {
-            'Successful': [{'Id': '0'}],
-            'Failed': [{'Id': '1'}],
-        }
+    def write(self, data):
+        self.write_count += 1
+        return super().write(data)
 
-        events = [{'test': 'event1'}, {'test': 'event2'}]
-        queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
+    def close(self):
+        """Keep the buffer readable after the writer's with-block exits."""
 
-        # Act
-        result = self.generator.publish_to_sqs(events, queue_url)
 
-        # Assert
-        self.assertEqual(result['events_published'], 1)
-        self.assertEqual(result['publish_failures'], 1)
-        self.assertEqual(result['total_events'], 2)
+class _InMemoryFiles:
+    """Replacement for builtins.open that keeps each file in memory."""
 
+    def __init__(self):
+        self.files = {}
+        self.opened = []
 
-class TestMessageProcessor(unittest.TestCase):
-    """Test MessageProcessor class for message processing logic."""
+    def open(self, path, mode='r', *args, **kwargs):
+        """Record the call and return the (reused) buffer for path."""
+        self.opened.append((path, mode))
+        return self.files.setdefault(path, _InMemoryFile())
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = e2e_telemetry.MessageProcessor()
+    def records(self, path):
+        """Decode every JSONL line written to path."""
+        return [json.loads(line) for line in self.files[path].getvalue().splitlines()]
 
-    def test_message_processor_initialization(self):
-        """Test MessageProcessor proper initialization."""
-        # Act & Assert
-        self.assertEqual(self.processor.processed_count, 0)
-        self.assertEqual(self.processor.processing_times, [])
-        self.assertEqual(self.processor.e2e_latencies, [])
 
-    def test_process_message_valid_json(self):
-        """Test processing valid JSON message."""
-        # Arrange
-        message_body = json.dumps(
-            {
-                'timestamp': 1640995200.0,
-                'Cell1Voltage': 3500,
-                'Cell2Voltage': 3600,
-                'avg_voltage': 3550,
-            }
-        )
-
-        # Act
-        result = self.processor.process_message(message_body)
-
-        # Assert
-        self.assertEqual(result['status'], 'success')
-        self.assertIn('processed_data', result)
-        processed_data = result['processed_data']
-        self.assertEqual(processed_data['message_id'], 0)
-        self.assertEqual(processed_data['cell_count'], 2)
-        self.assertEqual(processed_data['avg_voltage'], 3550)
-        self.assertIsNotNone(processed_data['e2e_latency'])
-
-    def test_process_message_invalid_json(self):
-        """Test processing invalid JSON message."""
-        # Arrange
-        message_body = "invalid json {{"
-
-        # Act
-        result = self.processor.process_message(message_body)
-
-        # Assert
-        self.assertEqual(result['status'], 'error')
-        self.assertIn('error', result)
-
-    def test_process_message_without_timestamp(self):
-        """Test processing message without timestamp."""
-        # Arrange
-        message_body = json.dumps({'Cell1Voltage': 3500, 'avg_voltage': 3550})
-
-        # Act
-        result = self.processor.process_message(message_body)
-
-        # Assert
-        self.assertEqual(result['status'], 'success')
-        processed_data = result['processed_data']
-        self.assertIsNone(processed_data['e2e_latency'])
-
-    def test_get_stats_empty(self):
-        """Test getting stats when no messages processed."""
-        # Act
-        stats = self.processor.get_stats()
-
-        # Assert
-        expected = {
-            'messages_processed': 0,
-            'avg_processing_time': 0,
-            'total_processing_time': 0,
+_QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
+
+
+def test_get_queue_depth_success(sqs_client):
+    """Test successful queue depth retrieval."""
+    # Arrange
+    sqs_client.get_queue_attributes.return_value = {
+        'Attributes': {
+            'ApproximateNumberOfMessages': '5',
+            'ApproximateNumberOfMessagesNotVisible': '2',
         }
-        self.assertEqual(stats, expected)
-
-    def test_get_stats_with_data(self):
-        """Test getting stats after processing messages."""
-        # Arrange
-        message_body = json.dumps({'timestamp': 1640995200.0, 'test': 'data'})
-        self.processor.process_message(message_body)
-
-        # Act
-        stats = self.processor.get_stats()
-
-        # Assert
-        self.assertEqual(stats['messages_processed'], 1)
-        self.assertGreater(stats['avg_processing_time'], 0)
-        self.assertIn('messages_with_latency', stats)
-        self.assertIn('avg_e2e_latency', stats)
-
-    @patch('builtins.open', create=True)
-    def test_save_processing_metrics(self, mock_open):
-        """Test saving processing metrics to file."""
-        # Arrange
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
-
-        processed_messages = [
-            {
-                'processing_timestamp': 1640995200.0,
-                'message_id': 0,
-                'e2e_latency': 0.1,
-                'processing_time': 0.01,
-                'cell_count': 2,
-                'avg_voltage': 3550,
-                'original_data': {'test': 'data'},
-            }
+    }
+    monitor = e2e_telemetry.QueueMonitor(queue_url=_QUEUE_URL, aws_region="us-east-1")
+
+    # Act
+    result = monitor.get_queue_depth()
+
+    # Assert
+    assert result == {'available': 5, 'in_flight': 2, 'total': 7}
+    e2e_telemetry._sqs_client.assert_called_once_with("us-east-1")
+    sqs_client.get_queue_attributes.assert_called_once()
+
+
+def test_client_is_cached_across_calls(mocker):
+    """Test one SQS client is built and shared per region."""
+    # Arrange
+    e2e_telemetry._sqs_client.cache_clear()
+    mock_boto_client = mocker.patch('boto3.client')
+    mock_boto_client.return_value.get_queue_attributes.return_value = {}
+    monitor = e2e_telemetry.QueueMonitor(queue_url=_QUEUE_URL)
+
+    # Act
+    try:
+        monitor.get_queue_depth()
+        monitor.get_queue_depth()
+        consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+    finally:
+        e2e_telemetry._sqs_client.cache_clear()
+
+    # Assert
+    mock_boto_client.assert_called_once_with("sqs", region_name="us-east-1", config=ANY)
+    assert consumer.sqs is mock_boto_client.return_value
+
+
+def test_client_config_keeps_connections_alive(mocker):
+    """Test the shared client pools keep-alive connections with retries."""
+    # Arrange
+    e2e_telemetry._sqs_client.cache_clear()
+    mock_boto_client = mocker.patch('boto3.client')
+
+    # Act
+    try:
+        e2e_telemetry._sqs_client("eu-west-1")
+    finally:
+        e2e_telemetry._sqs_client.cache_clear()
+
+    # Assert
+    config = mock_boto_client.call_args.kwargs['config']
+    assert config.tcp_keepalive is True
+    assert config.max_pool_connections == 32
+    assert config.retries == {"max_attempts": 3, "mode": "adaptive"}
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_jsonl_bytes_match_across_json_backends(backend, monkeypatch):
+    """Test orjson and the stdlib fallback write byte-identical JSONL."""
+    # Arrange
+    if backend == "orjson":
+        dumps = pytest.importorskip("orjson").dumps
+    else:
+        dumps = e2e_telemetry._stdlib_json_dumps
+    monkeypatch.setattr(e2e_telemetry, "_json_dumps", dumps)
+    records = [
+        {'timestamp': 1.5, 'Cell1Voltage': 3500, 'module_offsets': [10.0, -2.0]},
+        {'note': 'Zelle \u00fc', 'flag': True, 'missing': None},
+    ]
+
+    # Act
+    payload = e2e_telemetry._to_jsonl(records)
+
+    # Assert
+    assert payload == (
+        b'{"timestamp":1.5,"Cell1Voltage":3500,"module_offsets":[10.0,-2.0]}\n'
+        b'{"note":"Zelle \xc3\xbc","flag":true,"missing":null}\n'
+    )
+
+
+def test_get_queue_depth_boto_error(sqs_client):
+    """Test queue depth retrieval with boto error."""
+    # Arrange
+    sqs_client.get_queue_attributes.side_effect = ClientError(
+        {'Error': {'Code': 'AWS.SimpleQueueService.NonExistentQueue'}},
+        'GetQueueAttributes',
+    )
+    monitor = e2e_telemetry.QueueMonitor(queue_url=_QUEUE_URL)
+
+    # Act
+    result = monitor.get_queue_depth()
+
+    # Assert
+    assert result == {'available': 0, 'in_flight': 0, 'total': 0}
+
+
+def test_queue_monitor_initialization():
+    """Test QueueMonitor proper initialization."""
+    # Act
+    monitor = e2e_telemetry.QueueMonitor(queue_url=_QUEUE_URL, aws_region="us-east-1")
+
+    # Assert
+    assert monitor.queue_url == _QUEUE_URL
+    assert monitor.aws_region == "us-east-1"
+
+
+def test_queue_monitor_default_region():
+    """Test QueueMonitor with default region."""
+    # Act
+    monitor = e2e_telemetry.QueueMonitor(queue_url=_QUEUE_URL)
+
+    # Assert
+    assert monitor.aws_region == "us-east-1"
+
+
+@pytest.fixture
+def generator():
+    """Provide a fresh four-module EventGenerator."""
+    return e2e_telemetry.EventGenerator(num_modules=4)
+
+
+@pytest.fixture
+def fixed_draws(mocker):
+    """Pin the clock and patch the random draws EventGenerator makes.
+
+    Returns:
+        SimpleNamespace: ``randint`` and ``choices`` mocks for the test to set.
+    """
+    mocker.patch('time.time', return_value=1640995200.0)
+    return SimpleNamespace(
+        randint=mocker.patch('random.randint'),
+        choices=mocker.patch('random.choices'),
+    )
+
+
+def test_event_generator_initialization(generator):
+    """Test EventGenerator proper initialization."""
+    # Act & Assert
+    assert generator.num_modules == 4
+    assert generator.voltage_range == (3400, 4150)
+    assert generator.offset_range == (-40, 40)
+
+
+def test_event_generator_default_modules():
+    """Test EventGenerator with default number of modules."""
+    # Act
+    generator = e2e_telemetry.EventGenerator()
+
+    # Assert
+    assert generator.num_modules == 4
+
+
+def test_generate_events(generator, fixed_draws):
+    """Test event generation with mocked random values."""
+    # Arrange
+    fixed_draws.randint.side_effect = [10, 20, 30, 40]  # module offsets
+    fixed_draws.choices.return_value = [3500, 3600, 3700, 3800]  # voltages
+
+    # Act
+    events = generator.generate_events(num_events=1)
+
+    # Assert
+    assert len(events) == 1
+    event = events[0]
+    assert event['timestamp'] == 1640995200.0
+    assert event['epoch_timestamp'] == 1640995200000
+    for key in (
+        'Cell1Voltage',
+        'Cell2Voltage',
+        'Cell3Voltage',
+        'Cell4Voltage',
+        'min_voltage',
+        'max_voltage',
+        'avg_voltage',
+    ):
+        assert key in event
+    assert event['Cell1Voltage'] == 3510
+    assert event['Cell4Voltage'] == 3840
+    assert event['min_voltage'] == 3510
+    assert event['max_voltage'] == 3840
+    assert event['avg_voltage'] == 3675
+    assert event['module_offsets'] == [10.0, 20.0, 30.0, 40.0]
+    fixed_draws.choices.assert_called_once_with(range(3400, 4151), k=4)
+
+
+@pytest.mark.parametrize(
+    "voltages", [[3600], [3800, 3500, 3900, 3500], [4100, 4000, 3437, 3438]]
+)
+def test_voltage_stats_single_pass(voltages):
+    """Test the fused reduction matches min, max and rounded mean."""
+    assert e2e_telemetry._voltage_stats(voltages) == (
+        min(voltages),
+        max(voltages),
+        round(sum(voltages) / len(voltages)),
+    )
+
+
+def test_generate_events_draw_order(generator, fixed_draws):
+    """Test the flat voltage draw is split into rows in event order."""
+    # Arrange
+    fixed_draws.randint.return_value = 0
+    fixed_draws.choices.return_value = list(range(3500, 3580, 10))
+
+    # Act
+    events = generator.generate_events(num_events=2)
+
+    # Assert
+    assert [event[f'Cell{i}Voltage'] for event in events for i in range(1, 5)] == (
+        list(range(3500, 3580, 10))
+    )
+
+
+def test_generate_events_bytes_mode(generator, fixed_draws):
+    """Test bytes mode yields JSON-encoded copies of the dict events."""
+    # Arrange
+    offsets = [10, 20, 30, 40]
+    fixed_draws.choices.return_value = [3500, 3600, 3700, 3800]
+
+    # Act
+    fixed_draws.randint.side_effect = list(offsets)
+    events = generator.generate_events(num_events=1)
+    fixed_draws.randint.side_effect = list(offsets)
+    encoded = generator.generate_events(num_events=1, as_bytes=True)
+
+    # Assert
+    assert isinstance(encoded[0], bytes)
+    assert json.loads(encoded[0]) == events[0]
+    assert encoded[0] == (
+        b'{"timestamp":1640995200.0,"epoch_timestamp":1640995200000,'
+        b'"Cell1Voltage":3510,"Cell2Voltage":3620,"Cell3Voltage":3730,'
+        b'"Cell4Voltage":3840,"min_voltage":3510,"max_voltage":3840,'
+        b'"avg_voltage":3675,"module_offsets":[10.0,20.0,30.0,40.0]}'
+    )
+
+
+def test_publish_to_sqs_accepts_encoded_events(generator, sqs_client):
+    """Test pre-encoded events are sent as-is in the message body."""
+    # Arrange
+    sqs_client.send_message_batch.return_value = {
+        'Successful': [{'Id': '0'}],
+        'Failed': [],
+    }
+    body = b'{"test":"event1"}'
+
+    # Act
+    result = generator.publish_to_sqs([body], _QUEUE_URL)
+
+    # Assert
+    assert result['events_published'] == 1
+    entries = sqs_client.send_message_batch.call_args.kwargs['Entries']
+    assert entries == [{'Id': '0', 'MessageBody': body.decode()}]
+
+
+def test_save_events_to_file(generator, mocker):
+    """Test saving events to file."""
+    # Arrange
+    events = [{'test': 'event1'}, {'test': 'event2'}]
+    files = _InMemoryFiles()
+    mocker.patch('builtins.open', files.open)
+
+    # Act
+    generator.save_events_to_file(events, '/tmp/test.jsonl')
+
+    # Assert
+    assert files.opened == [('/tmp/test.jsonl', 'ab')]
+    assert files.files['/tmp/test.jsonl'].write_count == 1
+    assert files.records('/tmp/test.jsonl') == events
+
+
+def test_publish_to_sqs_success(generator, sqs_client):
+    """Test successful SQS message publishing."""
+    # Arrange
+    sqs_client.send_message_batch.return_value = {
+        'Successful': [{'Id': '0'}, {'Id': '1'}],
+        'Failed': [],
+    }
+    events = [{'test': 'event1'}, {'test': 'event2'}]
+
+    # Act
+    result = generator.publish_to_sqs(events, _QUEUE_URL)
+
+    # Assert
+    assert result['events_published'] == 2
+    assert result['publish_failures'] == 0
+    assert result['total_events'] == 2
+    sqs_client.send_message_batch.assert_called_once()
+
+
+def test_publish_to_sqs_with_failures(generator, sqs_client):
+    """Test SQS publishing with some failures."""
+    # Arrange
+    sqs_client.send_message_batch.return_value = {
+        'Successful': [{'Id': '0'}],
+        'Failed': [{'Id': '1'}],
+    }
+    events = [{'test': 'event1'}, {'test': 'event2'}]
+
+    # Act
+    result = generator.publish_to_sqs(events, _QUEUE_URL)
+
+    # Assert
+    assert result['events_published'] == 1
+    assert result['publish_failures'] == 1
+    assert result['total_events'] == 2
+    sqs_client.send_message_batch.assert_called_once()
+
+
+def test_publish_to_sqs_multiple_batches(generator, sqs_client):
+    """Test SQS publishing splits events into batches of 10."""
+    # Arrange
+    sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+        'Successful': Entries[1:],
+        'Failed': Entries[:1],
+    }
+    events = [{'test': f'event{i}'} for i in range(25)]
+
+    # Act
+    result = generator.publish_to_sqs(events, _QUEUE_URL)
+
+    # Assert
+    assert sqs_client.send_message_batch.call_count == 3
+    batch_sizes = sorted(
+        len(c.kwargs['Entries']) for c in sqs_client.send_message_batch.call_args_list
+    )
+    assert batch_sizes == [5, 10, 10]
+    assert result['events_published'] == 22
+    assert result['publish_failures'] == 3
+    assert result['total_events'] == 25
+    e2e_telemetry._sqs_client.assert_called_once()
+
+
+def test_publish_to_sqs_batch_client_error(generator, sqs_client):
+    """Test an AWS error in one batch only fails that batch."""
+
+    # Arrange
+    def send_message_batch(QueueUrl, Entries):
+        if 'event10' in Entries[0]['MessageBody']:
+            raise ClientError(
+                {'Error': {'Code': 'AWS.SimpleQueueService.Throttling'}},
+                'SendMessageBatch',
+            )
+        return {'Successful': Entries, 'Failed': []}
+
+    sqs_client.send_message_batch.side_effect = send_message_batch
+    events = [{'test': f'event{i}'} for i in range(25)]
+
+    # Act
+    result = generator.publish_to_sqs(events, _QUEUE_URL)
+
+    # Assert
+    assert sqs_client.send_message_batch.call_count == 3
+    assert result['events_published'] == 15
+    assert result['publish_failures'] == 10
+    assert result['total_events'] == 25
+
+
+@pytest.fixture
+def processor():
+    """Provide a fresh MessageProcessor."""
+    return e2e_telemetry.MessageProcessor()
+
+
+@pytest.fixture
+def shape_cache():
+    """Start and end the test with an empty _shape_cells cache."""
+    e2e_telemetry._shape_cells.cache_clear()
+    yield e2e_telemetry._shape_cells
+    e2e_telemetry._shape_cells.cache_clear()
+
+
+def test_message_processor_initialization(processor):
+    """Test MessageProcessor proper initialization."""
+    # Act & Assert
+    assert processor.processed_count == 0
+    assert isinstance(processor.processing_times, array.array)
+    assert processor.processing_times.typecode == 'd'
+    assert len(processor.processing_times) == 0
+    assert processor.sample_capacity == 10_000
+    assert processor.latency_count == 0
+
+
+def test_process_message_valid_json(processor):
+    """Test processing valid JSON message."""
+    # Arrange
+    message_body = json.dumps(
+        {
+            'timestamp': 1640995200.0,
+            'Cell1Voltage': 3500,
+            'Cell2Voltage': 3600,
+            'avg_voltage': 3550,
+        }
+    )
+
+    # Act
+    result = processor.process_message(message_body)
+
+    # Assert
+    assert result['status'] == 'success'
+    assert 'processed_data' in result
+    processed_data = result['processed_data']
+    assert processed_data['message_id'] == 0
+    assert processed_data['cell_count'] == 2
+    assert processed_data['avg_voltage'] == 3550
+    assert processed_data['e2e_latency'] is not None
+
+
+def test_process_message_invalid_json(processor):
+    """Test processing invalid JSON message."""
+    # Act
+    result = processor.process_message("invalid json {{")
+
+    # Assert
+    assert result['status'] == 'error'
+    assert 'error' in result
+
+
+@pytest.mark.parametrize("message_body", ['[1,2]', '42', '"text"', 'null'])
+def test_process_message_non_object_json(processor, message_body):
+    """Test valid JSON that is not an object is rejected, not raised."""
+    # Act
+    result = processor.process_message(message_body)
+
+    # Assert
+    assert result['status'] == 'error'
+    assert 'JSON object' in result['error']
+    assert processor.processed_count == 0
+
+
+def test_process_message_without_timestamp(processor):
+    """Test processing message without timestamp."""
+    # Arrange
+    message_body = json.dumps({'Cell1Voltage': 3500, 'avg_voltage': 3550})
+
+    # Act
+    result = processor.process_message(message_body)
+
+    # Assert
+    assert result['status'] == 'success'
+    assert result['processed_data']['e2e_latency'] is None
+
+
+def test_process_message_accepts_bytes(processor):
+    """Test processing a raw bytes body gives the same result as str."""
+    # Arrange
+    payload = {'Cell1Voltage': 3500, 'avg_voltage': 3550}
+
+    # Act
+    from_str = processor.process_message(json.dumps(payload))
+    from_bytes = processor.process_message(json.dumps(payload).encode())
+
+    # Assert
+    assert from_bytes['status'] == 'success'
+    assert (
+        from_bytes['processed_data']['original_data']
+        == from_str['processed_data']['original_data']
+    )
+
+
+def test_process_message_concurrent_updates_are_not_lost(mocker):
+    """Test worker threads never lose or duplicate counter updates."""
+    # Arrange
+    processor = e2e_telemetry.MessageProcessor(sample_capacity=64)
+    body = json.dumps({'timestamp': 1.0, 'Cell1Voltage': 3500})
+    mocker.patch.object(e2e_telemetry.logger, 'info')
+
+    def work():
+        for _ in range(200):
+            processor.process_message(body)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    stats = processor.get_stats()
+    assert stats['messages_processed'] == 1600
+    assert stats['messages_with_latency'] == 1600
+    assert len(processor.processing_times) == 64
+    assert processor._next_sample == 1600 % 64
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (b'{"timestamp":1.5,"Cell1Voltage":3500,"Cell2Voltage":3600}', 2),
+        (b'{"Cell1Voltage":3500,"PackVoltage":7100,"avg_voltage":3500}', 1),
+        (b'{"timestamp":1.5,"note":"Voltage"}', 0),
+        (b'{"avg_voltage":3500}', 0),
+    ],
+)
+def test_fast_extract_counts_cells(body, expected):
+    """Test the decode fast path counts only CellNVoltage keys."""
+    # Act
+    data, timestamp, cell_count = e2e_telemetry._fast_extract(body)
+
+    # Assert
+    assert cell_count == expected
+    assert data == json.loads(body)
+    assert timestamp == data.get('timestamp')
+
+
+def test_shape_cache_hit(processor, shape_cache):
+    """Test repeated message shapes reuse the cached cell count."""
+    # Arrange
+    body = json.dumps({'timestamp': 1.5, 'Cell1Voltage': 3500, 'avg_voltage': 1})
+
+    # Act
+    results = [processor.process_message(body) for _ in range(100)]
+
+    # Assert
+    assert results[-1]['processed_data']['cell_count'] == 1
+    cache_info = shape_cache.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits >= 99
+
+
+def test_get_stats_empty(processor):
+    """Test getting stats when no messages processed."""
+    # Act
+    stats = processor.get_stats()
+
+    # Assert
+    assert stats == {
+        'messages_processed': 0,
+        'avg_processing_time': 0,
+        'total_processing_time': 0,
+    }
+
+
+def test_get_stats_with_data(processor):
+    """Test getting stats after processing messages."""
+    # Arrange
+    processor.process_message(json.dumps({'timestamp': 1640995200.0, 'test': 'data'}))
+
+    # Act
+    stats = processor.get_stats()
+
+    # Assert
+    assert stats['messages_processed'] == 1
+    assert stats['avg_processing_time'] > 0
+    assert 'messages_with_latency' in stats
+    assert 'avg_e2e_latency' in stats
+    assert 'p99_processing_time' in stats
+
+
+def test_get_stats_aggregates_beyond_sample_window():
+    """Test totals cover every message while p99 uses the recent window."""
+    # Arrange
+    processor = e2e_telemetry.MessageProcessor(sample_capacity=2)
+    for timestamp in (10.0, 20.0, 30.0):
+        processor.process_message(json.dumps({'timestamp': timestamp}))
+
+    # Act
+    stats = processor.get_stats()
+
+    # Assert
+    assert stats['messages_processed'] == 3
+    assert stats['messages_with_latency'] == 3
+    assert len(processor.processing_times) == 2
+    assert stats['min_e2e_latency'] > 0
+    assert stats['max_e2e_latency'] - stats['min_e2e_latency'] == pytest.approx(
+        20.0, abs=0.005
+    )
+
+
+def test_save_processing_metrics(processor, mocker):
+    """Test saving processing metrics to file."""
+    # Arrange
+    processed_messages = [
+        {
+            'processing_timestamp': 1640995200.0,
+            'message_id': 0,
+            'e2e_latency': 0.1,
+            'processing_time': 0.01,
+            'cell_count': 2,
+            'avg_voltage': 3550,
+            'original_data': {'test': 'data'},
+        }
+    ]
+    files = _InMemoryFiles()
+    mocker.patch('builtins.open', files.open)
+
+    # Act
+    processor.save_processing_metrics(processed_messages, '/tmp/test.jsonl')
+
+    # Assert
+    assert files.opened == [('/tmp/test.jsonl', 'ab')]
+    assert files.files['/tmp/test.jsonl'].write_count == 1
+    records = files.records('/tmp/test.jsonl')
+    assert len(records) == 1
+    assert records[0]['message_id'] == 0
+    assert records[0]['original_event'] == {'test': 'data'}
+
+
+def test_concurrent_consumer_initialization(sqs_client):
+    """Test ConcurrentConsumer proper initialization."""
+    # Act
+    consumer = e2e_telemetry.ConcurrentConsumer(
+        queue_url=_QUEUE_URL, aws_region="us-east-1", max_workers=2
+    )
+
+    # Assert
+    assert consumer.queue_url == _QUEUE_URL
+    assert consumer.aws_region == "us-east-1"
+    assert consumer.max_workers == 2
+    assert consumer.receivers == 1
+    assert consumer._receive_pool is None
+    assert consumer.wait_time_seconds == 0
+    assert isinstance(consumer.processor, e2e_telemetry.MessageProcessor)
+    assert consumer.sqs is sqs_client
+
+
+def test_receive_messages_success(sqs_client):
+    """Test successful message receiving."""
+    # Arrange
+    sqs_client.receive_message.return_value = {
+        'Messages': [
+            {'Body': '{"test": "message1"}', 'ReceiptHandle': 'handle1'},
+            {'Body': '{"test": "message2"}', 'ReceiptHandle': 'handle2'},
         ]
+    }
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL, receivers=1)
+
+    # Act
+    messages = consumer._receive_messages()
+
+    # Assert
+    assert len(messages) == 2
+    assert messages[0]['Body'] == '{"test": "message1"}'
+    sqs_client.receive_message.assert_called_once_with(
+        QueueUrl=_QUEUE_URL,
+        MaxNumberOfMessages=10,
+        WaitTimeSeconds=0,
+        MessageAttributeNames=['All'],
+    )
+
+
+def test_receive_messages_merges_concurrent_polls(sqs_client):
+    """Test each receiver polls once and all results land in one batch."""
+    # Arrange
+    sqs_client.receive_message.return_value = {
+        'Messages': [{'Body': '{}', 'ReceiptHandle': 'handle'}] * 10
+    }
+    consumer = e2e_telemetry.ConcurrentConsumer(
+        queue_url=_QUEUE_URL, receivers=3, wait_time_seconds=20
+    )
+    pool = consumer._receive_pool
+
+    # Act
+    messages = consumer._receive_messages()
+    consumer._receive_messages()
+    consumer.close()
+
+    # Assert
+    assert len(messages) == 30
+    assert sqs_client.receive_message.call_count == 6
+    assert sqs_client.receive_message.call_args.kwargs['WaitTimeSeconds'] == 20
+    # One pool serves every batch and is shut down by close()
+    assert consumer._receive_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+
+
+def test_receive_messages_failed_poll_leaves_nothing_behind(sqs_client):
+    """Test a failed poll does not leak sibling messages into the next batch."""
+    # Arrange
+    sqs_client.receive_message.side_effect = [
+        {'Messages': [{'Body': '{}', 'ReceiptHandle': 'stale'}]},
+        ClientError({'Error': {'Code': 'OverLimit'}}, 'ReceiveMessage'),
+    ]
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL, receivers=2)
+
+    # Act / Assert
+    with pytest.raises(ClientError):
+        consumer._receive_messages()
+
+    sqs_client.receive_message.side_effect = None
+    assert consumer._receive_messages() == []
+    consumer.close()
+
+
+def test_receive_messages_no_messages(sqs_client):
+    """Test receiving when no messages available."""
+    # Arrange
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act
+    messages = consumer._receive_messages()
+
+    # Assert
+    assert len(messages) == 0
+
+
+def test_delete_message_success(sqs_client):
+    """Test successful message deletion."""
+    # Arrange
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act
+    result = consumer._delete_message("test-receipt-handle")
+
+    # Assert
+    assert result
+    sqs_client.delete_message.assert_called_once_with(
+        QueueUrl=_QUEUE_URL, ReceiptHandle="test-receipt-handle"
+    )
+
+
+def test_delete_messages_batch_groups_of_10(sqs_client):
+    """Test batch deletion sends at most 10 receipt handles per call."""
+    # Arrange
+    sqs_client.delete_message_batch.side_effect = lambda QueueUrl, Entries: {
+        'Successful': [{'Id': entry['Id']} for entry in Entries]
+    }
+    handles = [f"handle-{i}" for i in range(23)]
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act
+    deleted = consumer._delete_messages_batch(handles)
+
+    # Assert
+    assert deleted == 23
+    calls = sqs_client.delete_message_batch.call_args_list
+    assert [len(c.kwargs['Entries']) for c in calls] == [10, 10, 3]
+    assert [
+        entry['ReceiptHandle'] for c in calls for entry in c.kwargs['Entries']
+    ] == handles
+
+
+def test_delete_messages_batch_client_error_fails_only_that_group(sqs_client):
+    """Test an AWS error on one delete group still counts the other groups."""
+    # Arrange
+    sqs_client.delete_message_batch.side_effect = [
+        {'Successful': [{'Id': str(i)} for i in range(10)]},
+        ClientError({'Error': {'Code': 'ReceiptHandleIsInvalid'}}, 'DeleteMessageBatch'),
+        {'Successful': [{'Id': str(i)} for i in range(3)]},
+    ]
+    handles = [f"handle-{i}" for i in range(23)]
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act
+    deleted = consumer._delete_messages_batch(handles)
+
+    # Assert
+    assert deleted == 13
+    assert sqs_client.delete_message_batch.call_count == 3
+
+
+def test_delete_message_client_error(sqs_client):
+    """Test single-message deletion reports an AWS error as a failure."""
+    # Arrange
+    sqs_client.delete_message.side_effect = ClientError(
+        {'Error': {'Code': 'ReceiptHandleIsInvalid'}}, 'DeleteMessage'
+    )
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act / Assert
+    assert not consumer._delete_message("test-receipt-handle")
 
-        # Act
-        self.processor.save_processing_metrics(processed_messages, '/tmp/test.jsonl')
-
-        # Assert
-        mock_open.assert_called_once_with('/tmp/test.jsonl', 'a')
-        mock_file.write.assert_called_once()
-
-
-class TestConcurrentConsumer(unittest.TestCase):
-    """Test ConcurrentConsumer class for concurrent SQS message consumption."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
-
-    @patch('boto3.client')
-    def test_concurrent_consumer_initialization(self, mock_boto_client):
-        """Test ConcurrentConsumer proper initialization."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-
-        # Act
-        consumer = e2e_telemetry.ConcurrentConsumer(
-            queue_url=self.queue_url, aws_region="us-east-1", max_workers=2
-        )
-
-        # Assert
-        self.assertEqual(consumer.queue_url, self.queue_url)
-        self.assertEqual(consumer.aws_region, "us-east-1")
-        self.assertEqual(consumer.max_workers, 2)
-        self.assertIsInstance(consumer.processor, e2e_telemetry.MessageProcessor)
-
-    @patch('boto3.client')
-    def test_receive_messages_success(self, mock_boto_client):
-        """Test successful message receiving."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.receive_message.return_value = {
-            'Messages': [
-                {'Body': '{"test": "message1"}', 'ReceiptHandle': 'handle1'},
-                {'Body': '{"test": "message2"}', 'ReceiptHandle': 'handle2'},
-            ]
-        }
 
-        consumer = e2e_telemetry.ConcurrentConsumer(queue_url=self.queue_url)
+def test_consume_batch_no_messages(sqs_client):
+    """Test consume batch when no messages available."""
+    # Arrange
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+
+    # Act
+    result = consumer.consume_batch()
 
-        # Act
-        messages = consumer._receive_messages()
+    # Assert
+    assert result == {
+        'messages_received': 0,
+        'messages_processed': 0,
+        'messages_deleted': 0,
+    }
+    sqs_client.delete_message_batch.assert_not_called()
 
-        # Assert
-        self.assertEqual(len(messages), 2)
-        self.assertEqual(messages[0]['Body'], '{"test": "message1"}')
 
-    @patch('boto3.client')
-    def test_receive_messages_no_messages(self, mock_boto_client):
-        """Test receiving when no messages available."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.receive_message.return_value = {}
+def test_consume_batch_async_runs_off_event_loop(sqs_client, mocker):
+    """Test async consumption runs the blocking batch in a worker thread."""
+    # Arrange
+    consumer = e2e_telemetry.ConcurrentConsumer(queue_url=_QUEUE_URL)
+    loop_thread = threading.get_ident()
+    batch_threads = []
 
-        consumer = e2e_telemetry.ConcurrentConsumer(queue_url=self.queue_url)
+    def _fake_batch():
+        batch_threads.append(threading.get_ident())
+        return {'messages_processed': 0}
 
-        # Act
-        messages = consumer._receive_messages()
+    mocker.patch.object(consumer, 'consume_batch', side_effect=_fake_batch)
 
-        # Assert
-        self.assertEqual(len(messages), 0)
+    # Act
+    result = asyncio.run(consumer.consume_batch_async())
+
+    # Assert
+    assert result == {'messages_processed': 0}
+    assert len(batch_threads) == 1
+    assert batch_threads[0] != loop_thread
 
-    @patch('boto3.client')
-    def test_delete_message_success(self, mock_boto_client):
-        """Test successful message deletion."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
 
-        consumer = e2e_telemetry.ConcurrentConsumer(queue_url=self.queue_url)
+def test_orchestrator_initialization(orchestrator):
+    """Test E2ETelemetryOrchestrator proper initialization."""
+    # Assert
+    assert orchestrator.queue_url == _QUEUE_URL
+    assert orchestrator.aws_region == 'us-east-1'
+
+    # Check component initialization
+    assert isinstance(orchestrator.queue_monitor, e2e_telemetry.QueueMonitor)
+    assert isinstance(orchestrator.event_generator, e2e_telemetry.EventGenerator)
+    assert isinstance(orchestrator.consumer, e2e_telemetry.ConcurrentConsumer)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Provide the shared argument parser to every parser test."""
+    return e2e_telemetry.create_parser()
+
 
-        # Act
-        result = consumer._delete_message("test-receipt-handle")
+def test_parser_creation(parser):
+    """Test that parser is created successfully."""
+    # Act & Assert
+    assert isinstance(parser, argparse.ArgumentParser)
 
-        # Assert
-        self.assertTrue(result)
-        mock_sqs.delete_message.assert_called_once_with(
-            QueueUrl=self.queue_url, ReceiptHandle="test-receipt-handle"
-        )
 
-    @patch('boto3.client')
-    def test_consume_batch_no_messages(self, mock_boto_client):
-        """Test consume batch when no messages available."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.receive_message.return_value = {}
+def test_parser_reads_queue_url_env_per_call(monkeypatch):
+    """Test each new parser takes its --queue-url default from the environment."""
+    # Arrange
+    monkeypatch.setenv('SQS_QUEUE_URL', _QUEUE_URL)
 
-        consumer = e2e_telemetry.ConcurrentConsumer(queue_url=self.queue_url)
+    # Act
+    args = e2e_telemetry.create_parser().parse_args([])
 
-        # Act
-        result = consumer.consume_batch()
+    # Assert
+    assert args.queue_url == _QUEUE_URL
 
-        # Assert
-        expected = {
-            'messages_received': 0,
-            'messages_processed': 0,
-            'messages_deleted': 0,
-        }
-        self.assertEqual(result, expected)
-
-
-class TestE2ETelemetryOrchestrator(unittest.TestCase):
-    """Test E2ETelemetryOrchestrator class for main workflow orchestration."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.queue_url = 'https://sqs.us-east-1.amazonaws.com/123456789/test-queue'
-
-    @patch('boto3.client')
-    def test_orchestrator_initialization(self, mock_boto_client):
-        """Test E2ETelemetryOrchestrator proper initialization."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-
-        # Act
-        orchestrator = e2e_telemetry.E2ETelemetryOrchestrator(
-            queue_url=self.queue_url, aws_region='us-east-1'
-        )
-
-        # Assert
-        self.assertEqual(orchestrator.queue_url, self.queue_url)
-        self.assertEqual(orchestrator.aws_region, 'us-east-1')
-
-        # Check component initialization
-        self.assertIsInstance(orchestrator.queue_monitor, e2e_telemetry.QueueMonitor)
-        self.assertIsInstance(
-            orchestrator.event_generator, e2e_telemetry.EventGenerator
-        )
-        self.assertIsInstance(orchestrator.consumer, e2e_telemetry.ConcurrentConsumer)
-
-
-class TestCreateParser(unittest.TestCase):
-    """Test argument parser creation function."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = e2e_telemetry.create_parser()
-
-    def test_parser_creation(self):
-        """Test that parser is created successfully."""
-        # Act & Assert
-        self.assertIsInstance(self.parser, argparse.ArgumentParser)
-
-    def test_parser_default_arguments(self):
-        """Test parser with default arguments."""
-        # Act
-        args = self.parser.parse_args([])
-
-        # Assert
-        self.assertEqual(args.events, 100)
-        self.assertEqual(args.max_time, 60)
-        self.assertEqual(args.region, "us-east-1")
-        self.assertFalse(args.verbose)
-
-    def test_parser_custom_arguments(self):
-        """Test parser with custom arguments."""
-        # Act
-        args = self.parser.parse_args(
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        pytest.param(
+            [],
+            {"events": 100, "max_time": 60, "region": "us-east-1", "verbose": False},
+            id="defaults",
+        ),
+        pytest.param(
             [
                 '--events',
                 '200',
@@ -487,26 +923,30 @@ class TestCreateParser(unittest.TestCase):
                 '--queue-url',
                 'https://test-queue-url',
                 '--verbose',
-            ]
-        )
-
-        # Assert
-        self.assertEqual(args.events, 200)
-        self.assertEqual(args.max_time, 120)
-        self.assertEqual(args.region, "eu-west-1")
-        self.assertEqual(args.queue_url, "https://test-queue-url")
-        self.assertTrue(args.verbose)
-
-    def test_parser_invalid_arguments(self):
-        """Test parser with invalid arguments."""
-        # Act & Assert
-        with self.assertRaises(SystemExit):
-            self.parser.parse_args(['--invalid-arg'])
-
-
-if __name__ == '__main__':
-    # Configure logging for tests
-    logging.disable(logging.CRITICAL)
-
-    # Run tests
-    unittest.main(verbosity=2)
+            ],
+            {
+                "events": 200,
+                "max_time": 120,
+                "region": "eu-west-1",
+                "queue_url": "https://test-queue-url",
+                "verbose": True,
+            },
+            id="custom",
+        ),
+    ],
+)
+def test_parser_arguments(parser, argv, expected):
+    """Test parsed values for default and custom argument lists."""
+    # Act
+    args = parser.parse_args(argv)
+
+    # Assert
+    for name, value in expected.items():
+        assert getattr(args, name) == value
+
+
+def test_parser_invalid_arguments(parser):
+    """Test parser with invalid arguments."""
+    # Act & Assert
+    with pytest.raises(SystemExit):
+        parser.parse_args(['--invalid-arg'])
@@ -1,5 +1,6 @@
 """Unit tests for event generator functionality."""
 
+import random
 import unittest
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from projects.can_data_platform.src.events.generator import (
     EventGenerator,
     EventGeneratorFactory,
     EventGeneratorInterface,
+    _offset_template,
 )
 from projects.can_data_platform.src.events.models import BatteryModule, TelemetryEvent
 
@@ -77,14 +79,14 @@ class TestBatteryEventGenerator(unittest.TestCase):
         """Test that module offsets remain consistent across calls."""
         generator = BatteryEventGenerator(num_modules=3)
         
-        original_offsets = generator.module_offsets.copy()
+        original_offsets = list(generator.module_offsets)
         
         # Generate events multiple times
         generator.generate_events(5)
         generator.generate_events(3)
         
         # Offsets should remain the same
-        assert generator.module_offsets == original_offsets
+        assert list(generator.module_offsets) == original_offsets
 
     def test_generate_events_single_event(self):
         """Test generating a single event."""
@@ -94,18 +96,6 @@ class TestBatteryEventGenerator(unittest.TestCase):
         assert isinstance(events[0], TelemetryEvent)
         assert events[0].sequence_number == 0
 
-    def test_generate_events_multiple_events(self):
-        """Test generating multiple events."""
-        num_events = 5
-        events = self.generator.generate_events(num_events)
-        
-        assert len(events) == num_events
-        
-        # Check sequence numbers are correct
-        for i, event in enumerate(events):
-            assert isinstance(event, TelemetryEvent)
-            assert event.sequence_number == i
-
     def test_generate_events_zero_events(self):
         """Test generating zero events."""
         events = self.generator.generate_events(0)
@@ -113,6 +103,22 @@ class TestBatteryEventGenerator(unittest.TestCase):
         assert len(events) == 0
         assert isinstance(events, list)
 
+    def test_generate_events_iter_is_lazy(self):
+        """Test generate_events_iter yields events on demand."""
+        events = self.generator.generate_events_iter(3)
+
+        assert not isinstance(events, list)
+        assert [event.sequence_number for event in events] == [0, 1, 2]
+
+    def test_generated_events_snapshot_module_offsets(self):
+        """Test later edits to the generator's offsets leave events unchanged."""
+        event = self.generator.generate_events(1)[0]
+        before = event.to_dict()
+
+        self.generator.module_offsets[0] += 100
+
+        assert event.to_dict() == before
+
     def test_generate_events_custom_modules(self):
         """Test generating events with custom number of modules."""
         generator = BatteryEventGenerator(num_modules=6)
@@ -122,20 +128,19 @@ class TestBatteryEventGenerator(unittest.TestCase):
         for event in events:
             assert len(event.modules) == 6
 
-    @patch('random.randint')
-    def test_generate_modules_voltage_ranges(self, mock_randint):
+    def test_generate_modules_voltage_ranges(self):
         """Test that voltage generation respects configured ranges."""
-        # Mock random.randint to return predictable values
+        # Stub the generator RNG's randrange to return predictable values
         # First calls for module offsets during initialization
-        mock_randint.side_effect = [10, 20, 30, 40, 3500, 3600, 3700, 3800]
-        
-        generator = BatteryEventGenerator(
-            num_modules=4,
-            voltage_range=(3500, 4000),
-            offset_range=(0, 50),
-        )
-        
-        modules = generator._generate_modules()
+        draws = iter([10, 20, 30, 40, 3500, 3600, 3700, 3800])
+
+        with patch.object(random.Random, 'randrange', lambda *_: next(draws)):
+            generator = BatteryEventGenerator(
+                num_modules=4,
+                voltage_range=(3500, 4000),
+                offset_range=(0, 50),
+            )
+            modules = generator._generate_modules()
         
         assert len(modules) == 4
         for i, module in enumerate(modules):
@@ -165,6 +170,19 @@ class TestBatteryEventGenerator(unittest.TestCase):
             # Check offset matches pre-generated offset
             assert module.offset == self.generator.module_offsets[i]
 
+    def test_generate_batch_structure(self):
+        """Test batch generation yields one module list per event."""
+        batch = self.custom_generator._generate_batch(3)
+
+        assert len(batch) == 3
+        for modules in batch:
+            assert [module.module_id for module in modules] == list(range(6))
+            assert [module.offset for module in modules] == list(
+                self.custom_generator.module_offsets
+            )
+            for module in modules:
+                assert 3000 <= module.base_voltage <= 4000
+
     def test_voltage_range_boundaries(self):
         """Test voltage generation at range boundaries."""
         # Test with narrow range
@@ -179,6 +197,16 @@ class TestBatteryEventGenerator(unittest.TestCase):
         for module in modules:
             assert 3400 <= module.base_voltage <= 3401
 
+    def test_module_offsets_storage_width(self):
+        """Test offsets use int16 storage unless the range needs int32."""
+        narrow = BatteryEventGenerator(offset_range=(-40, 40))
+        wide = BatteryEventGenerator(offset_range=(-40000, 40000))
+
+        assert narrow.module_offsets.typecode == "h"
+        assert wide.module_offsets.typecode == "i"
+        for offset in wide.module_offsets:
+            assert -40000 <= offset <= 40000
+
     def test_offset_range_boundaries(self):
         """Test offset generation at range boundaries."""
         # Test with narrow offset range
@@ -191,22 +219,6 @@ class TestBatteryEventGenerator(unittest.TestCase):
         for offset in generator.module_offsets:
             assert -1 <= offset <= 1
 
-    def test_event_uniqueness(self):
-        """Test that generated events have unique characteristics."""
-        events = self.generator.generate_events(10)
-        
-        # Check sequence numbers are unique
-        sequence_numbers = [event.sequence_number for event in events]
-        assert len(set(sequence_numbers)) == len(sequence_numbers)
-        
-        # Check timestamps are unique (assuming they're generated close enough in time)
-        timestamps = [event.epoch_timestamp for event in events]
-        assert len(set(timestamps)) == len(timestamps)
-        
-        # Check event IDs are unique
-        event_ids = [event.event_id for event in events]
-        assert len(set(event_ids)) == len(event_ids)
-
     def test_interface_compliance(self):
         """Test that BatteryEventGenerator implements the interface correctly."""
         assert isinstance(self.generator, EventGeneratorInterface)
@@ -261,6 +273,18 @@ class TestEventGeneratorFactory(unittest.TestCase):
         assert generator1 is not generator2
         assert generator1.module_offsets != generator2.module_offsets  # Should be different due to randomness
 
+    def test_factory_shared_seed_reuses_offsets(self):
+        """Test generators with a shared seed reuse one cached offset draw."""
+        _offset_template.cache_clear()
+        self.addCleanup(_offset_template.cache_clear)
+
+        generator1 = EventGeneratorFactory.create_battery_generator(shared_seed=7)
+        generator2 = EventGeneratorFactory.create_battery_generator(shared_seed=7)
+
+        assert generator1.module_offsets == generator2.module_offsets
+        assert generator1.module_offsets is not generator2.module_offsets
+        assert _offset_template.cache_info().hits == 1
+
 
 class TestEventGeneratorAlias(unittest.TestCase):
     """Test backward compatibility alias."""
@@ -283,18 +307,6 @@ class TestEventGeneratorAlias(unittest.TestCase):
 class TestIntegrationScenarios(unittest.TestCase):
     """Test integration scenarios and edge cases."""
 
-    def test_large_number_of_events(self):
-        """Test generating a large number of events."""
-        generator = BatteryEventGenerator()
-        events = generator.generate_events(1000)
-        
-        assert len(events) == 1000
-        
-        # Check that all events are valid
-        for i, event in enumerate(events):
-            assert event.sequence_number == i
-            assert len(event.modules) == 4
-
     def test_single_module_generator(self):
         """Test generator with only one module."""
         generator = BatteryEventGenerator(num_modules=1)
@@ -323,8 +335,6 @@ class TestIntegrationScenarios(unittest.TestCase):
 
     def test_reproducibility_with_seed(self):
         """Test that generator behavior can be made reproducible."""
-        import random
-        
         # Set seed and generate events
         random.seed(42)
         generator1 = BatteryEventGenerator(num_modules=3)
@@ -344,3 +354,50 @@ class TestIntegrationScenarios(unittest.TestCase):
                 assert mod1.module_id == mod2.module_id
                 assert mod1.base_voltage == mod2.base_voltage
                 assert mod1.offset == mod2.offset
+
+    def test_reproducibility_with_generator_seed(self):
+        """Test that an explicit seed reproduces a generator's draws."""
+        generator1 = BatteryEventGenerator(num_modules=3, seed=42)
+        generator2 = BatteryEventGenerator(num_modules=3, seed=42)
+
+        assert generator1.module_offsets == generator2.module_offsets
+        modules1 = generator1._generate_batch(5)
+        modules2 = generator2._generate_batch(5)
+        assert modules1 == modules2
+
+
+def test_generate_events_multiple_events(battery_events):
+    """Test generating multiple events."""
+    events = battery_events[:5]
+
+    # Check sequence numbers are correct
+    for i, event in enumerate(events):
+        assert isinstance(event, TelemetryEvent)
+        assert event.sequence_number == i
+
+
+def test_event_uniqueness(battery_events):
+    """Test that generated events have unique characteristics."""
+    events = battery_events[:10]
+
+    # Check sequence numbers are unique
+    sequence_numbers = [event.sequence_number for event in events]
+    assert len(set(sequence_numbers)) == len(sequence_numbers)
+
+    # Check timestamps are unique (assuming they're generated close enough in time)
+    timestamps = [event.epoch_timestamp for event in events]
+    assert len(set(timestamps)) == len(timestamps)
+
+    # Check event IDs are unique
+    event_ids = [event.event_id for event in events]
+    assert len(set(event_ids)) == len(event_ids)
+
+
+def test_large_number_of_events(battery_events):
+    """Test generating a large number of events."""
+    assert len(battery_events) == 1000
+
+    # Check that all events are valid
+    for i, event in enumerate(battery_events):
+        assert event.sequence_number == i
+        assert len(event.modules) == 4
@@ -1,11 +1,15 @@
 """Comprehensive tests for events models."""
 
+import struct
 import time
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
+from projects.can_data_platform.src.events import models
 from projects.can_data_platform.src.events.models import (
     BatteryModule,
+    PackedModules,
     TelemetryEvent,
 )
 
@@ -46,6 +50,16 @@ class TestBatteryModule(unittest.TestCase):
         # Should be clamped to 0, not -100
         self.assertEqual(module.voltage, 0)
 
+    def test_voltage_follows_field_assignment(self):
+        """Test assigning base_voltage or offset refreshes the voltage."""
+        module = BatteryModule(module_id=1, base_voltage=3500, offset=10)
+
+        module.base_voltage = 3600
+        self.assertEqual(module.voltage, 3610)
+
+        module.offset = -4000
+        self.assertEqual(module.voltage, 0)
+
 
 class TestTelemetryEvent(unittest.TestCase):
     """Test cases for TelemetryEvent class."""
@@ -75,16 +89,18 @@ class TestTelemetryEvent(unittest.TestCase):
         self.assertEqual(event.generation_time, 1234567890123456789)
         self.assertEqual(len(event.modules), 4)
 
-    @patch('projects.can_data_platform.src.events.models.time.time')
-    @patch('projects.can_data_platform.src.events.models.time.time_ns')
-    @patch('projects.can_data_platform.src.events.models.uuid4')
-    def test_create_new(self, mock_uuid, mock_time_ns, mock_time):
+    def test_create_new(self):
         """Test create_new factory method."""
-        mock_uuid.return_value = "mock-uuid-123"
-        mock_time.return_value = 1234567890.5
-        mock_time_ns.return_value = 1234567890123456789
+        fixed_clock = SimpleNamespace(
+            time=lambda: 1234567890.5, time_ns=lambda: 1234567890123456789
+        )
 
-        event = TelemetryEvent.create_new(sequence_number=42, modules=self.modules)
+        with patch.multiple(
+            models, time=fixed_clock, uuid4=lambda: "mock-uuid-123"
+        ):
+            event = TelemetryEvent.create_new(
+                sequence_number=42, modules=self.modules
+            )
 
         self.assertEqual(event.event_id, "mock-uuid-123")
         self.assertEqual(event.sequence_number, 42)
@@ -211,6 +227,78 @@ class TestTelemetryEvent(unittest.TestCase):
         self.assertEqual(result["min_voltage"], 0)
         self.assertEqual(result["max_voltage"], 3500)
 
+    def test_to_bytes_round_trip(self):
+        """Test to_bytes packs the numeric fields in the documented layout."""
+        event = TelemetryEvent(
+            event_id="test-123",
+            sequence_number=7,
+            epoch_timestamp=1234567890.5,
+            generation_time=1234567890123456789,
+            modules=self.modules,
+        )
+
+        payload = event.to_bytes()
+
+        self.assertEqual(len(payload), 8 + 4 + 4 * 4)
+        self.assertEqual(
+            struct.unpack("<qI4i", payload),
+            (1234567890123456789, 7, 3500, 3550, 3525, 3575),
+        )
+
+    def test_packed_modules_match_module_list(self):
+        """Test packed modules serialize like modules and build them lazily."""
+        packed = PackedModules([3500, 3500, 3500, 3500], [0, 50, 25, 75])
+        fields = dict(
+            event_id="test-123",
+            sequence_number=1,
+            epoch_timestamp=1234567890.5,
+            generation_time=1234567890123456789,
+        )
+        packed_event = TelemetryEvent(modules=packed, **fields)
+        list_event = TelemetryEvent(modules=self.modules, **fields)
+
+        self.assertEqual(packed_event.to_dict(), list_event.to_dict())
+        self.assertEqual(packed_event.to_bytes(), list_event.to_bytes())
+        self.assertIsNone(packed._modules)
+
+        self.assertEqual(len(packed), 4)
+        self.assertEqual(packed[1].voltage, 3550)
+        self.assertEqual([module.module_id for module in packed], [0, 1, 2, 3])
+
+    def test_packed_modules_equality_and_repr(self):
+        """Test packed modules compare and print like their module list."""
+        packed = PackedModules([3500, 3500], [0, 50])
+        modules = [
+            BatteryModule(module_id=0, base_voltage=3500, offset=0),
+            BatteryModule(module_id=1, base_voltage=3500, offset=50),
+        ]
+
+        self.assertEqual(packed, modules)
+        self.assertEqual(packed, PackedModules([3500, 3500], [0, 50]))
+        self.assertNotEqual(packed, modules[:1])
+        self.assertNotEqual(packed, 3500)
+        self.assertEqual(repr(packed), repr(modules))
+
+    def test_packed_modules_serialize_edited_modules(self):
+        """Test edits to materialized packed modules reach the serializers."""
+        packed = PackedModules([3500, 3500], [0, 50])
+        event = TelemetryEvent(
+            event_id="test-123",
+            sequence_number=1,
+            epoch_timestamp=1234567890.5,
+            generation_time=1234567890123456789,
+            modules=packed,
+        )
+
+        packed[0].base_voltage = 0
+        packed[1].offset = 10
+        result = event.to_dict()
+
+        self.assertEqual(result["Cell1Voltage"], 0)
+        self.assertEqual(result["Cell2Voltage"], 3510)
+        self.assertEqual(result["module_offsets"], [0, 10])
+        self.assertEqual(struct.unpack("<qI2i", event.to_bytes())[2:], (0, 3510))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,15 @@
 """Unit tests for file writer implementations."""
 
+import errno
+import io
 import json
 import os
+import stat
 import tempfile
 import unittest
 from unittest.mock import patch
 
+from projects.can_data_platform.src.file_operations import file_writer
 from projects.can_data_platform.src.file_operations.file_writer import (
     FileWriter,
     FileWriterFactory,
@@ -34,24 +38,17 @@ class TestFileWriter(unittest.TestCase):
 class TestJSONLFileWriter(unittest.TestCase):
     """Test JSONLFileWriter implementation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one writer; it holds only configuration, never per-write state."""
+        super().setUpClass()
+        cls.writer = JSONLFileWriter()
+
     def setUp(self):
         """Set up test environment."""
-        self.writer = JSONLFileWriter()
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test environment."""
-        # Clean up any remaining temp files
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                try:
-                    os.remove(os.path.join(self.temp_dir, file))
-                except OSError:
-                    pass
-            try:
-                os.rmdir(self.temp_dir)
-            except OSError:
-                pass
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
 
     def test_write_events_success(self):
         """Test successful writing of events to JSONL file."""
@@ -151,27 +148,19 @@ class TestJSONLFileWriter(unittest.TestCase):
 
         self.assertEqual(restored_event, events[0])
 
-    @patch('builtins.open', side_effect=OSError("Permission denied"))
-    def test_write_temp_file_oserror(self, mock_open_func):
-        """Test handling of OSError during temp file writing."""
+    def test_write_temp_file_errors(self):
+        """Test OSError and IOError during temp file writing propagate."""
         events = [{"test": "data"}]
         output_path = os.path.join(self.temp_dir, "test_events.jsonl")
 
-        with self.assertRaises(OSError) as context:
-            self.writer.write(events, output_path)
-
-        self.assertIn("Permission denied", str(context.exception))
-
-    @patch('builtins.open', side_effect=IOError("Disk full"))
-    def test_write_temp_file_ioerror(self, mock_open_func):
-        """Test handling of IOError during temp file writing."""
-        events = [{"test": "data"}]
-        output_path = os.path.join(self.temp_dir, "test_events.jsonl")
-
-        with self.assertRaises(IOError) as context:
-            self.writer.write(events, output_path)
+        for exc_cls, message in [(OSError, "Permission denied"), (IOError, "Disk full")]:
+            with self.subTest(exc=exc_cls.__name__, message=message), patch(
+                'builtins.open', side_effect=exc_cls(message)
+            ):
+                with self.assertRaises(exc_cls) as context:
+                    self.writer.write(events, output_path)
 
-        self.assertIn("Disk full", str(context.exception))
+                self.assertIn(message, str(context.exception))
 
     def test_write_to_temp_file(self):
         """Test writing to temporary file."""
@@ -191,6 +180,112 @@ class TestJSONLFileWriter(unittest.TestCase):
         self.assertEqual(json.loads(lines[0].strip()), {"temp": "data1"})
         self.assertEqual(json.loads(lines[1].strip()), {"temp": "data2"})
 
+    def test_write_streams_generator_in_chunks(self):
+        """Test a generator is consumed and flushed each time the spool fills."""
+        writer = JSONLFileWriter(spool_size=16)
+        buffer = io.BytesIO()
+        events = ({"seq": i} for i in range(5))
+
+        with patch.object(buffer, 'write', wraps=buffer.write) as mock_write:
+            count = writer._write_lines(buffer, events)
+
+        # 10-byte lines against a 16-byte spool: two flushes plus the tail
+        self.assertEqual(count, 5)
+        self.assertEqual(mock_write.call_count, 3)
+        self.assertEqual(
+            [json.loads(line) for line in buffer.getvalue().splitlines()],
+            [{"seq": i} for i in range(5)],
+        )
+
+    @unittest.skipUnless(file_writer._O_TMPFILE, "requires Linux O_TMPFILE")
+    def test_write_links_unnamed_temp_file(self):
+        """Test the O_TMPFILE path replaces a stale temp file and renames it."""
+        output_path = os.path.join(self.temp_dir, "unnamed.jsonl")
+        for path in (output_path, f"{output_path}.tmp"):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("stale")
+
+        with patch.object(self.writer, '_write_to_temp_file') as mock_named:
+            self.writer.write([{"test": "data"}], output_path)
+
+        mock_named.assert_not_called()
+        self.assertFalse(os.path.exists(f"{output_path}.tmp"))
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"test":"data"}\n')
+
+    @unittest.skipUnless(file_writer._O_TMPFILE, "requires Linux O_TMPFILE")
+    def test_write_links_new_output_without_rename(self):
+        """Test a new output is linked straight in, with no temp name or rename."""
+        output_path = os.path.join(self.temp_dir, "linked.jsonl")
+
+        with patch('os.replace') as mock_replace:
+            self.writer.write([{"test": "data"}], output_path)
+
+        mock_replace.assert_not_called()
+        self.assertEqual(os.listdir(self.temp_dir), ["linked.jsonl"])
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"test":"data"}\n')
+
+    def _assert_replaced_through_temp_file(self, output_path, mock_replace):
+        """Assert output_path was swapped in by one rename of its temp file."""
+        mock_replace.assert_called_once_with(f"{output_path}.tmp", output_path)
+        self.assertEqual(os.listdir(self.temp_dir), [os.path.basename(output_path)])
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"test":"data"}\n')
+
+    def test_write_falls_back_to_named_temp_file(self):
+        """Test writes use a named temp file where O_TMPFILE is unavailable."""
+        output_path = os.path.join(self.temp_dir, "named.jsonl")
+
+        with patch.object(file_writer, '_O_TMPFILE', 0), patch.object(
+            self.writer, '_write_to_temp_file', wraps=self.writer._write_to_temp_file
+        ) as mock_named, patch('os.replace', wraps=os.replace) as mock_replace:
+            self.writer.write([{"test": "data"}], output_path)
+
+        mock_named.assert_called_once()
+        self._assert_replaced_through_temp_file(output_path, mock_replace)
+
+    @unittest.skipUnless(file_writer._O_TMPFILE, "requires Linux O_TMPFILE")
+    def test_write_falls_back_when_filesystem_rejects_o_tmpfile(self):
+        """Test a filesystem without O_TMPFILE support gets a named temp file."""
+        output_path = os.path.join(self.temp_dir, "no_tmpfile.jsonl")
+        real_open = os.open
+
+        def os_open(path, flags, *args, **kwargs):
+            if flags & file_writer._O_TMPFILE == file_writer._O_TMPFILE:
+                raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+            return real_open(path, flags, *args, **kwargs)
+
+        with patch('os.open', side_effect=os_open), patch.object(
+            self.writer, '_write_to_temp_file', wraps=self.writer._write_to_temp_file
+        ) as mock_named, patch('os.replace', wraps=os.replace) as mock_replace:
+            self.writer.write([{"test": "data"}], output_path)
+
+        mock_named.assert_called_once()
+        self._assert_replaced_through_temp_file(output_path, mock_replace)
+
+    @unittest.skipUnless(file_writer._O_TMPFILE, "requires Linux O_TMPFILE")
+    def test_write_copies_unnamed_file_when_link_is_denied(self):
+        """Test a refused linkat() still replaces the output atomically."""
+        writer = JSONLFileWriter(durable=True)
+        output_path = os.path.join(self.temp_dir, "denied.jsonl")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("old")
+        events = ({"test": "data"} for _ in range(1))
+
+        with patch(
+            'os.link', side_effect=PermissionError(errno.EPERM, "Not permitted")
+        ), patch.object(writer, '_write_to_temp_file') as mock_named, patch(
+            'os.replace', wraps=os.replace
+        ) as mock_replace, patch('os.fsync') as mock_fsync:
+            writer.write(events, output_path)
+
+        # The generator is consumed once; its bytes are copied, not re-encoded
+        mock_named.assert_not_called()
+        self._assert_replaced_through_temp_file(output_path, mock_replace)
+        # Unnamed file, its named copy, then the directory after the rename
+        self.assertEqual(mock_fsync.call_count, 3)
+
     def test_atomic_move_new_file(self):
         """Test atomic move when target file doesn't exist."""
         temp_path = os.path.join(self.temp_dir, "temp.tmp")
@@ -301,9 +396,12 @@ class TestJSONLFileWriter(unittest.TestCase):
         events = [{"test": "data"}]
         output_path = os.path.join(self.temp_dir, "test_events.jsonl")
         temp_path = f"{output_path}.tmp"
+        # An existing output forces the temp file + rename path
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("old")
 
-        # Mock os.rename to fail after temp file is created
-        with patch('os.rename', side_effect=OSError("Rename failed")):
+        # Mock os.replace to fail after temp file is created
+        with patch('os.replace', side_effect=OSError("Rename failed")):
             with patch.object(self.writer, '_cleanup_temp_file') as mock_cleanup:
                 with self.assertRaises(OSError):
                     self.writer.write(events, output_path)
@@ -311,6 +409,66 @@ class TestJSONLFileWriter(unittest.TestCase):
                 # Verify cleanup was called
                 mock_cleanup.assert_called_once_with(temp_path)
 
+    def test_write_many_writes_every_shard(self):
+        """Test write_many writes each shard to its own file."""
+        shards = {
+            os.path.join(self.temp_dir, f"shard_{i}.jsonl"): [{"shard": i}] * (i + 1)
+            for i in range(3)
+        }
+
+        self.writer.write_many(shards, max_workers=2)
+
+        for output_path, events in shards.items():
+            with open(output_path, "r", encoding="utf-8") as f:
+                self.assertEqual([json.loads(line) for line in f], events)
+
+    def _fsynced_kinds(self, writer, output_path):
+        """Write one event and return "file"/"dir" for each fsync'd descriptor."""
+        kinds = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            is_dir = stat.S_ISDIR(os.fstat(fd).st_mode)
+            kinds.append("dir" if is_dir else "file")
+            real_fsync(fd)
+
+        with patch('os.fsync', side_effect=fsync):
+            writer.write([{"test": "data"}], output_path)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"test":"data"}\n')
+        return kinds
+
+    def test_durable_overwrite_syncs_file_and_directory(self):
+        """Test replacing an output fsyncs only when durable is set."""
+        output_path = os.path.join(self.temp_dir, "durable.jsonl")
+
+        for o_tmpfile in sorted({file_writer._O_TMPFILE, 0}):
+            for durable, expected in ((True, ["file", "dir"]), (False, [])):
+                with self.subTest(o_tmpfile=o_tmpfile, durable=durable), patch.object(
+                    file_writer, '_O_TMPFILE', o_tmpfile
+                ):
+                    with open(output_path, "w", encoding="utf-8") as f:
+                        f.write("old")
+
+                    kinds = self._fsynced_kinds(
+                        JSONLFileWriter(durable=durable), output_path
+                    )
+
+                    self.assertEqual(kinds, expected)
+
+    def test_durable_write_syncs_file_and_directory(self):
+        """Test durable mode fsyncs the temp file and the target directory."""
+        writer = JSONLFileWriter(durable=True)
+        output_path = os.path.join(self.temp_dir, "durable.jsonl")
+
+        with patch('os.fsync', wraps=os.fsync) as mock_fsync:
+            writer.write([{"test": "data"}], output_path)
+
+        self.assertEqual(mock_fsync.call_count, 2)
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), '{"test":"data"}\n')
+
 
 class TestFileWriterFactory(unittest.TestCase):
     """Test FileWriterFactory implementation."""
@@ -9,6 +9,7 @@ import json
 import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
@@ -341,91 +342,72 @@ class TestDeployIssues:
                     issue_deployer.deploy_issues(sample_issues, 5)
 
 
+@pytest.fixture
+def main_patches(monkeypatch):
+    """Stub main()'s collaborators once per test and expose the mocks.
+
+    monkeypatch sets plain attributes on the already-imported module, so each
+    test pays for one fixture instead of a stack of nested patch() contexts.
+    Tests adjust sys.argv and the mocks' return values as needed.
+    """
+    monkeypatch.setenv("GITHUB_TOKEN", "test_token_123")
+    monkeypatch.setenv("GITHUB_REPO", "test-owner/test-repo")
+    monkeypatch.setattr(sys, "argv", ["script.py", "test.json"])
+
+    mocks = SimpleNamespace(
+        fetch_milestones=Mock(return_value=[]),
+        display_milestones=Mock(),
+        load_issues_from_json=Mock(return_value=("Test", [])),
+        get_milestone_assignment=Mock(return_value=5),
+        confirm_deployment=Mock(return_value=True),
+        deploy_issues=Mock(),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(issue_deployer, name, mock)
+
+    mocks.print = Mock()
+    monkeypatch.setattr("builtins.print", mocks.print)
+    return mocks
+
+
 class TestMainFunction:
     """Test class for main function orchestration."""
 
-    @pytest.fixture
-    def mock_env_vars(self):
-        """Mock environment variables for testing."""
-        with patch.dict(
-            os.environ,
-            {
-                "GITHUB_TOKEN": "test_token_123",
-                "GITHUB_REPO": "test-owner/test-repo",
-            },
-        ):
-            yield
-
-    def test_main_missing_arguments(self):
+    def test_main_missing_arguments(self, main_patches):
         """Test main function with missing arguments."""
-        with patch.object(sys, "argv", ["script.py"]):
-            with patch("builtins.print") as mock_print:
-                with patch.object(issue_deployer, "fetch_milestones") as mock_fetch:
-                    # Set up the mock to return some milestones
-                    mock_fetch.return_value = [
-                        {
-                            "number": 1,
-                            "title": "Test Milestone",
-                            "open_issues": 0,
-                        }
-                    ]
+        sys.argv[1:] = []
+        main_patches.fetch_milestones.return_value = [
+            {
+                "number": 1,
+                "title": "Test Milestone",
+                "open_issues": 0,
+            }
+        ]
 
-                    with pytest.raises(SystemExit) as exc_info:
-                        issue_deployer.main()
+        with pytest.raises(SystemExit) as exc_info:
+            issue_deployer.main()
 
-                    assert exc_info.value.code == 1
-                    mock_print.assert_called_with(
-                        "Usage: python issue_deployer.py path/to/issues.json"
-                    )
+        assert exc_info.value.code == 1
+        main_patches.print.assert_called_with(
+            "Usage: python issue_deployer.py path/to/issues.json"
+        )
 
-    def test_main_user_abort(self):
+    def test_main_user_abort(self, main_patches):
         """Test main function when user aborts deployment."""
-        with patch.dict(
-            os.environ,
-            {
-                "GITHUB_TOKEN": "test_token_123",
-                "GITHUB_REPO": "test-owner/test-repo",
-            },
-        ):
-            with patch.object(sys, "argv", ["script.py", "test.json"]):
-                with patch("issue_deployer.fetch_milestones", return_value=[]):
-                    with patch("issue_deployer.display_milestones"):
-                        load_patch = "issue_deployer.load_issues_from_json"
-                        with patch(load_patch, return_value=("Test", [])):
-                            with patch("builtins.print"):
-                                get_patch = "issue_deployer" ".get_milestone_assignment"
-                                confirm_patch = "issue_deployer" ".confirm_deployment"
-                                with patch(get_patch, return_value=5):
-                                    with patch(confirm_patch, return_value=False):
-                                        with pytest.raises(SystemExit) as exc:
-                                            issue_deployer.main()
-
-                                        exc_val = "Aborted by user."
-                                        assert str(exc.value) == exc_val
-
-    def test_main_successful_deployment(self):
+        main_patches.confirm_deployment.return_value = False
+
+        with pytest.raises(SystemExit) as exc:
+            issue_deployer.main()
+
+        assert str(exc.value) == "Aborted by user."
+        main_patches.deploy_issues.assert_not_called()
+
+    def test_main_successful_deployment(self, main_patches):
         """Test successful main function execution."""
-        with patch.dict(
-            os.environ,
-            {
-                "GITHUB_TOKEN": "test_token_123",
-                "GITHUB_REPO": "test-owner/test-repo",
-            },
-        ):
-            with patch.object(sys, "argv", ["script.py", "test.json"]):
-                with patch("issue_deployer.fetch_milestones", return_value=[]):
-                    with patch("issue_deployer.display_milestones"):
-                        load_patch = "issue_deployer.load_issues_from_json"
-                        with patch(load_patch, return_value=("Test", [])):
-                            with patch("builtins.print"):
-                                get_patch = "issue_deployer" ".get_milestone_assignment"
-                                confirm_patch = "issue_deployer" ".confirm_deployment"
-                                deploy_patch = "issue_deployer" ".deploy_issues"
-                                with patch(get_patch, return_value=5):
-                                    with patch(confirm_patch, return_value=True):
-                                        with patch(deploy_patch):
-                                            # Should not raise exception
-                                            issue_deployer.main()
+        # Should not raise exception
+        issue_deployer.main()
+
+        main_patches.deploy_issues.assert_called_once_with([], 5)
 
 
 class TestConfigurationAndSetup:
@@ -13,6 +13,8 @@ import os
 import unittest
 from unittest.mock import Mock, patch, call
 
+import pytest
+
 # Import the module under test
 import projects.can_data_platform.scripts.sqs_usage_report as sqs_usage_report
 
@@ -30,42 +32,6 @@ class TestSQSUsageReport(unittest.TestCase):
             'LastModifiedTimestamp': '1640995300',
         }
 
-    @patch('boto3.client')
-    @patch('builtins.print')
-    def test_sqs_usage_report_success(self, mock_print, mock_boto_client):
-        """Test successful SQS usage report generation."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        mock_sqs.get_queue_attributes.return_value = {
-            'Attributes': self.sample_attributes
-        }
-
-        # Act
-        sqs_usage_report.sqs_usage_report(self.queue_url)
-
-        # Assert
-        mock_boto_client.assert_called_once_with("sqs", region_name="us-east-1")
-        mock_sqs.get_queue_attributes.assert_called_once_with(
-            QueueUrl=self.queue_url,
-            AttributeNames=[
-                'ApproximateNumberOfMessages',
-                'ApproximateNumberOfMessagesNotVisible',
-                'CreatedTimestamp',
-                'LastModifiedTimestamp',
-            ],
-        )
-
-        # Verify print statements
-        expected_calls = [
-            call(f"SQS Usage Report for {self.queue_url}"),
-            call("Approximate messages in queue: 25"),
-            call("Messages in flight (not visible): 5"),
-            call("Queue Created: 1640995200"),
-            call("Last Modified: 1640995300"),
-        ]
-        mock_print.assert_has_calls(expected_calls)
-
     @patch('os.getenv')
     @patch('boto3.client')
     def test_sqs_usage_report_custom_region(self, mock_boto_client, mock_getenv):
@@ -98,63 +64,51 @@ class TestSQSUsageReport(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "Access denied")
 
-    @patch('boto3.client')
-    @patch('builtins.print')
-    def test_sqs_usage_report_zero_messages(self, mock_print, mock_boto_client):
-        """Test SQS usage report with zero messages in queue."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        zero_attributes = {
-            'ApproximateNumberOfMessages': '0',
-            'ApproximateNumberOfMessagesNotVisible': '0',
-            'CreatedTimestamp': '1640995200',
-            'LastModifiedTimestamp': '1640995300',
-        }
-        mock_sqs.get_queue_attributes.return_value = {'Attributes': zero_attributes}
-
-        # Act
-        sqs_usage_report.sqs_usage_report(self.queue_url)
-
-        # Assert
-        expected_calls = [
-            call(f"SQS Usage Report for {self.queue_url}"),
-            call("Approximate messages in queue: 0"),
-            call("Messages in flight (not visible): 0"),
-            call("Queue Created: 1640995200"),
-            call("Last Modified: 1640995300"),
-        ]
-        mock_print.assert_has_calls(expected_calls)
 
-    @patch('boto3.client')
-    @patch('builtins.print')
-    def test_sqs_usage_report_high_message_count(self, mock_print, mock_boto_client):
-        """Test SQS usage report with high message counts."""
-        # Arrange
-        mock_sqs = Mock()
-        mock_boto_client.return_value = mock_sqs
-        high_count_attributes = {
-            'ApproximateNumberOfMessages': '50000',
-            'ApproximateNumberOfMessagesNotVisible': '10000',
+@pytest.mark.parametrize(
+    "visible, in_flight",
+    [("25", "5"), ("0", "0"), ("50000", "10000")],
+    ids=["success", "zero_messages", "high_message_count"],
+)
+def test_sqs_usage_report_prints_counts(mocker, visible, in_flight):
+    """Test the report fetches the queue attributes and prints each count."""
+    # Arrange
+    queue_url = "https://sqs.us-east-1.amazonaws.com/123456789/test-queue"
+    mock_boto_client = mocker.patch('boto3.client')
+    mock_print = mocker.patch('builtins.print')
+    mock_sqs = mock_boto_client.return_value
+    mock_sqs.get_queue_attributes.return_value = {
+        'Attributes': {
+            'ApproximateNumberOfMessages': visible,
+            'ApproximateNumberOfMessagesNotVisible': in_flight,
             'CreatedTimestamp': '1640995200',
             'LastModifiedTimestamp': '1640995300',
         }
-        mock_sqs.get_queue_attributes.return_value = {
-            'Attributes': high_count_attributes
-        }
-
-        # Act
-        sqs_usage_report.sqs_usage_report(self.queue_url)
-
-        # Assert
-        expected_calls = [
-            call(f"SQS Usage Report for {self.queue_url}"),
-            call("Approximate messages in queue: 50000"),
-            call("Messages in flight (not visible): 10000"),
+    }
+
+    # Act
+    sqs_usage_report.sqs_usage_report(queue_url)
+
+    # Assert
+    mock_boto_client.assert_called_once_with("sqs", region_name="us-east-1")
+    mock_sqs.get_queue_attributes.assert_called_once_with(
+        QueueUrl=queue_url,
+        AttributeNames=[
+            'ApproximateNumberOfMessages',
+            'ApproximateNumberOfMessagesNotVisible',
+            'CreatedTimestamp',
+            'LastModifiedTimestamp',
+        ],
+    )
+    mock_print.assert_has_calls(
+        [
+            call(f"SQS Usage Report for {queue_url}"),
+            call(f"Approximate messages in queue: {visible}"),
+            call(f"Messages in flight (not visible): {in_flight}"),
             call("Queue Created: 1640995200"),
             call("Last Modified: 1640995300"),
         ]
-        mock_print.assert_has_calls(expected_calls)
+    )
 
 
 class TestSetupProjectPath(unittest.TestCase):